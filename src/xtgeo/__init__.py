@@ -93,6 +93,10 @@ from xtgeo.common.exceptions import BlockedWellsNotFoundError
 
 from xtgeo.common.xtgeo_dialog import XTGeoDialog
 from xtgeo.common.sys import _XTGeoCFile
+from xtgeo.common.sys import set_nthreads
+from xtgeo.common.sys import get_nthreads
+from xtgeo.common.sys import set_eclindex_cache
+from xtgeo.common.sys import get_eclindex_cache
 
 _xprint("Import common... done")
 
@@ -1,4 +1,4 @@
-%module cxtgeo
+%module(threads="1") cxtgeo
 %{
 #define SWIG_FILE_WITH_INIT
 #include <libxtg.h>
@@ -6,6 +6,9 @@
 
 typedef uint8_t mbool;
 
+/* Keep the GIL by default; it is released only for selected batch routines below */
+%nothread;
+
 %include typemaps.i
 %include cpointer.i
 %include carrays.i
@@ -88,6 +91,9 @@ import_array();
 // IN int32 no 2
 %apply (int* IN_ARRAY1, long DIM1) {(int *swig_np_int_in_v2,
                                      long n_swig_np_int_in_v2)};
+// IN int32 no 3
+%apply (int* IN_ARRAY1, long DIM1) {(int *swig_np_int_in_v3,
+                                     long n_swig_np_int_in_v3)};
 // IN float32 no 1
 %apply (float* IN_ARRAY1, long DIM1) {(float *swig_np_flt_in_v1,
                                        long n_swig_np_flt_in_v1)};
@@ -275,4 +281,18 @@ import_array();
     }
     %}
 
+//======================================================================================
+// Batch point routines which may run (OpenMP) parallel; release the Python GIL
+//======================================================================================
+%thread grd3d_points_ijk_cells;
+%thread grd3d_wells_ijk;
+%thread grd3d_sum_volumes;
+%thread grd3d_cell_geometry;
+%thread well_surfs_picks;
+%thread surf_get_zv_from_xyv;
+%thread pol_do_points_inside;
+
+// File parsers which are run in Python threads (e.g. Wells.from_files(workers=N))
+%thread well_import_rms_ascii;
+
 %include <libxtg.h>
@@ -0,0 +1,155 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    grd3d_cell_geometry.c
+ *
+ * DESCRIPTION:
+ *    Compute cell centers, dX, dY, dZ, bulk volume and (optionally) the corners for
+ *    all cells in a layer range, in one pass where the corners of each cell are
+ *    computed once. This is an alternative to call grd3d_calc_xyz, grd3d_calc_dz,
+ *    grd3d_calc_dxdy and grd3d_get_all_corners in sequence.
+ *
+ *    The result array has shape (NG, NX, NY, NK) in C order, where NK = K2 - K1 + 1
+ *    and NG is 7 (or 31 with corners), i.e. each quantity is a C order 3D array:
+ *
+ *       0: X center, 1: Y center, 2: Z center, 3: dX, 4: dY, 5: dZ, 6: bulk volume
+ *       7..30: corners X1, Y1, Z1, ... X8, Y8, Z8 as in grd3d_corners
+ *
+ *    The bulk volume is the exact volume of the cell, cf. x_hexahedron_volume.
+ *    dX and dY are average lengths (in XY) of the 4 cell edges in I and J direction,
+ *    and dZ is the difference of the average base and top depths (as in
+ *    grd3d_calc_dz with flip 1).
+ *
+ * ARGUMENTS:
+ *    nx, ny, nz     i     Grid dimensions
+ *    coordsv        i     Grid Z coord for input
+ *    zcornsv        i     Grid Z corners for input
+ *    actnumsv       i     Grid ACTNUM parameter input
+ *    k1, k2         i     Layer range, 1 based and inclusive
+ *    geomv         i/o    Result array, NG * NX * NY * NK values
+ *    option         i     Sum of: 1: set UNDEF (and skip) inactive cells,
+ *                         2: include corners
+ *
+ * RETURNS:
+ *    Function: 0: upon success. If problems:
+ *              -1: Wrong layer range or length of result array
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+#include <math.h>
+
+#define NGEOM 7
+
+static double
+_xylen(double x1, double x2, double y1, double y2)
+{
+    /* as x_vector_info2, but in double precision */
+    if (x1 == x2 && y1 == y2)
+        return 0.000001;
+
+    return sqrt((x2 - x1) * (x2 - x1) + (y2 - y1) * (y2 - y1));
+}
+
+int
+grd3d_cell_geometry(int nx,
+                    int ny,
+                    int nz,
+                    double *coordsv,
+                    long ncoord,
+                    double *zcornsv,
+                    long nzcorn,
+                    int *actnumsv,
+                    long nact,
+                    int k1,
+                    int k2,
+                    double *geomv,
+                    long ngeom,
+                    int option)
+
+{
+    logger_info(LI, FI, FU, "Compute cell geometry...");
+
+    if (k1 < 1 || k2 > nz || k1 > k2) {
+        logger_error(LI, FI, FU, "Invalid layer range %d - %d", k1, k2);
+        return -1;
+    }
+
+    int nk = k2 - k1 + 1;
+    int ng = (option & 2) ? NGEOM + 24 : NGEOM;
+    long nsel = (long)nx * ny * nk;
+
+    if (ngeom != ng * nsel || nact != (long)nx * ny * nz) {
+        logger_error(LI, FI, FU, "Wrong length of arrays in %s", FU);
+        return -1;
+    }
+
+    /* cells are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+    int i;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads) if (nthreads > 1)
+#endif
+    for (i = 1; i <= nx; i++) {
+        int j, k, n, m;
+        double c[24];
+
+        for (j = 1; j <= ny; j++) {
+            for (k = k1; k <= k2; k++) {
+
+                long ib = x_ijk2ib(i, j, k, nx, ny, nz, 0);
+                long ic = ((long)(i - 1) * ny + (j - 1)) * nk + (k - k1);
+
+                if ((option & 1) && actnumsv[ib] == 0) {
+                    for (m = 0; m < ng; m++)
+                        geomv[m * nsel + ic] = UNDEF;
+                    continue;
+                }
+
+                grd3d_corners(i, j, k, nx, ny, nz, coordsv, ncoord, zcornsv, nzcorn, c);
+
+                double xc = 0.0, yc = 0.0, ztop = 0.0, zbot = 0.0;
+                for (n = 0; n < 4; n++) {
+                    xc += c[3 * n] + c[3 * n + 12];
+                    yc += c[3 * n + 1] + c[3 * n + 13];
+                    ztop += c[3 * n + 2];
+                    zbot += c[3 * n + 14];
+                }
+
+                /* edges in I direction are corners 1-2, 3-4, 5-6, 7-8, J is 1-3 etc */
+                double dx = 0.0, dy = 0.0;
+                for (n = 0; n < 4; n++) {
+                    int ii = 6 * n;
+                    dx += _xylen(c[ii], c[ii + 3], c[ii + 1], c[ii + 4]);
+                    ii = (n < 2) ? 3 * n : 6 + 3 * n;
+                    dy += _xylen(c[ii], c[ii + 6], c[ii + 1], c[ii + 7]);
+                }
+
+                geomv[ic] = 0.125 * xc;
+                geomv[nsel + ic] = 0.125 * yc;
+                geomv[2 * nsel + ic] = 0.125 * (ztop + zbot);
+                geomv[3 * nsel + ic] = 0.25 * dx;
+                geomv[4 * nsel + ic] = 0.25 * dy;
+                geomv[5 * nsel + ic] = 0.25 * (zbot - ztop);
+                geomv[6 * nsel + ic] = x_hexahedron_volume(c);
+
+                if (option & 2) {
+                    for (m = 0; m < 24; m++)
+                        geomv[(NGEOM + m) * nsel + ic] = c[m];
+                }
+            }
+        }
+    }
+
+    logger_info(LI, FI, FU, "Compute cell geometry... done");
+    return EXIT_SUCCESS;
+}
@@ -26,12 +26,20 @@
  *    p_acnumone_v        i     Grid ACTNUM for onelayer grid
  *    actnumoption        i     if 1, then only report if cell is active
  *    flip                i     1, or -1 if right handed with K down
+ *    ksearch             i     K search method within the found column; 0 is a
+ *                              linear scan of all layers, 1 is bisection on the
+ *                              column's layer depths (falls back to linear scan if
+ *                              the column is not monotone)
  *    ivec, jvec, kvec    o     IJK arrays
  *    n*vec               i     array lengths (for swig/numpies)
  *
  * RETURNS:
  *    Update IJK pointers, array length, -1 if fail
  *
+ * NOTES:
+ *    The point loop is run in parallel if XTGeo is compiled with OpenMP and the
+ *    number of threads is set > 1, see x_nthreads.c
+ *
  * TODO/ISSUES/BUGS:
  *
  * LICENCE:
@@ -232,7 +240,7 @@ _point_val_ij(double xc,
               _grd3d_point_in_cell(ii, jj, 1, xc, yc, zc, nx, ny, 1, p_coor_v,
                                    p_zcornone_v, &score, flip, dbg);
 
-            if (score > 12) {
+            if (score > 12 && nnn < 24) {
                 ib_alternatives[nnn++] = ibfound;
             }
         }
@@ -282,7 +290,175 @@ _point_val_ijk(double xc,
         long ibfound = _grd3d_point_in_cell(iin, jin, k, xc, yc, zc, nx, ny, nz,
                                             p_coor_v, zcornsv, &score, flip, dbg);
 
-        if (score > 12) {
+        if (score > 12 && nnn < 24) {
+            ib_alternatives[nnn++] = ibfound;
+        }
+    }
+
+    if (nnn > 0) {
+        return ib_alternatives[nnn / 2];
+    }
+
+    return -1;
+}
+
+static void
+_column_zrange(int iin,
+               int jin,
+               int k,
+               int nx,
+               int ny,
+               int nz,
+               double *zcornsv,
+               int zdir,
+               double *zlo,
+               double *zhi)
+{
+    /*
+     * Min and max of the 4 corner depths of layer interface k (1..nz+1) in column
+     * iin, jin, where depths are multiplied with zdir so they increase with k
+     */
+
+    long ib = x_ijk2ib(iin, jin, k, nx, ny, nz + 1, 0);
+
+    int ic;
+    *zlo = zdir * zcornsv[4 * ib];
+    *zhi = *zlo;
+    for (ic = 1; ic < 4; ic++) {
+        double zval = zdir * zcornsv[4 * ib + ic];
+        if (zval < *zlo)
+            *zlo = zval;
+        if (zval > *zhi)
+            *zhi = zval;
+    }
+}
+
+static int
+_column_is_monotone(int iin, int jin, int nx, int ny, int nz, double *zcornsv, int zdir)
+{
+    /*
+     * Check that every corner line in the column is monotone (non-decreasing along
+     * K when multiplied with zdir); collapsed layers are allowed
+     */
+
+    long ib1 = x_ijk2ib(iin, jin, 1, nx, ny, nz + 1, 0);
+
+    int ic;
+    for (ic = 0; ic < 4; ic++) {
+        double zprev = zdir * zcornsv[4 * ib1 + ic];
+        int k;
+        for (k = 2; k <= nz + 1; k++) {
+            long ib = x_ijk2ib(iin, jin, k, nx, ny, nz + 1, 0);
+            double zval = zdir * zcornsv[4 * ib + ic];
+            if (zval < zprev)
+                return 0;
+            zprev = zval;
+        }
+    }
+    return 1;
+}
+
+long
+_point_val_ijk_bisect(double xc,
+                      double yc,
+                      double zc,
+                      int nx,
+                      int ny,
+                      int nz,
+                      double *p_coor_v,
+                      double *zcornsv,
+                      int iin,
+                      int jin,
+                      int flip,
+                      int *colcache,
+                      int dbg)
+{
+    /*
+     * As _point_val_ijk, but the K range is found by bisection on the layer depths in
+     * the column, and only cells in that range are tested with the hexahedron check.
+     *
+     * For a cell, x_chk_point_in_hexahedron rejects points outside the z envelope of
+     * the 8 corners. When each corner line in the column is monotone, the cells whose
+     * envelope holds zc is a contiguous range KA..KB which is found by two bisections,
+     * so the result is identical to the full linear scan.
+     *
+     * colcache         Array of 4: last column I, J, its monotone flag and zdir;
+     *                  points along e.g. a well often hit the same column in sequence
+     *
+     * Returns -2 if the column is not monotone (caller shall then do a linear scan)
+     */
+
+    int zdir, mono;
+
+    if (colcache[0] == iin && colcache[1] == jin) {
+        mono = colcache[2];
+        zdir = colcache[3];
+    } else {
+        double ztop, zbot, zdum;
+        _column_zrange(iin, jin, 1, nx, ny, nz, zcornsv, 1, &ztop, &zdum);
+        _column_zrange(iin, jin, nz + 1, nx, ny, nz, zcornsv, 1, &zbot, &zdum);
+        zdir = (zbot >= ztop) ? 1 : -1;
+        mono = _column_is_monotone(iin, jin, nx, ny, nz, zcornsv, zdir);
+        colcache[0] = iin;
+        colcache[1] = jin;
+        colcache[2] = mono;
+        colcache[3] = zdir;
+    }
+
+    if (!mono)
+        return -2;
+
+    double zcd = zdir * zc;
+    double zlo, zhi;
+
+    /* KB: the last layer where the top interface (minimum) is above or at zc */
+    _column_zrange(iin, jin, 1, nx, ny, nz, zcornsv, zdir, &zlo, &zhi);
+    if (zlo > zcd)
+        return -1;
+
+    int klo = 1, khi = nz;
+    while (klo < khi) {
+        int kmid = (klo + khi + 1) / 2;
+        _column_zrange(iin, jin, kmid, nx, ny, nz, zcornsv, zdir, &zlo, &zhi);
+        if (zlo <= zcd) {
+            klo = kmid;
+        } else {
+            khi = kmid - 1;
+        }
+    }
+    int kb = klo;
+
+    /* KA: the first layer where the base interface (maximum) is below or at zc */
+    _column_zrange(iin, jin, nz + 1, nx, ny, nz, zcornsv, zdir, &zlo, &zhi);
+    if (zhi < zcd)
+        return -1;
+
+    klo = 1;
+    khi = nz;
+    while (klo < khi) {
+        int kmid = (klo + khi) / 2;
+        _column_zrange(iin, jin, kmid + 1, nx, ny, nz, zcornsv, zdir, &zlo, &zhi);
+        if (zhi >= zcd) {
+            khi = kmid;
+        } else {
+            klo = kmid + 1;
+        }
+    }
+    int ka = klo;
+
+    if (dbg)
+        logger_info(LI, FI, FU, "K search range is %d - %d", ka, kb);
+
+    /* local refinement with the hexahedron check */
+    long ib_alternatives[24];
+    int score;
+    int nnn = 0;
+    int k;
+    for (k = ka; k <= kb; k++) {
+        long ibfound = _grd3d_point_in_cell(iin, jin, k, xc, yc, zc, nx, ny, nz,
+                                            p_coor_v, zcornsv, &score, flip, dbg);
+
+        if (score > 12 && nnn < 24) {
             ib_alternatives[nnn++] = ibfound;
         }
     }
@@ -337,6 +513,7 @@ grd3d_points_ijk_cells(double *xvec,
 
                        int actnumoption,
                        int flip,
+                       int ksearch,
 
                        int *ivec,
                        long nivec,
@@ -355,7 +532,16 @@ grd3d_points_ijk_cells(double *xvec,
 
     long ib = 0;
 
-    int ic;
+    int colcache[4] = { -1, -1, 0, 1 };
+
+    /* points are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+    long ic;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads)                       \
+  firstprivate(colcache) if (nthreads > 1 && nxvec > 100)
+#endif
     for (ic = 0; ic < nxvec; ic++) {
         double xc = xvec[ic];
         double yc = yvec[ic];
@@ -396,8 +582,16 @@ grd3d_points_ijk_cells(double *xvec,
             int ires, jres, kres;
             x_ib2ijk(ibfound, &ires, &jres, &kres, nx, ny, 1, 0);
 
-            long ibfound2 = _point_val_ijk(xc, yc, zc, nx, ny, nz, p_coor_v, zcornsv,
-                                           ires, jres, flip, dbg);
+            long ibfound2 = -2;
+            if (ksearch == 1) {
+                ibfound2 = _point_val_ijk_bisect(xc, yc, zc, nx, ny, nz, p_coor_v,
+                                                 zcornsv, ires, jres, flip, colcache,
+                                                 dbg);
+            }
+            if (ibfound2 == -2) {
+                ibfound2 = _point_val_ijk(xc, yc, zc, nx, ny, nz, p_coor_v, zcornsv,
+                                          ires, jres, flip, dbg);
+            }
             if (ibfound2 >= 0) {
                 x_ib2ijk(ibfound2, &ires, &jres, &kres, nx, ny, nz, 0);
                 ivec[ic] = ires;
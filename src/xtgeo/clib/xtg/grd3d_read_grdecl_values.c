@@ -0,0 +1,224 @@
+/*
+****************************************************************************************
+ *
+ * NAME:
+ *    grd3d_read_grdecl_values.c
+ *
+ * DESCRIPTION:
+ *    Read the values of a GRDECL (Eclipse ASCII) record from a byte buffer, which
+ *    is a chunk of the file. Comments (-- to end of line) and repeat counts
+ *    (n*value) are handled, and the record ends with a slash. The function is made
+ *    for streaming: it returns when the output array is full, when the record ends,
+ *    or when the buffer ends in the middle of a token (then the caller shall append
+ *    the next chunk of the file, and call again from the same position).
+ *
+ *    A repeat count that does not fit in the output array is kept as pending in
+ *    the state, and is continued in the next call.
+ *
+ * ARGUMENTS:
+ *    swig_bytes     i     Buffer with file content
+ *    swig_bytes_len i     Length of buffer
+ *    final          i     1 if the buffer has the end of file, else 0
+ *    values         o     Output array
+ *    nvalues        i     Length of output array
+ *    state          i/o   Array of 4: position in buffer, number of values filled
+ *                         in output, pending repeat count and pending value
+ *    option         i     0: read numbers, 1: skip the record (any tokens,
+ *                         including quoted strings, are accepted and counted in
+ *                         state[1], but not stored), 2: as 1, but also stop in
+ *                         front of a keyword, i.e. a token that starts with a
+ *                         letter in the first column of a line
+ *
+ * RETURNS:
+ *    Function: 0: end of buffer (need more data, or end of file if final),
+ *              1: record terminator (slash) is read,
+ *              2: output array is full, and the next token is not a slash
+ *              3: a keyword is found at buffer position state[0] (option 2)
+ *             -1: invalid token at buffer position state[0]
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+
+static int
+_isspace(char c)
+{
+    return (c == ' ' || c == '\t' || c == '\n' || c == '\r' || c == '\v' || c == '\f');
+}
+
+int
+grd3d_read_grdecl_values(char *swig_bytes,
+                         long swig_bytes_len,
+                         int final,
+                         double *swig_np_dbl_inplaceflat_v1,
+                         long n_swig_np_dbl_inplaceflat_v1,
+                         double *swig_np_dbl_inplace_v1,
+                         long n_swig_np_dbl_inplace_v1,
+                         int option)
+{
+    char *buf = swig_bytes;
+    long nbuf = swig_bytes_len;
+    double *values = swig_np_dbl_inplaceflat_v1;
+    long nvalues = n_swig_np_dbl_inplaceflat_v1;
+    double *state = swig_np_dbl_inplace_v1;
+
+    long pos, nfill, pending, start, end, star, nrep, ir;
+    int needmore;
+    double pvalue, value;
+
+    if (n_swig_np_dbl_inplace_v1 != 4) {
+        logger_error(LI, FI, FU, "Wrong length of state array in %s", FU);
+        return -1;
+    }
+
+    pos = (long)state[0];
+    nfill = (long)state[1];
+    pending = (long)state[2];
+    pvalue = state[3];
+
+    while (1) {
+
+        /* first use a pending repeat count */
+        if (pending > 0) {
+            while (pending > 0 && nfill < nvalues) {
+                values[nfill++] = pvalue;
+                pending--;
+            }
+            if (pending > 0)
+                break; /* output is full */
+        }
+
+        /* skip whitespace and comments */
+        needmore = 0;
+        while (pos < nbuf) {
+            if (_isspace(buf[pos])) {
+                pos++;
+                continue;
+            }
+            if (buf[pos] != '-')
+                break;
+            if (pos + 1 >= nbuf) {
+                needmore = !final; /* may be start of comment */
+                break;
+            }
+            if (buf[pos + 1] != '-')
+                break;
+            end = pos + 2;
+            while (end < nbuf && buf[end] != '\n')
+                end++;
+            if (end >= nbuf && !final) {
+                needmore = 1; /* comment may continue in next chunk */
+                break;
+            }
+            pos = end;
+        }
+
+        if (needmore || pos >= nbuf) {
+            state[0] = pos;
+            state[1] = nfill;
+            state[2] = 0;
+            return 0;
+        }
+
+        if (buf[pos] == '/') {
+            pos++;
+            state[0] = pos;
+            state[1] = nfill;
+            state[2] = 0;
+            return 1;
+        }
+
+        if (nfill >= nvalues && option == 0)
+            break; /* output is full */
+
+        /* find end of token; a quoted string (when skipping) may have blanks */
+        start = pos;
+        end = pos;
+        if (option > 0 && buf[pos] == '\'') {
+            end++;
+            while (end < nbuf && buf[end] != '\'')
+                end++;
+            if (end < nbuf)
+                end++;
+            else if (!final)
+                end = -1;
+        } else {
+            while (end < nbuf && !_isspace(buf[end]) && buf[end] != '/')
+                end++;
+            if (end >= nbuf && !final)
+                end = -1;
+        }
+
+        if (end < 0) {
+            /* token may continue in next chunk */
+            state[0] = start;
+            state[1] = nfill;
+            state[2] = 0;
+            return 0;
+        }
+
+        if (option == 2 && start > 0 && buf[start - 1] == '\n' &&
+            ((buf[start] >= 'A' && buf[start] <= 'Z') ||
+             (buf[start] >= 'a' && buf[start] <= 'z'))) {
+            state[0] = start;
+            state[1] = nfill;
+            state[2] = 0;
+            return 3;
+        }
+
+        if (option > 0) {
+            nfill++;
+            pos = end;
+            continue;
+        }
+
+        /* repeat count? */
+        star = -1;
+        for (ir = start; ir < end; ir++) {
+            if (buf[ir] == '*') {
+                star = ir;
+                break;
+            }
+        }
+
+        if (star < 0) {
+            if (!x_parse_number(buf, start, end, &value)) {
+                state[0] = start;
+                state[1] = nfill;
+                return -1;
+            }
+            values[nfill++] = value;
+        } else {
+            /* n*value; n* alone means default values which is not supported */
+            nrep = 0;
+            for (ir = start; ir < star; ir++) {
+                if (buf[ir] < '0' || buf[ir] > '9') {
+                    nrep = -1;
+                    break;
+                }
+                nrep = nrep * 10 + (buf[ir] - '0');
+            }
+            if (nrep <= 0 || !x_parse_number(buf, star + 1, end, &value)) {
+                state[0] = start;
+                state[1] = nfill;
+                return -1;
+            }
+            pending = nrep;
+            pvalue = value;
+        }
+        pos = end;
+    }
+
+    state[0] = pos;
+    state[1] = nfill;
+    state[2] = pending;
+    state[3] = pvalue;
+    return 2;
+}
@@ -0,0 +1,168 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    grd3d_sum_volumes.c
+ *
+ * DESCRIPTION:
+ *    Compute bulk volume per cell, and sum bulk volume, pore volume and hydrocarbon
+ *    pore volume per region (e.g. zone), in one pass over the grid. The layers are
+ *    processed in parallel (cf. x_nthreads.c), where each layer has its own partial
+ *    sums, which are added in layer order at the end; hence the result does not
+ *    depend on the number of threads.
+ *
+ *    PV = BV * PORO * NTG and HCPV = PV * (1 - SW) per cell.
+ *
+ * ARGUMENTS:
+ *    nx, ny, nz     i     Grid dimensions
+ *    coordsv        i     Grid Z coord for input
+ *    zcornsv        i     Grid Z corners for input
+ *    actnumsv       i     Grid ACTNUM parameter input
+ *    regionv        i     Region index (0 .. NREG-1) per cell in C order; cells with
+ *                         negative index are skipped. If empty, all cells are in
+ *                         region index 0
+ *    porov          i     Porosity per cell in C order; if empty, 1.0 is used
+ *    ntgv           i     Net to gross per cell in C order; if empty, 1.0 is used
+ *    swv            i     Water saturation per cell in C order; if empty, 0.0 is used
+ *    bulkv         i/o    Bulk volume per cell in C order; if empty, not stored
+ *    sumsv         i/o    Sums BV, PV, HCPV per region, NREG * 3 values
+ *    option         i     1: skip inactive cells (bulk volume is UNDEF), 0: all cells
+ *
+ * RETURNS:
+ *    Function: 0: upon success. If problems:
+ *              -1: Wrong length of arrays
+ *              -2: Region index out of range
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+#include <stdlib.h>
+
+int
+grd3d_sum_volumes(int nx,
+                  int ny,
+                  int nz,
+                  double *coordsv,
+                  long ncoord,
+                  double *zcornsv,
+                  long nzcorn,
+                  int *actnumsv,
+                  long nact,
+                  int *regionv,
+                  long nregion,
+                  double *porov,
+                  long nporo,
+                  double *ntgv,
+                  long nntg,
+                  double *swv,
+                  long nsw,
+                  double *bulkv,
+                  long nbulk,
+                  double *sumsv,
+                  long nsums,
+                  int option)
+
+{
+    logger_info(LI, FI, FU, "Sum volumes...");
+
+    long ntot = (long)nx * ny * nz;
+    long nlen[5] = { nregion, nporo, nntg, nsw, nbulk };
+    int n;
+
+    if (nact != ntot || nsums < 3 || nsums % 3 != 0) {
+        logger_error(LI, FI, FU, "Wrong length of arrays in %s", FU);
+        return -1;
+    }
+    for (n = 0; n < 5; n++) {
+        if (nlen[n] != 0 && nlen[n] != ntot) {
+            logger_error(LI, FI, FU, "Wrong length of arrays in %s", FU);
+            return -1;
+        }
+    }
+
+    int nreg = nsums / 3;
+    double *partial = calloc((size_t)nz * nsums, sizeof(double));
+    if (partial == NULL)
+        logger_critical(LI, FI, FU, "Cannot allocate memory in %s", FU);
+
+    int badregion = 0;
+
+    /* layers are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+    int k;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic) num_threads(nthreads) if (nthreads > 1)
+#endif
+    for (k = 1; k <= nz; k++) {
+        int i, j;
+        double c[24];
+        double *sums = partial + (long)(k - 1) * nsums;
+
+        for (j = 1; j <= ny; j++) {
+            for (i = 1; i <= nx; i++) {
+
+                long ib = x_ijk2ib(i, j, k, nx, ny, nz, 0);
+                long ic = x_ijk2ic(i, j, k, nx, ny, nz, 0);
+
+                if (option == 1 && actnumsv[ib] == 0) {
+                    if (nbulk > 0)
+                        bulkv[ic] = UNDEF;
+                    continue;
+                }
+
+                int ireg = (nregion > 0) ? regionv[ic] : 0;
+                if (ireg >= nreg) {
+                    badregion = 1;
+                    continue;
+                }
+
+                if (nbulk == 0 && ireg < 0)
+                    continue;
+
+                grd3d_corners(i, j, k, nx, ny, nz, coordsv, ncoord, zcornsv, nzcorn, c);
+                double bv = x_hexahedron_volume(c);
+
+                if (nbulk > 0)
+                    bulkv[ic] = bv;
+
+                if (ireg < 0)
+                    continue;
+
+                double pv = bv;
+                if (nporo > 0)
+                    pv *= porov[ic];
+                if (nntg > 0)
+                    pv *= ntgv[ic];
+                double hcpv = (nsw > 0) ? pv * (1.0 - swv[ic]) : pv;
+
+                sums[3 * ireg] += bv;
+                sums[3 * ireg + 1] += pv;
+                sums[3 * ireg + 2] += hcpv;
+            }
+        }
+    }
+
+    long m;
+    for (m = 0; m < nsums; m++) {
+        sumsv[m] = 0.0;
+        for (k = 0; k < nz; k++)
+            sumsv[m] += partial[(long)k * nsums + m];
+    }
+    free(partial);
+
+    if (badregion) {
+        logger_error(LI, FI, FU, "Region index out of range in %s", FU);
+        return -2;
+    }
+
+    logger_info(LI, FI, FU, "Sum volumes... done");
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,187 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    grd3d_wells_ijk.c
+ *
+ * DESCRIPTION:
+ *    Batch version of grd3d_well_ijk.c, for many wells in one call, working on
+ *    numpy arrays. The well trajectories are concatenated, with the start index of
+ *    each well given. For each point, find which I J K it has; the search is the
+ *    same as in grd3d_well_ijk.c, and each well starts with the same start cells,
+ *    hence the result per well is the same as for grd3d_well_ijk.
+ *
+ *    A copy of the grid's Z corners is made consistent in Z once; unlike in
+ *    grd3d_well_ijk.c the input zcornsv is not changed. The one layer grid (which
+ *    is part of the grid's search index in Python) is given as input.
+ *
+ *    Note, the cell index is 1 based, and 0 if not in an active cell.
+ *
+ * ARGUMENTS:
+ *    nx,ny,nz           i     Grid dimensions ncol, nrow, nlay
+ *    coordsv            i     Grid coordinate lines
+ *    zcornsv            i     Grid Z corners
+ *    actnumsv           i     Grid ACTNUM parameter
+ *    zcornonev          i     Grid Z corners, top bot only
+ *    actnumonev         i     Grid ACTNUM parameter top bot only
+ *    xv, yv, zv         i     Well trajectories, concatenated
+ *    wellstart          i     Start index per well in trajectory vectors, plus
+ *                             total number of points, i.e. NWELL + 1 values
+ *    ivector            o     Returning I coordinates (0 if not in grid)
+ *    jvector            o     Returning J coordinates (0 if not in grid)
+ *    kvector            o     Returning K coordinates (0 if not in grid)
+ *
+ * RETURNS:
+ *    The C macro EXIT_SUCCESS unless problems:
+ *    -1: Wrong length of arrays
+ *    -2: Cannot allocate memory
+ *    Updated *vector variables
+ *
+ * NOTES:
+ *    The wells are processed in parallel if XTGeo is compiled with OpenMP and the
+ *    number of threads is set > 1, see x_nthreads.c
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+
+static void
+_well_ijk(long i1,
+          long i2,
+          int nx,
+          int ny,
+          int nz,
+          double *coordsv,
+          double *zcornsv,
+          int *actnumsv,
+          double *zcornonev,
+          int *actnumonev,
+          double *xv,
+          double *yv,
+          double *zv,
+          int *ivector,
+          int *jvector,
+          int *kvector)
+{
+    /* find a smart global startcell; middle of IJ and K=1 */
+    long ibstart0 = x_ijk2ib(nx / 2, ny / 2, 1, nx, ny, nz, 0);
+    long ibstart = ibstart0;
+    long ibstart2 = ibstart0;
+
+    /* initial search options in grd3d_point_in_cell, cf. grd3d_well_ijk.c */
+    int maxradsearch = 5;
+    int sflag = 1;
+    int nradsearch;
+    int icol = 0, jrow = 0, klay = 0;
+
+    long mnum;
+    for (mnum = i1; mnum < i2; mnum++) {
+        ivector[mnum] = 0;
+        jvector[mnum] = 0;
+        kvector[mnum] = 0;
+
+        /* first check that the point is inside the one layer grid */
+        long ib1 = grd3d_point_in_cell(ibstart2, 0, xv[mnum], yv[mnum], zv[mnum], nx,
+                                       ny, 1, coordsv, zcornonev, actnumonev,
+                                       maxradsearch, sflag, &nradsearch, 0);
+        if (ib1 < 0)
+            continue;
+
+        ibstart2 = ib1;
+
+        long ib2 = grd3d_point_in_cell(ibstart, 0, xv[mnum], yv[mnum], zv[mnum], nx,
+                                       ny, nz, coordsv, zcornsv, actnumsv,
+                                       maxradsearch, sflag, &nradsearch, 0);
+
+        if (ib2 >= 0) {
+            x_ib2ijk(ib2, &icol, &jrow, &klay, nx, ny, nz, 0);
+
+            if (actnumsv[ib2] == 1) {
+                ivector[mnum] = icol;
+                jvector[mnum] = jrow;
+                kvector[mnum] = klay;
+            }
+            ibstart = ib2;
+        } else {
+            /* outside grid */
+            ibstart = ibstart0;
+        }
+    }
+}
+
+int
+grd3d_wells_ijk(int nx,
+                int ny,
+                int nz,
+                double *coordsv,
+                long ncoordin,
+                double *zcornsv,
+                long nzcornin,
+                int *actnumsv,
+                long nactin,
+                double *zcornonev,
+                long nzcornonein,
+                int *actnumonev,
+                long nactonein,
+                double *xv,
+                long nxv,
+                double *yv,
+                long nyv,
+                double *zv,
+                long nzv,
+                int *wellstart,
+                long nwellstart,
+                int *ivector,
+                long nivec,
+                int *jvector,
+                long njvec,
+                int *kvector,
+                long nkvec)
+
+{
+    logger_info(LI, FI, FU, "Entering %s", FU);
+
+    if (nyv != nxv || nzv != nxv || nivec != nxv || njvec != nxv || nkvec != nxv ||
+        nwellstart < 1 || wellstart[nwellstart - 1] != nxv) {
+        logger_error(LI, FI, FU, "Wrong length of arrays in %s", FU);
+        return -1;
+    }
+
+    /* cf. grd3d_well_ijk.c; a small separation for each cell layer, on a copy */
+    double *zcornv = malloc(nzcornin * sizeof(double));
+    if (zcornv == NULL) {
+        logger_error(LI, FI, FU, "Cannot allocate memory in %s", FU);
+        return -2;
+    }
+    memcpy(zcornv, zcornsv, nzcornin * sizeof(double));
+
+    double zconst = 0.000001;
+    grd3d_make_z_consistent(nx, ny, nz, zcornv, 0, zconst);
+
+    int nwell = (int)nwellstart - 1;
+
+    /* wells are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+    int iw;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic) num_threads(nthreads) if (nthreads > 1)
+#endif
+    for (iw = 0; iw < nwell; iw++) {
+        _well_ijk(wellstart[iw], wellstart[iw + 1], nx, ny, nz, coordsv, zcornv,
+                  actnumsv, zcornonev, actnumonev, xv, yv, zv, ivector, jvector,
+                  kvector);
+    }
+
+    free(zcornv);
+
+    logger_info(LI, FI, FU, "Exit from %s", FU);
+    return EXIT_SUCCESS;
+}
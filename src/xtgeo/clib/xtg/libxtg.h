@@ -120,6 +120,12 @@ x_interp_map_nodes(double *x_v,
                    double y,
                    int method);
 
+void
+x_set_nthreads(int nthreads);
+
+int
+x_get_nthreads(void);
+
 long
 x_ijk2ib(int i, int j, int k, int nx, int ny, int nz, int ia_start);
 
@@ -585,11 +591,16 @@ surf_slice_cube_window(int ncx,
                        double mrotation,
                        double *swig_np_dbl_in_v1,  // *p_map_v
                        long n_swig_np_dbl_in_v1,   // nmap
+                       double *swig_np_dbl_in_v2,  // *p_other_v
+                       long n_swig_np_dbl_in_v2,   // nother
                        double zincr,
-                       int nzincr,
+                       int nabove,
+                       int nbelow,
+                       int useother,
+                       int *swig_np_int_in_v1,       // *p_attrsel_v
+                       long n_swig_np_int_in_v1,     // nattrsel
                        double *swig_np_dbl_aout_v1,  // *p_attrs_v: update
                        long n_swig_np_dbl_aout_v1,   // nattrsmap
-                       int nattr,
                        int option1,
                        int option2);
 
@@ -1064,6 +1075,46 @@ grd3d_calc_xyz(int nx,
                long n_swig_np_dbl_inplace_v3,   // npz,
                int option);
 
+int
+grd3d_cell_geometry(int nx,
+                    int ny,
+                    int nz,
+                    double *swig_np_dbl_in_v1,            // *coordsv,
+                    long n_swig_np_dbl_in_v1,             // ncoord,
+                    double *swig_np_dbl_in_v2,            // *zcornsv,
+                    long n_swig_np_dbl_in_v2,             // nzcorn,
+                    int *swig_np_int_in_v1,               // *actnumsv,
+                    long n_swig_np_int_in_v1,             // nactnum,
+                    int k1,
+                    int k2,
+                    double *swig_np_dbl_inplaceflat_v1,   // *geomv,
+                    long n_swig_np_dbl_inplaceflat_v1,    // ngeom,
+                    int option);
+
+int
+grd3d_sum_volumes(int nx,
+                  int ny,
+                  int nz,
+                  double *swig_np_dbl_in_v1,         // *coordsv,
+                  long n_swig_np_dbl_in_v1,          // ncoord,
+                  double *swig_np_dbl_in_v2,         // *zcornsv,
+                  long n_swig_np_dbl_in_v2,          // nzcorn,
+                  int *swig_np_int_in_v1,            // *actnumsv,
+                  long n_swig_np_int_in_v1,          // nactnum,
+                  int *swig_np_int_in_v2,            // *regionv,
+                  long n_swig_np_int_in_v2,          // nregion,
+                  double *swig_np_dbl_in_v3,         // *porov,
+                  long n_swig_np_dbl_in_v3,          // nporo,
+                  double *swig_np_dbl_in_v4,         // *ntgv,
+                  long n_swig_np_dbl_in_v4,          // nntg,
+                  double *swig_np_dbl_in_v5,         // *swv,
+                  long n_swig_np_dbl_in_v5,          // nsw,
+                  double *swig_np_dbl_inplace_v1,    // *bulkv,
+                  long n_swig_np_dbl_inplace_v1,     // nbulk,
+                  double *swig_np_dbl_inplace_v2,    // *sumsv,
+                  long n_swig_np_dbl_inplace_v2,     // nsums,
+                  int option);
+
 /* last generation import roff binary from here --> */
 long
 grd3d_scan_roffbinary(FILE *fc,
@@ -1615,6 +1666,7 @@ grd3d_points_ijk_cells(double *swig_np_dbl_in_v1,  // *xvec
 
                        int actnumoption,
                        int flip,
+                       int ksearch,
 
                        int *swig_np_int_aout_v1,    // *ivec
                        long n_swig_np_int_aout_v1,  // nivec
@@ -1883,6 +1935,35 @@ grd3d_well_ijk(int nx,
                int *kvector,
                int iflag);
 
+int
+grd3d_wells_ijk(int nx,
+                int ny,
+                int nz,
+                double *swig_np_dbl_in_v1,  // *coordsv
+                long n_swig_np_dbl_in_v1,
+                double *swig_np_dbl_in_v2,  // *zcornsv
+                long n_swig_np_dbl_in_v2,
+                int *swig_np_int_in_v1,  // *actnumsv
+                long n_swig_np_int_in_v1,
+                double *swig_np_dbl_in_v3,  // *zcornonev
+                long n_swig_np_dbl_in_v3,
+                int *swig_np_int_in_v2,  // *actnumonev
+                long n_swig_np_int_in_v2,
+                double *swig_np_dbl_in_v4,  // *xv
+                long n_swig_np_dbl_in_v4,
+                double *swig_np_dbl_in_v5,  // *yv
+                long n_swig_np_dbl_in_v5,
+                double *swig_np_dbl_in_v6,  // *zv
+                long n_swig_np_dbl_in_v6,
+                int *swig_np_int_in_v3,  // *wellstart
+                long n_swig_np_int_in_v3,
+                int *swig_np_int_aout_v1,  // *ivector
+                long n_swig_np_int_aout_v1,
+                int *swig_np_int_aout_v2,  // *jvector
+                long n_swig_np_int_aout_v2,
+                int *swig_np_int_aout_v3,  // *kvector
+                long n_swig_np_int_aout_v3);
+
 /*
  *======================================================================================
  * WELL spesific
@@ -1919,6 +2000,23 @@ well_trunc_parallel(double *swig_np_dbl_inplace_v1,  // *xv1,
                     double atol,
                     int option);
 
+int
+grd3d_read_grdecl_values(char *swig_bytes,
+                         long swig_bytes_len,
+                         int final,
+                         double *swig_np_dbl_inplaceflat_v1,
+                         long n_swig_np_dbl_inplaceflat_v1,
+                         double *swig_np_dbl_inplace_v1,
+                         long n_swig_np_dbl_inplace_v1,
+                         int option);
+
+long
+well_import_rms_ascii(char *swig_bytes,
+                      long swig_bytes_len,
+                      int ncol,
+                      double *swig_np_dbl_inplaceflat_v1,
+                      long n_swig_np_dbl_inplaceflat_v1);
+
 int
 well_surf_picks(double *swig_np_dbl_in_v1,  //*xv
                 long n_swig_np_dbl_in_v1,   // nxv
@@ -1950,3 +2048,23 @@ well_surf_picks(double *swig_np_dbl_in_v1,  //*xv
                 long n_swig_np_dbl_aout_v4,
                 int *swig_np_int_aout_v1,  //*zoutv,
                 long n_swig_np_int_aout_v1);
+
+long
+well_surfs_picks(double *swig_np_dbl_in_v1,  // *xv
+                 long n_swig_np_dbl_in_v1,
+                 double *swig_np_dbl_in_v2,  // *yv
+                 long n_swig_np_dbl_in_v2,
+                 double *swig_np_dbl_in_v3,  // *zv
+                 long n_swig_np_dbl_in_v3,
+                 double *swig_np_dbl_in_v4,  // *mdv
+                 long n_swig_np_dbl_in_v4,
+                 double *swig_np_dbl_in_v5,  // *surfv
+                 long n_swig_np_dbl_in_v5,
+                 double *swig_np_dbl_in_v6,  // *surfinfo
+                 long n_swig_np_dbl_in_v6,
+                 int *swig_np_int_in_v1,  // *wellstart
+                 long n_swig_np_int_in_v1,
+                 double *swig_np_dbl_inplace_v1,  // *pickv
+                 long n_swig_np_dbl_inplace_v1,
+                 int *swig_np_int_inplace_v1,  // *pickiv
+                 long n_swig_np_int_inplace_v1);
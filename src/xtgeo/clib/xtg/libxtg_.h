@@ -21,6 +21,9 @@ x_free(int num, ...);
 int
 x_cmp_sort(const void *vp, const void *vq);
 
+int
+x_parse_number(char *buf, long start, long end, double *value);
+
 void
 x_mapaxes(int mode,
           double *x,
@@ -54,6 +57,9 @@ x_chk_point_in_cell(double x, double y, double z, double coor[], int imethod);
 int
 x_chk_point_in_hexahedron(double x, double y, double z, double *coor, int flip);
 
+double
+x_hexahedron_volume(double *c);
+
 void
 x_2d_rect_corners(double x,
                   double y,
@@ -60,22 +60,34 @@ pol_do_points_inside(double *xpoi,
                      int inside)
 
 {
-    int ic, dowork = 0, istat;
+    long ic;
+
+    if (option != 1 && option != 2 && option != 3 && option != 4 && option != 5 &&
+        option != 11) {
+        return 2;
+    }
+
+    /* the polygon closure check is independent of points; check once */
+    if (nzpoi > 0 && pol_chk_point_inside(xpoi[0], ypoi[0], xpol, ypol, nxpol) == -9) {
+        logger_warn(LI, FI, FU, "Polygon is not closed");
+        return 1;
+    }
 
     /*
      *-------------------------------------------------------------------------
-     * Loop over all points
+     * Loop over all points; may run in parallel (cf. x_nthreads.c)
      *-------------------------------------------------------------------------
      */
 
-    for (ic = 0; ic < nzpoi; ic++) {
-        dowork = 0;
-        istat = pol_chk_point_inside(xpoi[ic], ypoi[ic], xpol, ypol, nxpol);
+    int nthreads = x_get_nthreads();
 
-        if (istat == -9) {
-            logger_warn(LI, FI, FU, "Polygon is not closed");
-            return 1;
-        }
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads)                       \
+  if (nthreads > 1 && nzpoi > 100)
+#endif
+    for (ic = 0; ic < nzpoi; ic++) {
+        int dowork = 0;
+        int istat = pol_chk_point_inside(xpoi[ic], ypoi[ic], xpol, ypol, nxpol);
 
         if (istat > 0 && inside == 1)
             dowork = 1;
@@ -99,8 +111,6 @@ pol_do_points_inside(double *xpoi,
                 }
             } else if (option == 11) {
                 zpoi[ic] = UNDEF;
-            } else {
-                return 2;
             }
         }
     }
@@ -52,10 +52,17 @@ int surf_get_zv_from_xyv(
                          long nn
                          )
 {
-    int i;
+    long i;
 
     nn = nx*ny;
 
+    /* points are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads) \
+  if (nthreads > 1 && nxv > 1000)
+#endif
     for (i=0; i<nxv; i++) {
         zv[i] = surf_get_z_from_xy(xv[i], yv[i], nx, ny, xori, yori, xinc,
                                    yinc, yflip, rot_deg, p_map_v, nn);
@@ -1,14 +1,21 @@
 /*
- ******************************************************************************
+ ***************************************************************************************
  *
  * NAME:
- *    surf_slice_cube_window.c  IN PROGRESS
+ *    surf_slice_cube_window.c
  *
  *
  * DESCRIPTION:
- *     Given a map and a cube, sample a series if cube values based on maps
- *     which has increment in Z; then several attributes are computed such
- *     as min/max/avg etc over a vertical window.
+ *     Given a map and a cube, sample a series of cube values along each map node
+ *     trace within a vertical window, and compute attributes such as min/max/mean
+ *     etc over the window. The samples are accumulated per trace, hence no stack of
+ *     sliced maps is made. The sampling per Z value is the same as in
+ *     surf_slice_cube().
+ *
+ *     The window is from nabove increments above the map to nbelow increments
+ *     below. If useother is 1, the other map limits the window, i.e. samples
+ *     that are beyond the other map are skipped (the sample at the map itself is
+ *     always used).
  *
  * ARGUMENTS:
  *    ncx...ncz      i     cube dimensions
@@ -20,14 +27,19 @@
  *    mx, my         i     Map dimensions
  *    xori...        i     Map origin, incs, rotation
  *    p_map_v        i     Input map array with Z values
- *    nmap           i     Length of slice array (mx * my)
+ *    nmap           i     Length of map array (mx * my)
+ *    p_other_v      i     Other map with Z values (if useother)
+ *    nother         i     Length of other map array
  *    zincr          i     Z increment
- *    nzincr         i     number of Z increments
- *    p_map_v        o     Maps to update. Allocated as nmap = mx * my * nattr
- *                         where nattr is number of map attributes
- *    nmap           i     Length of output map array (pre allocated)
- *    nattr          i     Number of attributes; these are fixed entries:
- *                         1. MIN; 2. MAX, 3. AVG, 4. STD, 5. RMS
+ *    nabove         i     Number of Z increments above map
+ *    nbelow         i     Number of Z increments below map
+ *    useother       i     1 if other map shall limit the window
+ *    p_attrsel_v    i     Selection of attributes (1 if computed, else 0), in the
+ *                         order given below (NATTR entries)
+ *    nattrsel       i     Length of attribute selection array
+ *    p_attrs_v      o     Maps to update, one after the other for the selected
+ *                         attributes, allocated as nsel * mx * my
+ *    nattrmaps      i     Length of attribute maps array
  *    option1        i     Options:
  *                         0: use cube cell value (no interpolation;
  *                            nearest node)
@@ -36,69 +48,168 @@
  *    option2        i     0: Leave surf undef if outside cube
  *                         1: Keep surface values as is outside cube
  *
+ *    The attributes are: 0 max, 1 min, 2 rms, 3 var, 4 mean, 5 maxpos, 6 maxneg,
+ *    7 maxabs, 8 sumpos, 9 sumneg, 10 sumabs, 11 meanabs, 12 meanpos, 13 meanneg
+ *
  * RETURNS:
- *    Function: 0: upon success. If problems <> 0: TODO: UPDATE LIST
+ *    Function: 0: upon success. If problems <> 0:
  *             -5: No map values sampled
  *             -4: More than 1 sample but less than 10% of map values sampled
- *             -9: Fail in cube_value_ijk (unexpected error)
- *    map pointers updated
+ *             -2: Wrong length of input arrays
+ *    Attribute maps updated, UNDEF_MAP where no samples
  *
  * TODO/ISSUES/BUGS:
  *
  * LICENCE:
  *    See XTGeo lisence
  *
- ******************************************************************************
+ ***************************************************************************************
  */
 
 #include "libxtg.h"
 #include "libxtg_.h"
 #include "logger.h"
 #include <math.h>
-#include <time.h>
 
-void
-_compute_attrs(double *tmpzval, int nzval, double *zattrv, int nattr)
+#define NATTR 14
+
+/* streaming accumulators for one trace */
+typedef struct
 {
+    long nact, npos, nneg;
+    double vmin, vmax, maxabs, maxpos, minneg;
+    double sum, sumsq, sumpos, sumneg, sumabs;
+    double mean, m2; /* for variance (Welford) */
+} WindowAccum;
 
-    /* tmpzval: stack of zvalues from nzval slices */
-    /* zattrv: attribute result value, for nattr attributes */
-
-    int icn;
-
-    int nact = 0;
-    double zmin = UNDEF;
-    double zmax = -1 * UNDEF;
-    double zsum = 0.0;
-    double z2sum = 0.0;
-
-    for (icn = 0; icn < nzval; icn++) {
-        if (tmpzval[icn] < UNDEF_LIMIT) {
-            nact++;
-            zsum = zsum + tmpzval[icn];
-            z2sum = z2sum + pow(tmpzval[icn], 2);
-            if (tmpzval[icn] < zmin)
-                zmin = tmpzval[icn];
-            if (tmpzval[icn] > zmax)
-                zmax = tmpzval[icn];
-        }
+static void
+_accum_reset(WindowAccum *acc)
+{
+    acc->nact = acc->npos = acc->nneg = 0;
+    acc->vmin = acc->vmax = acc->maxabs = acc->maxpos = acc->minneg = 0.0;
+    acc->sum = acc->sumsq = acc->sumpos = acc->sumneg = acc->sumabs = 0.0;
+    acc->mean = acc->m2 = 0.0;
+}
+
+static void
+_accum_add(WindowAccum *acc, double val)
+{
+    double delta;
+
+    if (acc->nact == 0) {
+        acc->vmin = acc->vmax = val;
+        acc->maxabs = fabs(val);
+    } else {
+        if (val < acc->vmin)
+            acc->vmin = val;
+        if (val > acc->vmax)
+            acc->vmax = val;
+        if (fabs(val) > acc->maxabs)
+            acc->maxabs = fabs(val);
     }
 
-    if ((zmax - (-1 * UNDEF)) < FLOATEPS)
-        zmax = UNDEF;
+    acc->nact++;
+    acc->sum += val;
+    acc->sumsq += val * val;
+    acc->sumabs += fabs(val);
 
-    if (nact == 0) {
-        int iat;
-        for (iat = 0; iat < nattr; iat++)
-            zattrv[iat] = UNDEF;
+    delta = val - acc->mean;
+    acc->mean += delta / acc->nact;
+    acc->m2 += delta * (val - acc->mean);
+
+    if (val >= 0.0) {
+        if (acc->npos == 0 || val > acc->maxpos)
+            acc->maxpos = val;
+        acc->npos++;
+        acc->sumpos += val;
+    } else {
+        if (acc->nneg == 0 || val < acc->minneg)
+            acc->minneg = val;
+        acc->nneg++;
+        acc->sumneg += val;
+    }
+}
+
+static void
+_accum_result(WindowAccum *acc, double *res)
+{
+    int iat;
+
+    for (iat = 0; iat < NATTR; iat++)
+        res[iat] = UNDEF_MAP;
+
+    if (acc->nact == 0)
         return;
+
+    res[0] = acc->vmax;
+    res[1] = acc->vmin;
+    res[2] = sqrt(acc->sumsq / acc->nact);
+    res[3] = acc->m2 / acc->nact;
+    res[4] = acc->sum / acc->nact;
+    res[7] = acc->maxabs;
+    res[10] = acc->sumabs;
+    res[11] = acc->sumabs / acc->nact;
+
+    if (acc->npos > 0) {
+        res[5] = acc->maxpos;
+        res[8] = acc->sumpos;
+        res[12] = acc->sumpos / acc->npos;
+    }
+    if (acc->nneg > 0) {
+        res[6] = acc->minneg;
+        res[9] = acc->sumneg;
+        res[13] = acc->sumneg / acc->nneg;
+    }
+}
+
+/* sample cube in one point, as in surf_slice_cube(); return 0 if no value */
+static int
+_sample_cube(double xcor,
+             double ycor,
+             double zval,
+             int ncx,
+             int ncy,
+             int ncz,
+             double cxori,
+             double cxinc,
+             double cyori,
+             double cyinc,
+             double czori,
+             double czinc,
+             double crotation,
+             int yflip,
+             float *p_cubeval_v,
+             int option1,
+             int option2,
+             double *result)
+{
+    int ier = 99;
+    float value;
+
+    if (option1 == 0) {
+        ier = cube_value_xyz_cell(xcor, ycor, zval, cxori, cxinc, cyori, cyinc, czori,
+                                  czinc, crotation, yflip, ncx, ncy, ncz, p_cubeval_v,
+                                  &value, 0);
+    } else {
+        ier = cube_value_xyz_interp(xcor, ycor, zval, cxori, cxinc, cyori, cyinc, czori,
+                                    czinc, crotation, yflip, ncx, ncy, ncz,
+                                    p_cubeval_v, &value, option1 == 2 ? 1 : 0);
+    }
+
+    if (ier == EXIT_SUCCESS) {
+        *result = value;
+    } else if (ier == -1 && option2 == 0) {
+        return 0;
     } else {
-        zattrv[0] = zmin;
-        zattrv[1] = zmax;
-        zattrv[2] = zsum / nact;
-        zattrv[3] = zsum / nact;         // shall be std
-        zattrv[4] = sqrt(z2sum / nact);  // rms
+        /* keep surface value as is */
+        *result = zval;
     }
+
+    /* e.g. dead traces are UNDEF in cube */
+    if (*result > UNDEF_MAP_LIMIT)
+        return 0;
+
+    return 1;
 }
 
 int
@@ -125,95 +236,103 @@ surf_slice_cube_window(int ncx,
                        double mrotation,
                        double *p_map_v,
                        long nmap,
+                       double *p_other_v,
+                       long nother,
                        double zincr,
-                       int nzincr,
+                       int nabove,
+                       int nbelow,
+                       int useother,
+                       int *p_attrsel_v,
+                       long nattrsel,
                        double *p_attrs_v,
                        long nattrmaps,
-                       int nattr,
                        int option1,
                        int option2)
 
 {
     /* locals */
-    int im, jm, knum, ier, iat, ic;
-    double xcor, ycor, zcor, zval;
-    float value;
-    double *tmpzval;
-    double *zattr;
-    int option1a = 0;
-
-    tmpzval = calloc(nzincr, sizeof(double));
-    zattr = calloc(nattr, sizeof(double));
-
-    /* work with every map node */
-    for (im = 1; im <= mx; im++) {
-
-        for (jm = 1; jm <= my; jm++) {
+    int im, jm, knum, iat, isel, nsel;
+    long ibm, nm = 0;
+    double xcor, ycor, zcor, zval, value, mul;
+    double zattr[NATTR];
+    WindowAccum acc;
 
-            /* get the surface x, y, value (z) from IJ location */
-            ier = surf_xyz_from_ij(im, jm, &xcor, &ycor, &zcor, xori, xinc, yori, yinc,
-                                   mx, my, mapflip, mrotation, p_map_v, nmap, 0);
+    if (option1 < 0 || option1 > 2) {
+        logger_error(LI, FI, FU, "Invalid option1 (%d) to %s", option1, FU);
+        return -2;
+    }
 
-            if (zcor < UNDEF_LIMIT) {
+    nsel = 0;
+    for (iat = 0; iat < NATTR && iat < nattrsel; iat++) {
+        if (p_attrsel_v[iat] == 1)
+            nsel++;
+    }
 
-                /* work with Z increment */
-                for (knum = 0; knum < nzincr; knum++) {
-                    zval = zcor + knum * zincr;
+    if (nattrsel != NATTR || nattrmaps != nsel * nmap || (useother && nother != nmap)) {
+        logger_error(LI, FI, FU, "Wrong length of input arrays in %s", FU);
+        return -2;
+    }
 
-                    if (option1 == 0) {
+    /* work with every map node (trace) */
+    for (im = 1; im <= mx; im++) {
+        for (jm = 1; jm <= my; jm++) {
 
-                        ier = cube_value_xyz_cell(
-                          xcor, ycor, zval, cxori, cxinc, cyori, cyinc, czori, czinc,
-                          crotation, yflip, ncx, ncy, ncz, p_cubeval_v, &value, 0);
+            surf_xyz_from_ij(im, jm, &xcor, &ycor, &zcor, xori, xinc, yori, yinc, mx,
+                             my, mapflip, mrotation, p_map_v, nmap, 0);
 
-                    } else if (option1 == 1 || option1 == 2) {
+            ibm = x_ijk2ic(im, jm, 1, mx, my, 1, 0);
 
-                        option1a = 0;
-                        if (option1 == 2)
-                            option1a = 1;  // snap to closest XY
-                        if (knum > 0)
-                            option1a += 10;  // Skip IJ calculation
+            _accum_reset(&acc);
 
-                        /* TIDSTYV! */
-                        ier = cube_value_xyz_interp(xcor, ycor, zval, cxori, cxinc,
-                                                    cyori, cyinc, czori, czinc,
-                                                    crotation, yflip, ncx, ncy, ncz,
-                                                    p_cubeval_v, &value, option1a);
+            if (zcor < UNDEF_MAP_LIMIT) {
 
+                /* the map itself, then above (negative) and below (positive) */
+                for (knum = -nabove; knum <= nbelow; knum++) {
+                    if (knum == 0) {
+                        zval = zcor;
                     } else {
-                        logger_error(LI, FI, FU, "Invalid option1 (%d) to %s", option1,
-                                     FU);
+                        mul = knum < 0 ? -1.0 : 1.0;
+                        zval = zcor + zincr * abs(knum) * mul;
+
+                        /* skip samples beyond the other map */
+                        if (useother && mul * (p_other_v[ibm] - zval) < 0.0)
+                            continue;
                     }
 
-                    if (ier == EXIT_SUCCESS) {
-                        tmpzval[knum] = value;
-                    } else if (ier == -1 && option2 == 0) {
-                        tmpzval[knum] = UNDEF_MAP;
+                    if (_sample_cube(xcor, ycor, zval, ncx, ncy, ncz, cxori, cxinc,
+                                     cyori, cyinc, czori, czinc, crotation, yflip,
+                                     p_cubeval_v, option1, option2, &value)) {
+                        _accum_add(&acc, value);
                     }
-                    if (zval > UNDEF_LIMIT)
-                        tmpzval[knum] = UNDEF_MAP;
                 }
+            }
+
+            if (acc.nact > 0)
+                nm++;
 
-                _compute_attrs(tmpzval, nzincr, zattr, nattr);
+            _accum_result(&acc, zattr);
 
-                /* update attribute for that particular Z vector */
-                for (iat = 0; iat < nattr; iat++) {
-                    ic = x_ijk2ib(im, jm, iat + 1, mx, my, nattr, 0);
-                    p_attrs_v[ic] = zattr[iat];
+            isel = 0;
+            for (iat = 0; iat < NATTR; iat++) {
+                if (p_attrsel_v[iat] == 1) {
+                    p_attrs_v[isel * nmap + ibm] = zattr[iat];
+                    isel++;
                 }
-                /* } */
-                /* else{ */
-                /*     /\* maps is undefined *\/ */
-                /*     for (iat = 0; iat < nattr; iat++) { */
-                /*         ic = x_ijk2ib(im, jm, iat + 1, mx, my, nattr, 0); */
-                /*         p_attrs_v[ic] = UNDEF; */
-                /* } */
             }
         }
     }
 
-    free(tmpzval);
-    free(zattr);
+    /* less than 10% sampled */
+    if (nm > 0 && nm < 0.1 * nmap) {
+        logger_warn(LI, FI, FU, "Less than 10%% nodes sampled in %s!", FU);
+        return -4;
+    }
+
+    /* no nodes */
+    if (nm == 0) {
+        logger_warn(LI, FI, FU, "No nodes sampled in %s!", FU);
+        return -5;
+    }
 
     return EXIT_SUCCESS;
 }
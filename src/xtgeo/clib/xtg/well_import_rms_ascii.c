@@ -0,0 +1,103 @@
+/*
+****************************************************************************************
+ *
+ * SINFO: Parse the numeric log table of a RMS ascii well from a byte buffer
+ *
+ ***************************************************************************************
+ */
+
+#include <stdlib.h>
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+
+static int
+_isblank(char c)
+{
+    return (c == ' ' || c == '\t' || c == '\r' || c == '\v' || c == '\f');
+}
+
+/*
+****************************************************************************************
+ *
+ * NAME:
+ *    well_import_rms_ascii.c
+ *
+ * DESCRIPTION:
+ *    Parse the log table part (i.e. after the header) of a RMS ascii well file,
+ *    given as a byte buffer, into a row major table with ncol columns. Blank lines
+ *    are skipped. Any line with another number of values than ncol, or any value
+ *    that is not a plain number, is an error, so the caller can use a more
+ *    forgiving reader instead.
+ *
+ * ARGUMENTS:
+ *    swig_bytes     i     Buffer with file content after header
+ *    swig_bytes_len i     Length of buffer
+ *    ncol           i     Number of columns (i.e. X Y Z and logs)
+ *    table          o     Table of values, allocated in caller (estimated size)
+ *    ntable         i     Length of table
+ *
+ * RETURNS:
+ *    Function: Number of rows read, or -1 if the table cannot be parsed
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+long
+well_import_rms_ascii(char *swig_bytes,
+                      long swig_bytes_len,
+                      int ncol,
+                      double *swig_np_dbl_inplaceflat_v1,
+                      long n_swig_np_dbl_inplaceflat_v1)
+{
+    char *buf = swig_bytes;
+    long nbuf = swig_bytes_len;
+    double *table = swig_np_dbl_inplaceflat_v1;
+    long ntable = n_swig_np_dbl_inplaceflat_v1;
+
+    long pos = 0, end, nval = 0;
+    int icol = 0;
+
+    while (pos < nbuf) {
+        char c = buf[pos];
+
+        if (_isblank(c)) {
+            pos++;
+            continue;
+        }
+
+        if (c == '\n') {
+            if (icol != 0 && icol != ncol)
+                return -1;
+            icol = 0;
+            pos++;
+            continue;
+        }
+
+        if (icol >= ncol || nval >= ntable)
+            return -1;
+
+        /* a number shall be followed by whitespace or end of buffer */
+        end = pos;
+        while (end < nbuf && !_isblank(buf[end]) && buf[end] != '\n')
+            end++;
+
+        if (!x_parse_number(buf, pos, end, &table[nval]))
+            return -1;
+
+        pos = end;
+
+        icol++;
+        nval++;
+    }
+
+    if (icol != 0 && icol != ncol)
+        return -1;
+
+    logger_info(LI, FI, FU, "Parsed %ld rows of well log data", nval / ncol);
+
+    return nval / ncol;
+}
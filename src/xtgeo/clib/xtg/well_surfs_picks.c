@@ -0,0 +1,304 @@
+/*
+****************************************************************************************
+*
+* NAME:
+*    well_surfs_picks.c
+*
+* DESCRIPTION:
+*    Batch version of well_surf_picks.c, for many wells and many surfaces. Each
+*    well trajectory is walked once, and for every segment only the surfaces whose
+*    bounding box (X Y extent and Z range) overlaps the segment bounding box are
+*    sampled. The surface value at a trajectory point is computed at most once per
+*    surface, and shared by the two segments using that point.
+*
+*    The wells are processed in parallel (cf. x_nthreads.c); each well collects its
+*    picks in a private buffer, and buffers are copied to the result in well order,
+*    hence the result does not depend on the number of threads. Within a well, the
+*    picks are in trajectory order, and in surface order within a segment.
+*
+*    The crossing and interpolation rules are the same as in well_surf_picks.c.
+*
+* ARGUMENTS:
+*    xv, yv, zv     i     x y z vectors for all wells, concatenated
+*    mdv            i     mdepth vector, concatenated, note may have UNDEF!
+*    surfv          i     Values for all surfaces, concatenated (UNDEF for undefined)
+*    surfinfo       i     Metadata per surface, SURFINFO values each: ncol, nrow,
+*                         xori, yori, xinc, yinc, yflip, rotation, zmin, zmax, xmin,
+*                         xmax, ymin, ymax (the last 6 is the bounding box)
+*    wellstart      i     Start index per well in the trajectory vectors, plus
+*                         total number of points, i.e. NWELL + 1 values
+*    pickv          o     Picks, PICKDBL values each: x, y, z, md
+*    pickiv         o     Picks, PICKINT values each: well index, surface index,
+*                         direction (1 when crossing from top, -1 from base)
+*
+* RETURNS:
+*    Function: Number of picks found. If the output vectors are too short, the
+*              number of picks is returned as negative, and output is not updated
+*              (call again with longer vectors). If problems:
+*              LONG_MIN: Wrong length of arrays, or cannot allocate memory
+*
+* TODO/ISSUES/BUGS:
+*
+* LICENCE:
+*    cf. XTGeo LICENSE
+****************************************************************************************
+*/
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+#include <limits.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define SURFINFO 14
+#define PICKDBL 4
+#define PICKINT 3
+
+typedef struct
+{
+    long npicks;
+    long nalloc;
+    double *dbl;
+    int *ivl;
+} wellpicks;
+
+static void
+_add_pick(wellpicks *wp,
+          double x,
+          double y,
+          double z,
+          double md,
+          int iwell,
+          int isurf,
+          int direction)
+{
+    if (wp->npicks == wp->nalloc) {
+        wp->nalloc = (wp->nalloc == 0) ? 64 : 2 * wp->nalloc;
+        wp->dbl = realloc(wp->dbl, wp->nalloc * PICKDBL * sizeof(double));
+        wp->ivl = realloc(wp->ivl, wp->nalloc * PICKINT * sizeof(int));
+        if (wp->dbl == NULL || wp->ivl == NULL)
+            logger_critical(LI, FI, FU, "Cannot allocate memory in %s", FU);
+    }
+    double *dbl = wp->dbl + wp->npicks * PICKDBL;
+    int *ivl = wp->ivl + wp->npicks * PICKINT;
+
+    dbl[0] = x;
+    dbl[1] = y;
+    dbl[2] = z;
+    dbl[3] = md;
+    ivl[0] = iwell;
+    ivl[1] = isurf;
+    ivl[2] = direction;
+    wp->npicks++;
+}
+
+static double
+_zdiff(double x,
+       double y,
+       double z,
+       double *surfinfo,
+       double *surfv,
+       long offset)
+{
+    int ncol = (int)surfinfo[0];
+    int nrow = (int)surfinfo[1];
+
+    double zs = surf_get_z_from_xy(x, y, ncol, nrow, surfinfo[2], surfinfo[3],
+                                   surfinfo[4], surfinfo[5], (int)surfinfo[6],
+                                   surfinfo[7], surfv + offset, (long)ncol * nrow);
+    if (zs > UNDEF_LIMIT)
+        return UNDEF;
+    return z - zs;
+}
+
+static void
+_well_picks(int iwell,
+            long i1,
+            long i2,
+            double *xv,
+            double *yv,
+            double *zv,
+            double *mdv,
+            int nsurf,
+            double *surfv,
+            long *surfoffset,
+            double *surfinfo,
+            double *zdprev,
+            int *known,
+            wellpicks *wp)
+{
+    int is;
+    long i;
+
+    for (is = 0; is < nsurf; is++)
+        known[is] = 0;
+
+    for (i = i1 + 1; i < i2; i++) {
+        double x0 = xv[i - 1], x2 = xv[i];
+        double y0 = yv[i - 1], y2 = yv[i];
+        double zz0 = zv[i - 1], zz2 = zv[i];
+
+        double sxmin = (x0 < x2) ? x0 : x2;
+        double sxmax = (x0 < x2) ? x2 : x0;
+        double symin = (y0 < y2) ? y0 : y2;
+        double symax = (y0 < y2) ? y2 : y0;
+        double szmin = (zz0 < zz2) ? zz0 : zz2;
+        double szmax = (zz0 < zz2) ? zz2 : zz0;
+
+        for (is = 0; is < nsurf; is++) {
+            double *info = surfinfo + (long)is * SURFINFO;
+
+            /* the segment cannot cross the surface (nan coordinates also skip) */
+            if (!(szmax >= info[8] && szmin <= info[9] && sxmax >= info[10] &&
+                  sxmin <= info[11] && symax >= info[12] && symin <= info[13])) {
+                known[is] = 0;
+                continue;
+            }
+
+            double z0 = known[is] ? zdprev[is]
+                                  : _zdiff(x0, y0, zz0, info, surfv, surfoffset[is]);
+            double z2 = _zdiff(x2, y2, zz2, info, surfv, surfoffset[is]);
+            zdprev[is] = z2;
+            known[is] = 1;
+
+            if (z0 > UNDEF_LIMIT || z2 > UNDEF_LIMIT)
+                continue;
+
+            if (z0 <= 0 && z2 > 0) {
+                double md = UNDEF;
+                if (mdv[i - 1] < UNDEF_LIMIT && mdv[i] < UNDEF_LIMIT)
+                    md = x_vector_linint3(z0, 0.0, z2, mdv[i - 1], mdv[i]);
+                _add_pick(wp, x_vector_linint3(z0, 0.0, z2, x0, x2),
+                          x_vector_linint3(z0, 0.0, z2, y0, y2),
+                          x_vector_linint3(z0, 0.0, z2, zz0, zz2), md, iwell, is, 1);
+            }
+            if (z0 >= 0 && z2 < 0) {
+                double md = UNDEF;
+                if (mdv[i - 1] < UNDEF_LIMIT && mdv[i] < UNDEF_LIMIT)
+                    md = x_vector_linint3(z2, 0.0, z0, mdv[i], mdv[i - 1]);
+                _add_pick(wp, x_vector_linint3(z2, 0.0, z0, x2, x0),
+                          x_vector_linint3(z2, 0.0, z0, y2, y0),
+                          x_vector_linint3(z2, 0.0, z0, zz2, zz0), md, iwell, is, -1);
+            }
+        }
+    }
+}
+
+long
+well_surfs_picks(double *xv,
+                 long nxv,
+                 double *yv,
+                 long nyv,
+                 double *zv,
+                 long nzv,
+                 double *mdv,
+                 long nmdv,
+                 double *surfv,
+                 long nsurfv,
+                 double *surfinfo,
+                 long nsurfinfo,
+                 int *wellstart,
+                 long nwellstart,
+                 double *pickv,
+                 long npickv,
+                 int *pickiv,
+                 long npickiv)
+{
+    logger_info(LI, FI, FU, "Finding picks, intersections wells and surfaces: %s",
+                FU);
+
+    if (nyv != nxv || nzv != nxv || nmdv != nxv || nwellstart < 1 ||
+        nsurfinfo % SURFINFO != 0 || wellstart[nwellstart - 1] != nxv) {
+        logger_error(LI, FI, FU, "Wrong length of arrays in %s", FU);
+        return LONG_MIN;
+    }
+
+    int nwell = (int)nwellstart - 1;
+    int nsurf = (int)(nsurfinfo / SURFINFO);
+
+    long *surfoffset = calloc(nsurf + 1, sizeof(long));
+    if (surfoffset == NULL) {
+        logger_error(LI, FI, FU, "Cannot allocate memory in %s", FU);
+        return LONG_MIN;
+    }
+    int is;
+    for (is = 0; is < nsurf; is++) {
+        surfoffset[is + 1] =
+          surfoffset[is] + (long)surfinfo[is * SURFINFO] * (long)surfinfo[is * SURFINFO + 1];
+    }
+    if (surfoffset[nsurf] != nsurfv) {
+        logger_error(LI, FI, FU, "Wrong length of surface values in %s", FU);
+        free(surfoffset);
+        return LONG_MIN;
+    }
+
+    wellpicks *picks = calloc(nwell > 0 ? nwell : 1, sizeof(wellpicks));
+    if (picks == NULL) {
+        logger_error(LI, FI, FU, "Cannot allocate memory in %s", FU);
+        free(surfoffset);
+        return LONG_MIN;
+    }
+
+    int nomemory = 0;
+
+    /* wells are independent; may run in parallel (cf. x_nthreads.c) */
+    int nthreads = x_get_nthreads();
+
+    int iw;
+#ifdef _OPENMP
+#pragma omp parallel num_threads(nthreads) if (nthreads > 1)
+#endif
+    {
+        double *zdprev = calloc(nsurf > 0 ? nsurf : 1, sizeof(double));
+        int *known = calloc(nsurf > 0 ? nsurf : 1, sizeof(int));
+
+#ifdef _OPENMP
+#pragma omp for schedule(dynamic)
+#endif
+        for (iw = 0; iw < nwell; iw++) {
+            if (zdprev == NULL || known == NULL) {
+                nomemory = 1;
+                continue;
+            }
+            _well_picks(iw, wellstart[iw], wellstart[iw + 1], xv, yv, zv, mdv, nsurf,
+                        surfv, surfoffset, surfinfo, zdprev, known, &picks[iw]);
+        }
+        free(zdprev);
+        free(known);
+    }
+
+    long ntotal = 0;
+    for (iw = 0; iw < nwell; iw++)
+        ntotal += picks[iw].npicks;
+
+    if (nomemory) {
+        logger_error(LI, FI, FU, "Cannot allocate memory in %s", FU);
+        ntotal = LONG_MIN;
+    } else if (ntotal * PICKDBL <= npickv && ntotal * PICKINT <= npickiv) {
+        long ipick = 0;
+        for (iw = 0; iw < nwell; iw++) {
+            long np = picks[iw].npicks;
+            if (np > 0) {
+                memcpy(pickv + ipick * PICKDBL, picks[iw].dbl,
+                       np * PICKDBL * sizeof(double));
+                memcpy(pickiv + ipick * PICKINT, picks[iw].ivl,
+                       np * PICKINT * sizeof(int));
+            }
+            ipick += np;
+        }
+    } else {
+        logger_info(LI, FI, FU, "Output arrays are too short, need %ld picks", ntotal);
+        ntotal = -ntotal;
+    }
+
+    for (iw = 0; iw < nwell; iw++) {
+        free(picks[iw].dbl);
+        free(picks[iw].ivl);
+    }
+    free(picks);
+    free(surfoffset);
+
+    logger_info(LI, FI, FU, "Finding picks, intersections wells and surfaces, done");
+    return ntotal;
+}
@@ -0,0 +1,77 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    x_hexahedron_volume.c
+ *
+ * DESCRIPTION:
+ *    Compute the bulk volume of a grid cell (hexahedron) given by the 8 corners. The
+ *    cell is the trilinear map of the unit cube, i.e. the faces are bilinear surfaces
+ *    between the corners as in corner point grids. The volume is the integral of the
+ *    Jacobian determinant of the map, which is a polynomial of degree 2 in each
+ *    direction, so 2x2x2 Gauss integration gives the exact volume.
+ *
+ * ARGUMENTS:
+ *    c              i     The corners as 24 length array, ordered as in grd3d_corners
+ *
+ * RETURNS:
+ *    The bulk volume (always positive)
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include <math.h>
+
+double
+x_hexahedron_volume(double *c)
+{
+    /* corner n = a + 2b + 4c for offsets a (I), b (J) and c (K); the derivatives of
+       the trilinear map are bilinear in the edge vectors along each direction */
+    static const double gp[2] = { 0.21132486540518713, 0.78867513459481287 };
+
+    double eu[4][3], ev[4][3], ew[4][3];
+    int n, m;
+
+    for (n = 0; n < 4; n++) {
+        int nu = 2 * n;                  /* 0, 2, 4, 6 */
+        int nv = (n & 1) + 4 * (n >> 1); /* 0, 1, 4, 5 */
+        for (m = 0; m < 3; m++) {
+            eu[n][m] = c[3 * (nu + 1) + m] - c[3 * nu + m];
+            ev[n][m] = c[3 * (nv + 2) + m] - c[3 * nv + m];
+            ew[n][m] = c[3 * (n + 4) + m] - c[3 * n + m];
+        }
+    }
+
+    double vol = 0.0;
+    int i1, i2, i3;
+
+    for (i1 = 0; i1 < 2; i1++) {
+        for (i2 = 0; i2 < 2; i2++) {
+            for (i3 = 0; i3 < 2; i3++) {
+                double u = gp[i1], v = gp[i2], w = gp[i3];
+                /* bilinear weights of the 4 edges for each direction */
+                double wu[4] = { (1 - v) * (1 - w), v * (1 - w), (1 - v) * w, v * w };
+                double wv[4] = { (1 - u) * (1 - w), u * (1 - w), (1 - u) * w, u * w };
+                double ww[4] = { (1 - u) * (1 - v), u * (1 - v), (1 - u) * v, u * v };
+                double ju[3] = { 0.0 }, jv[3] = { 0.0 }, jw[3] = { 0.0 };
+
+                for (n = 0; n < 4; n++) {
+                    for (m = 0; m < 3; m++) {
+                        ju[m] += wu[n] * eu[n][m];
+                        jv[m] += wv[n] * ev[n][m];
+                        jw[m] += ww[n] * ew[n][m];
+                    }
+                }
+                vol += ju[0] * (jv[1] * jw[2] - jv[2] * jw[1]) -
+                       ju[1] * (jv[0] * jw[2] - jv[2] * jw[0]) +
+                       ju[2] * (jv[0] * jw[1] - jv[1] * jw[0]);
+            }
+        }
+    }
+    /* the sign depends on the handedness of the grid */
+    return fabs(0.125 * vol);
+}
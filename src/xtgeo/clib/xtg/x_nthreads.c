@@ -0,0 +1,53 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    x_nthreads.c
+ *
+ * DESCRIPTION:
+ *    Get or set the number of threads to use in (OpenMP) parallel batch routines,
+ *    i.e. grd3d_points_ijk_cells, grd3d_wells_ijk, grd3d_sum_volumes,
+ *    grd3d_cell_geometry, well_surfs_picks, surf_get_zv_from_xyv and
+ *    pol_do_points_inside. The default is 1, i.e. parallel mode is opt-in. A
+ *    value < 1 means all available cores. If the library is compiled without
+ *    OpenMP, then the routines will always run serially.
+ *
+ * ARGUMENTS:
+ *    nthreads       i     Number of threads
+ *
+ * RETURNS:
+ *    The number of threads in effect (x_get_nthreads)
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+static int XTG_NTHREADS = 1;
+
+void
+x_set_nthreads(int nthreads)
+{
+    XTG_NTHREADS = nthreads;
+}
+
+int
+x_get_nthreads(void)
+{
+#ifdef _OPENMP
+    if (XTG_NTHREADS < 1)
+        return omp_get_max_threads();
+    return XTG_NTHREADS;
+#else
+    return 1;
+#endif
+}
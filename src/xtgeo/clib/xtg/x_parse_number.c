@@ -0,0 +1,129 @@
+/*
+****************************************************************************************
+ *
+ * NAME:
+ *    x_parse_number.c
+ *
+ * DESCRIPTION:
+ *    Parse one number token buf[start:end] from a character buffer, e.g. in ASCII
+ *    well or grid files. If the mantissa has at most 15-16 significant digits and
+ *    the exponent is small, mantissa and power of ten are both exact doubles and
+ *    one multiplication/division gives the correctly rounded value (same as
+ *    strtod). Otherwise strtod is used.
+ *
+ * ARGUMENTS:
+ *    buf            i     Character buffer; strtod may read beyond end, hence the
+ *                         token must be followed by a non-number character or \0
+ *    start, end     i     Token range
+ *    value          o     The number
+ *
+ * RETURNS:
+ *    1 on success, 0 if the token is not a number
+ *
+ * TODO/ISSUES/BUGS:
+ *
+ * LICENCE:
+ *    cf. XTGeo LICENSE
+ ***************************************************************************************
+ */
+
+#include <stdlib.h>
+#include "libxtg.h"
+#include "libxtg_.h"
+
+/* exact powers of ten as doubles */
+static const double POW10[] = { 1e0,  1e1,  1e2,  1e3,  1e4,  1e5,  1e6,  1e7,
+                                1e8,  1e9,  1e10, 1e11, 1e12, 1e13, 1e14, 1e15,
+                                1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22 };
+
+#define MAXMANT 9007199254740992ULL /* 2^53 */
+
+static int
+_isdigit(char c)
+{
+    return (c >= '0' && c <= '9');
+}
+
+int
+x_parse_number(char *buf, long start, long end, double *value)
+{
+    long i = start;
+    int neg = 0, ndig = 0, nsig = 0, exp10 = 0, eneg = 0, eval = 0;
+    int exact = 1;
+    unsigned long long mant = 0;
+    char *endp = NULL;
+
+    if (i < end && (buf[i] == '-' || buf[i] == '+')) {
+        neg = (buf[i] == '-');
+        i++;
+    }
+
+    while (i < end && _isdigit(buf[i])) {
+        if (nsig < 19) {
+            mant = mant * 10 + (unsigned long long)(buf[i] - '0');
+            if (mant > 0)
+                nsig++;
+        } else {
+            exp10++;
+            exact = 0;
+        }
+        ndig++;
+        i++;
+    }
+
+    if (i < end && buf[i] == '.') {
+        i++;
+        while (i < end && _isdigit(buf[i])) {
+            if (nsig < 19) {
+                mant = mant * 10 + (unsigned long long)(buf[i] - '0');
+                if (mant > 0)
+                    nsig++;
+                exp10--;
+            } else if (buf[i] != '0') {
+                exact = 0;
+            }
+            ndig++;
+            i++;
+        }
+    }
+
+    if (ndig == 0)
+        return 0;
+
+    if (i < end && (buf[i] == 'e' || buf[i] == 'E')) {
+        i++;
+        if (i < end && (buf[i] == '-' || buf[i] == '+')) {
+            eneg = (buf[i] == '-');
+            i++;
+        }
+        if (i >= end || !_isdigit(buf[i]))
+            return 0;
+        while (i < end && _isdigit(buf[i])) {
+            if (eval < 10000)
+                eval = eval * 10 + (buf[i] - '0');
+            i++;
+        }
+        exp10 += eneg ? -eval : eval;
+    }
+
+    /* the complete token shall be a number */
+    if (i != end)
+        return 0;
+
+    if (exact && mant <= MAXMANT && exp10 >= -22 && exp10 <= 22) {
+        *value = (double)mant;
+        if (exp10 < 0) {
+            *value /= POW10[-exp10];
+        } else {
+            *value *= POW10[exp10];
+        }
+        if (neg)
+            *value = -*value;
+    } else {
+        *value = strtod(buf + start, &endp);
+        if (endp != buf + end)
+            return 0;
+    }
+
+    return 1;
+}
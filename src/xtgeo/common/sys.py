@@ -25,6 +25,98 @@ xtg = XTGeoDialog()
 logger = xtg.functionlogger(__file__)
 
 
+def set_nthreads(nthreads):
+    """Set the number of threads used by parallel batch routines in the C library.
+
+    This applies to finding grid cells for points (Grid.get_ijk_from_points())
+    and for many wells (Wells.make_ijk_from_grid() with algorithm=1, one well per
+    thread), cell geometry and volumes for grids (Grid.get_cell_geometry(),
+    Grid.get_bulk_volume(), Grid.get_volumes()), surface picks for many wells
+    (Wells.get_surface_picks()), sampling surface values in points, and finding
+    points inside polygons. Other routines, such as blocking a single well
+    (Well.make_ijk_from_grid()), run serially. The default is 1, i.e. serial. A
+    value < 1 means all available cores. The default can also be given by the
+    environment variable XTG_NTHREADS.
+
+    If XTGeo is compiled without OpenMP support, the routines will always run
+    serially.
+
+    Args:
+        nthreads (int): Number of threads.
+
+    Example::
+
+        xtgeo.set_nthreads(8)
+
+    .. versionadded:: 2.8.0
+    """
+    _cxtgeo.x_set_nthreads(int(nthreads))
+
+
+def get_nthreads():
+    """Get the number of threads in effect for parallel batch routines in C.
+
+    Returns 1 if XTGeo is compiled without OpenMP support.
+
+    .. versionadded:: 2.8.0
+    """
+    return _cxtgeo.x_get_nthreads()
+
+
+def _nthreads_from_env():
+    """Number of threads from XTG_NTHREADS; 1 if not set or not an integer."""
+    nthreads = os.environ.get("XTG_NTHREADS", "1")
+    try:
+        return int(nthreads)
+    except ValueError:
+        xtg.warn(
+            "Invalid value XTG_NTHREADS={!r}, shall be an integer. "
+            "Use 1 thread".format(nthreads)
+        )
+        return 1
+
+
+set_nthreads(_nthreads_from_env())
+
+
+_ECLINDEX_CACHE = os.environ.get("XTG_ECLINDEX_CACHE", None)
+
+
+def set_eclindex_cache(location):
+    """Set where keyword indices of Eclipse binary files (INIT, UNRST, ...) are cached.
+
+    Scanning keywords in a large restart file takes time, since the complete file
+    is read record by record. If a cache location is set, the index of keywords,
+    dates and byte positions is stored the first time a file is scanned, and
+    reused when the same file (same path, size and modification time) is scanned
+    or imported later.
+
+    The default is no cache. The default can also be given by the environment
+    variable XTG_ECLINDEX_CACHE.
+
+    Args:
+        location (str): None for no cache, "sidecar" to store the index as a
+            hidden file next to the Eclipse file, or the name of a folder (e.g. a
+            user cache folder) where the indices shall be stored.
+
+    Example::
+
+        xtgeo.set_eclindex_cache("sidecar")
+
+    .. versionadded:: 2.8.0
+    """
+    global _ECLINDEX_CACHE  # pylint: disable=global-statement
+    _ECLINDEX_CACHE = location
+
+
+def get_eclindex_cache():
+    """Get the cache location for keyword indices of Eclipse binary files.
+
+    .. versionadded:: 2.8.0
+    """
+    return _ECLINDEX_CACHE
+
+
 def check_folder(fname, raiseerror=None):
     """General function to check folder"""
     _nn = _XTGeoCFile(fname)
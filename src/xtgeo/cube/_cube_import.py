@@ -5,20 +5,21 @@ import segyio
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 import xtgeo.common.calc as xcalc
 from xtgeo.common import XTGeoDialog
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def import_segy(self, sfile, engine="segyio"):
+def import_segy(self, sfile, engine="segyio", lazy=False, cachesize=None):
     if engine == "segyio":
-        _import_segy_io(self, sfile)
+        _import_segy_io(self, sfile, lazy=lazy, cachesize=cachesize)
     else:
         pass
         # _import_segy_xtgeo()
 
 
-def _import_segy_io(self, sfile):
+def _import_segy_io(self, sfile, lazy=False, cachesize=None):
     """Import SEGY via Statoils FOSS SegyIO library.
 
     Args:
@@ -26,6 +27,9 @@ def _import_segy_io(self, sfile):
         sfile (str): File name of SEGY file
         undef (float): If None, dead traces (undef) are read as is, but
             if a a value, than dead traces get this value.
+        lazy (bool): If True, only headers are read, and the file is kept open
+            so values are read on demand.
+        cachesize (float): Max size (MB) of cached values if lazy.
     """
 
     # pylint: disable=too-many-statements
@@ -36,10 +40,19 @@ def _import_segy_io(self, sfile):
     with segyio.open(sfile, "r") as segyfile:
         segyfile.mmap()
 
-        values = segyio.tools.cube(segyfile)
+        if lazy:
+            values = None
+            ilsort = segyfile.sorting == segyio.TraceSortingFormat.INLINE_SORTING
+            ncol = len(segyfile.ilines if ilsort else segyfile.xlines)
+            nrow = len(segyfile.xlines if ilsort else segyfile.ilines)
+            nlay = len(segyfile.samples)
+        else:
+            values = segyio.tools.cube(segyfile)
 
-        if np.isnan(np.sum(values)):
-            raise ValueError("The input contains NaN values which is trouble!")
+            if np.isnan(np.sum(values)):
+                raise ValueError("The input contains NaN values which is trouble!")
+
+            ncol, nrow, nlay = values.shape
 
         logger.debug(segyfile.fast)
         logger.debug(segyfile.ilines)
@@ -47,8 +60,6 @@ def _import_segy_io(self, sfile):
         ilines = segyfile.ilines
         xlines = segyfile.xlines
 
-        ncol, nrow, nlay = values.shape
-
         trcode = segyio.TraceField.TraceIdentificationCode
         traceidcodes = segyfile.attributes(trcode)[:].reshape(ncol, nrow)
 
@@ -111,6 +122,11 @@ def _import_segy_io(self, sfile):
         logger.debug("XTGeo rotation is %s", rotation)
 
     # attributes to update
+    if lazy:
+        if cachesize is None:
+            cachesize = _cube_lazy.CACHESIZE
+        self._lazytraces = _cube_lazy._SegyTraces(sfile, ncol, nrow, nlay, cachesize)
+
     self._ilines = ilines
     self._xlines = xlines
     self._ncol = ncol
@@ -0,0 +1,277 @@
+"""Cube values read on demand from a (memory mapped) SEGY file."""
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+from collections import OrderedDict
+import math
+
+import numpy as np
+
+import segyio
+import xtgeo
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+# pylint: disable=protected-access
+
+# default size (MB) of the cache of bricks for a lazy cube
+CACHESIZE = 256
+
+# number of cube nodes added around a sampling footprint
+PAD = 2
+
+
+class _SegyTraces(object):
+    """Keep a SEGY file open (memory mapped) and read traces on demand.
+
+    The traces are ordered as in segyio.tools.cube(), i.e. trace number
+    ``icol * nrow + jrow`` holds cube column icol and row jrow (zero based). Reads
+    are done per brick, i.e. all traces along one column, which is one contiguous
+    read in the file. The bricks are kept in a LRU cache which is bounded by
+    cachesize (MB).
+    """
+
+    def __init__(self, sfile, ncol, nrow, nlay, cachesize=CACHESIZE):
+        self._segyfile = segyio.open(sfile, "r")
+        self._segyfile.mmap()
+
+        self._ncol = ncol
+        self._nrow = nrow
+        self._nlay = nlay
+
+        bricksize = 4.0 * nrow * nlay
+        self._maxbricks = max(1, int(cachesize * 1024 * 1024 / bricksize))
+        self._bricks = OrderedDict()
+
+        logger.info("Lazy cube, keeps max %s bricks in cache", self._maxbricks)
+
+    def close(self):
+        """Close the file and clear the cache."""
+        self._bricks.clear()
+        if self._segyfile is not None:
+            self._segyfile.close()
+            self._segyfile = None
+
+    @staticmethod
+    def _checknan(values):
+        if np.isnan(values).any():
+            raise ValueError("The input contains NaN values which is trouble!")
+        return values
+
+    def brick(self, icol):
+        """Return all traces along column icol as a read only (nrow, nlay) array."""
+
+        if icol in self._bricks:
+            self._bricks[icol] = self._bricks.pop(icol)  # most recently used
+            return self._bricks[icol]
+
+        start = icol * self._nrow
+        values = self._segyfile.trace.raw[start : start + self._nrow]
+        values = self._checknan(values.reshape(self._nrow, self._nlay))
+        values.flags.writeable = False
+
+        self._bricks[icol] = values
+        while len(self._bricks) > self._maxbricks:
+            self._bricks.popitem(last=False)
+
+        return values
+
+    def xline(self, jrow):
+        """Return all traces along row jrow as a (ncol, nlay) array."""
+        values = self._segyfile.trace.raw[jrow :: self._nrow]
+        return self._checknan(values.reshape(self._ncol, self._nlay))
+
+    def zslice(self, klay):
+        """Return sample klay of all traces as a (ncol, nrow) array."""
+        values = self._segyfile.depth_slice[klay]
+        return self._checknan(values.reshape(self._ncol, self._nrow))
+
+    def subvalues(self, icols, jrows, klays):
+        """Return a 3D array for the zero based (start, stop) ranges given."""
+
+        icol1, icol2 = icols
+        jrow1, jrow2 = jrows
+        klay1, klay2 = klays
+
+        values = np.empty(
+            (icol2 - icol1, jrow2 - jrow1, klay2 - klay1), dtype=np.float32
+        )
+        for icol in range(icol1, icol2):
+            values[icol - icol1] = self.brick(icol)[jrow1:jrow2, klay1:klay2]
+
+        return values
+
+    def values(self):
+        """Return the complete 3D array (which is not cached)."""
+        values = self._segyfile.trace.raw[:]
+        return self._checknan(values.reshape(self._ncol, self._nrow, self._nlay))
+
+
+def load_values(self):
+    """Read all values of a lazy cube and detach it from the file."""
+
+    logger.info("Load all values for lazy cube from %s", self._segyfile)
+    values = self._lazytraces.values()
+    close(self)
+    return values
+
+
+def close(self):
+    """Close the file of a lazy cube, if any."""
+
+    if self._lazytraces is not None:
+        self._lazytraces.close()
+        self._lazytraces = None
+
+
+def get_iline(self, iline):
+    """Return values along an inline number as (nrow, nlay) array."""
+
+    icol = _index(self._ilines, iline, "inline")
+    if self._lazytraces is not None:
+        return self._lazytraces.brick(icol).copy()
+    return self._values[icol, :, :].copy()
+
+
+def get_xline(self, xline):
+    """Return values along a xline number as (ncol, nlay) array."""
+
+    jrow = _index(self._xlines, xline, "xline")
+    if self._lazytraces is not None:
+        return self._lazytraces.xline(jrow)
+    return self._values[:, jrow, :].copy()
+
+
+def get_zslice(self, zslice):
+    """Return values for a time/depth value as (ncol, nrow) array."""
+
+    klay = _index(self.zslices, zslice, "zslice")
+    if self._lazytraces is not None:
+        return self._lazytraces.zslice(klay)
+    return self._values[:, :, klay].copy()
+
+
+def _index(numbers, number, name):
+    """Return the zero based index of a line number, or raise a ValueError."""
+
+    index = np.where(np.asarray(numbers) == number)[0]
+    if index.size == 0:
+        raise ValueError("No such {} in cube: {}".format(name, number))
+    return int(index[0])
+
+
+def ij_from_xy(self, xcoords, ycoords):
+    """Return the (float, zero based) cube node indices of XY coordinates."""
+
+    rot = math.radians(self._rotation)
+    xdist = np.asarray(xcoords, dtype=np.float64) - self._xori
+    ydist = np.asarray(ycoords, dtype=np.float64) - self._yori
+
+    icol = (xdist * math.cos(rot) + ydist * math.sin(rot)) / self._xinc
+    jrow = (-xdist * math.sin(rot) + ydist * math.cos(rot)) / self._yinc
+
+    return icol, jrow * self._yflip
+
+
+def xy_from_ij(self, icol, jrow):
+    """Return XY coordinates of (zero based) cube node indices."""
+
+    rot = math.radians(self._rotation)
+    icol = np.asarray(icol, dtype=np.float64) * self._xinc
+    jrow = np.asarray(jrow, dtype=np.float64) * self._yinc * self._yflip
+
+    xcoords = self._xori + icol * math.cos(rot) - jrow * math.sin(rot)
+    ycoords = self._yori + icol * math.sin(rot) + jrow * math.cos(rot)
+
+    return xcoords, ycoords
+
+
+def _limits(fmin, fmax, nmax):
+    """Return (start, stop) of indices covering fmin, fmax with a padding."""
+
+    start = int(max(0, math.floor(fmin) - PAD))
+    stop = int(min(nmax, math.ceil(fmax) + PAD + 1))
+
+    # at least 2 nodes if possible, so interpolation has neighbours
+    start = max(0, min(start, nmax - 2))
+    stop = min(nmax, max(stop, start + 2))
+
+    return start, stop
+
+
+def subcube(self, xcoords, ycoords, zmin, zmax):
+    """Return an in-memory Cube that covers the given points and Z range.
+
+    The subcube is the part of a lazy cube that sampling at XY points within
+    zmin, zmax will use, padded with PAD nodes. Sampling in the subcube hence gives
+    the same result as sampling in the full cube. Points outside the cube are
+    outside the subcube as well.
+    """
+
+    icol, jrow = ij_from_xy(self, xcoords, ycoords)
+
+    inside = (
+        (icol > -PAD)
+        & (icol < self._ncol - 1 + PAD)
+        & (jrow > -PAD)
+        & (jrow < self._nrow - 1 + PAD)
+    )
+    if inside.any():
+        icols = _limits(icol[inside].min(), icol[inside].max(), self._ncol)
+        jrows = _limits(jrow[inside].min(), jrow[inside].max(), self._nrow)
+    else:
+        icols = _limits(0, 0, self._ncol)
+        jrows = _limits(0, 0, self._nrow)
+
+    klays = _limits(
+        (zmin - self._zori) / self._zinc, (zmax - self._zori) / self._zinc, self._nlay
+    )
+    if klays[0] >= klays[1]:
+        klays = _limits(0, 0, self._nlay)
+
+    logger.info("Subcube of lazy cube: %s %s %s", icols, jrows, klays)
+
+    values = self._lazytraces.subvalues(icols, jrows, klays)
+
+    ier, xori, yori = _cxtgeo.cube_xy_from_ij(
+        1 + icols[0],
+        1 + jrows[0],
+        self._xori,
+        self._xinc,
+        self._yori,
+        self._yinc,
+        self._ncol,
+        self._nrow,
+        self._yflip,
+        self._rotation,
+        0,
+    )
+    if ier != 0:
+        raise RuntimeError("Unexpected error, code is {}".format(ier))
+
+    sub = xtgeo.Cube(
+        ncol=values.shape[0],
+        nrow=values.shape[1],
+        nlay=values.shape[2],
+        xinc=self._xinc,
+        yinc=self._yinc,
+        zinc=self._zinc,
+        xori=xori,
+        yori=yori,
+        zori=self._zori + klays[0] * self._zinc,
+        yflip=self._yflip,
+        rotation=self._rotation,
+        values=values,
+    )
+    sub._ilines = self._ilines[icols[0] : icols[1]].copy()
+    sub._xlines = self._xlines[jrows[0] : jrows[1]].copy()
+    sub._traceidcodes = self._traceidcodes[
+        icols[0] : icols[1], jrows[0] : jrows[1]
+    ].copy()
+    sub._segyfile = self._segyfile
+    sub._filesrc = self._filesrc
+
+    return sub
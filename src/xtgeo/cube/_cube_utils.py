@@ -7,10 +7,12 @@ import numpy as np
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 
-#
+# number of fence points per subcube for randomlines in a lazy cube
+FENCECHUNK = 64
 
 
 logger = xtg.functionlogger(__name__)
@@ -149,6 +151,13 @@ def resample(self, other, sampling="nearest", outside_value=None):
     """Resample another cube to the current self"""
     # TODO: traceidcodes
 
+    if other.lazy:
+        # read only the part of other that covers the nodes of self
+        icol, jrow = np.meshgrid(range(self.ncol), range(self.nrow), indexing="ij")
+        xcoords, ycoords = _cube_lazy.xy_from_ij(self, icol.ravel(), jrow.ravel())
+        zmax = self.zori + (self.nlay - 1) * self.zinc
+        other = _cube_lazy.subcube(other, xcoords, ycoords, self.zori, zmax)
+
     values1a = self.values.reshape(-1)
     values2a = other.values.reshape(-1)
 
@@ -286,12 +295,36 @@ def get_randomline(
 
     nzsam = int((zmax - zmin) / zincrement) + 1
 
-    nsamples = xcoords.shape[0] * nzsam
-
     option = 0
     if sampling == "trilinear":
         option = 1
 
+    if self.lazy:
+        # each fence point is sampled independently, so use a (small) subcube per
+        # chunk of the fence
+        values = []
+        for start in range(0, xcoords.shape[0], FENCECHUNK):
+            xchunk = xcoords[start : start + FENCECHUNK]
+            ychunk = ycoords[start : start + FENCECHUNK]
+            sub = _cube_lazy.subcube(self, xchunk, ychunk, zmin, zmax)
+            values.append(
+                _randomline_values(sub, xchunk, ychunk, zmin, zmax, nzsam, option)
+            )
+        values = np.concatenate(values)
+    else:
+        values = _randomline_values(
+            self, xcoords, ycoords, zmin, zmax, nzsam, option
+        )
+
+    values[values > xtgeo.UNDEF_LIMIT] = np.nan
+    arr = values.reshape((xcoords.shape[0], nzsam)).T
+
+    return (hcoords[0], hcoords[-1], zmin, zmax, arr)
+
+
+def _randomline_values(self, xcoords, ycoords, zmin, zmax, nzsam, option):
+    """Sample the cube along the fence points, nzsam values per point"""
+
     _ier, values = _cxtgeo.cube_get_randomline(
         xcoords,
         ycoords,
@@ -309,15 +342,11 @@ def get_randomline(
         self._ncol,
         self._nrow,
         self._nlay,
-        self._values.reshape(-1),
-        nsamples,
+        self.values.reshape(-1),
+        xcoords.shape[0] * nzsam,
         option,
     )
-
-    values[values > xtgeo.UNDEF_LIMIT] = np.nan
-    arr = values.reshape((xcoords.shape[0], nzsam)).T
-
-    return (hcoords[0], hcoords[-1], zmin, zmax, arr)
+    return values
 
 
 def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
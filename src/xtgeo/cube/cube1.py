@@ -17,6 +17,7 @@ from xtgeo.cube import _cube_import
 from xtgeo.cube import _cube_export
 from xtgeo.cube import _cube_utils
 from xtgeo.cube import _cube_roxapi
+from xtgeo.cube import _cube_lazy
 
 
 xtg = XTGeoDialog()
@@ -27,22 +28,26 @@ logger = xtg.functionlogger(__name__)
 # METHODS as wrappers to class init + import
 
 
-def cube_from_file(mfile, fformat="guess"):
+def cube_from_file(mfile, fformat="guess", lazy=False, cachesize=None):
     """This makes an instance of a Cube directly from file import.
 
     Args:
         mfile (str): Name of file
         fformat (str): See :meth:`Cube.from_file`
+        lazy (bool): See :meth:`Cube.from_file`
+        cachesize (float): See :meth:`Cube.from_file`
 
     Example::
 
         import xtgeo
         mycube = xtgeo.cube_from_file('some_cube.segy')
+
+    .. versionchanged:: 2.8.0 Added lazy and cachesize keys
     """
 
     obj = Cube()
 
-    obj.from_file(mfile, fformat=fformat)
+    obj.from_file(mfile, fformat=fformat, lazy=lazy, cachesize=cachesize)
 
     return obj
 
@@ -91,6 +96,9 @@ class Cube(object):  # pylint: disable=too-many-public-methods
         # or from a file
         mycube = Cube('somefile.segy')
 
+        # or from a SEGY file where values are read on demand
+        mycube = Cube('somefile.segy', lazy=True)
+
     """
 
     def __init__(self, *args, **kwargs):
@@ -98,6 +106,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
 
         self._filesrc = None
         self._segyfile = None
+        self._lazytraces = None
         self._ilines = None
         self._xlines = None
         self._xori = 0.0
@@ -120,7 +129,9 @@ class Cube(object):  # pylint: disable=too-many-public-methods
 
         if len(args) >= 1:
             fformat = kwargs.get("fformat", "guess")
-            self.from_file(args[0], fformat=fformat)
+            lazy = kwargs.get("lazy", False)
+            cachesize = kwargs.get("cachesize", None)
+            self.from_file(args[0], fformat=fformat, lazy=lazy, cachesize=cachesize)
         else:
             self._filesrc = None
             self._xori = kwargs.get("xori", 0.0)
@@ -145,7 +156,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             self._segyfile = kwargs.get("segyfile", None)
 
     def __repr__(self):
-        avg = self.values.mean()
+        avg = "(lazy)" if self.lazy else self.values.mean()
         dsc = (
             "{0.__class__} (ncol={0.ncol!r}, "
             "nrow={0.nrow!r}, nlay={0.nlay!r}, "
@@ -308,9 +319,24 @@ class Cube(object):  # pylint: disable=too-many-public-methods
     def filesrc(self, name):
         self._filesrc = name
 
+    @property
+    def lazy(self):
+        """True if values are read on demand from a SEGY file (read-only).
+
+        For a lazy cube, reading the ``values`` will load all values and detach the
+        cube from file, while e.g. :meth:`get_iline`, :meth:`get_xline`,
+        :meth:`get_zslice`, :meth:`get_randomline`, :meth:`resample` (as input) and
+        cube slicing from surfaces will only read the traces needed.
+
+        .. versionadded:: 2.8.0
+        """
+        return self._lazytraces is not None
+
     @property
     def values(self):
         """The values, as a 3D numpy (ncol, nrow, nlay), 4 byte float."""
+        if self._values is None and self._lazytraces is not None:
+            self._values = _cube_lazy.load_values(self)
         return self._values
 
     @values.setter
@@ -326,6 +352,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
 
         values = np.ascontiguousarray(values, dtype=np.float32)
 
+        _cube_lazy.close(self)
         self._values = values
 
     # =========================================================================
@@ -347,17 +374,21 @@ class Cube(object):  # pylint: disable=too-many-public-methods
         dsc.txt("Inlines vector", self._ilines)
         dsc.txt("Xlines vector", self._xlines)
         dsc.txt("Time or depth slices vector", self.zslices)
-        dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
+        if self.lazy:
+            dsc.txt("Values", "Read on demand (lazy)")
+        else:
+            dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
         np.set_printoptions(threshold=1000)
-        dsc.txt(
-            "Values, mean, stdev, minimum, maximum",
-            self.values.mean(),
-            self.values.std(),
-            self.values.min(),
-            self.values.max(),
-        )
+        if not self.lazy:
+            dsc.txt(
+                "Values, mean, stdev, minimum, maximum",
+                self.values.mean(),
+                self.values.std(),
+                self.values.min(),
+                self.values.max(),
+            )
         dsc.txt("Trace ID codes", self._traceidcodes.reshape(-1))
-        msize = float(self.values.size * 4) / (1024 * 1024 * 1024)
+        msize = float(self.ncol * self.nrow * self.nlay * 4) / (1024 * 1024 * 1024)
         dsc.txt("Minimum memory usage of array (GB)", msize)
 
         if flush:
@@ -525,12 +556,13 @@ class Cube(object):  # pylint: disable=too-many-public-methods
         """
 
         try:
-            logger.info(self._values.shape)
+            values = self.values
+            logger.info(values.shape)
             logger.info(self._traceidcodes.shape)
-            minval = self._values[self._traceidcodes == 2].min()
-            maxval = self._values[self._traceidcodes == 2].max()
+            minval = values[self._traceidcodes == 2].min()
+            maxval = values[self._traceidcodes == 2].max()
             avgold = 0.5 * (minval + maxval)
-            self._values[self._traceidcodes == 2] = newvalue
+            values[self._traceidcodes == 2] = newvalue
         except ValueError:
             avgold = None
 
@@ -559,6 +591,60 @@ class Cube(object):  # pylint: disable=too-many-public-methods
     # Cube extractions, e.g. XSection
     # =========================================================================
 
+    def get_iline(self, iline):
+        """Get the values along an inline.
+
+        For a lazy cube, only the traces of this inline are read from file.
+
+        Args:
+            iline (int): Inline number, as in :attr:`ilines`
+
+        Returns:
+            A 2D numpy (nrow, nlay) with values
+
+        Raises:
+            ValueError: If the inline is not in the cube
+
+        .. versionadded:: 2.8.0
+        """
+        return _cube_lazy.get_iline(self, iline)
+
+    def get_xline(self, xline):
+        """Get the values along a xline.
+
+        For a lazy cube, only the traces of this xline are read from file.
+
+        Args:
+            xline (int): Xline number, as in :attr:`xlines`
+
+        Returns:
+            A 2D numpy (ncol, nlay) with values
+
+        Raises:
+            ValueError: If the xline is not in the cube
+
+        .. versionadded:: 2.8.0
+        """
+        return _cube_lazy.get_xline(self, xline)
+
+    def get_zslice(self, zslice):
+        """Get the values of a time or depth slice.
+
+        For a lazy cube, only this sample is read from each trace.
+
+        Args:
+            zslice (int): Time or depth value, as in :attr:`zslices`
+
+        Returns:
+            A 2D numpy (ncol, nrow) with values
+
+        Raises:
+            ValueError: If the slice is not in the cube
+
+        .. versionadded:: 2.8.0
+        """
+        return _cube_lazy.get_zslice(self, zslice)
+
     def get_randomline(
         self,
         fencespec,
@@ -639,7 +725,9 @@ class Cube(object):  # pylint: disable=too-many-public-methods
     # Import and export
     # =========================================================================
 
-    def from_file(self, sfile, fformat="guess", engine="segyio"):
+    def from_file(
+        self, sfile, fformat="guess", engine="segyio", lazy=False, cachesize=None
+    ):
         """Import cube data from file.
 
         If fformat is not provided, the file type will be guessed based
@@ -653,6 +741,11 @@ class Cube(object):  # pylint: disable=too-many-public-methods
                 while 'segyio' uses the SEGYIO library (default)
             deadtraces (float): Set 'dead' trace values to this value (SEGY
                 only). Default is UNDEF value (a very large number)
+            lazy (bool): If True (SEGY with segyio engine only), the file is kept
+                open (memory mapped) and values are read on demand, see
+                :attr:`lazy`. Default is False.
+            cachesize (float): Max size in MB of values kept in memory between reads
+                for a lazy cube. Default is 256.
 
         Raises:
             IOError if the file cannot be read (e.g. not found)
@@ -662,6 +755,11 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             >>> zz = Cube()
             >>> zz.from_file('some.segy')
 
+            >>> # a large cube; read traces on demand
+            >>> zz.from_file('some_large.segy', lazy=True, cachesize=1000)
+            >>> inline = zz.get_iline(1200)
+
+        .. versionchanged:: 2.8.0 Added lazy and cachesize keys
 
         """
         fobj = xtgeosys._XTGeoCFile(sfile)
@@ -676,10 +774,14 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             else:
                 fformat = fext.lower()
 
+        _cube_lazy.close(self)
+
         if "rms" in fformat:
             _cube_import.import_rmsregular(self, fobj.name)
         elif fformat == "segy" or fformat == "sgy":
-            _cube_import.import_segy(self, fobj.name, engine=engine)
+            _cube_import.import_segy(
+                self, fobj.name, engine=engine, lazy=lazy, cachesize=cachesize
+            )
         elif fformat == "storm":
             _cube_import.import_stormcube(self, fobj.name)
         else:
@@ -731,6 +833,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             zz.from_roxar(project, 'truth_reek_seismic_depth_2000', folder="alt/depth")
 
         """
+        _cube_lazy.close(self)
         _cube_roxapi.import_cube_roxapi(self, project, name, folder=folder)
 
     def to_roxar(
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Streaming reader of GRDECL (Eclipse ASCII) files, in one pass and in chunks.
+
+The file is read in chunks of bytes, and the values of large records (COORD,
+ZCORN, ACTNUM, properties) are parsed in C directly from the chunk into numpy
+arrays. Comments, repeat counts (n*value) and INCLUDE are handled.
+
+As in Eclipse, a keyword starts with a letter in the first column of a line. Only
+the keywords asked for are given as records; anything else, e.g. keywords without
+data (NEWTRAN, ECHO, ...) or records of other keywords, is skipped.
+
+Example::
+
+    for kwname, record in grdecl_records("grid.grdecl", ("SPECGRID", "COORD")):
+        if kwname == "SPECGRID":
+            ncol, nrow, nlay = [int(val) for val in record.read_tokens()[0:3]]
+        ...
+
+A record that is not read by the caller is skipped.
+"""
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import os
+import re
+
+import numpy as np
+
+import xtgeo
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+
+xtg = xtgeo.common.XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+CHUNKSIZE = 16 * 1024 * 1024
+
+MAXINCLUDE = 20
+
+_KEYWORD = re.compile(br"[A-Za-z][A-Za-z0-9_+-]*")
+
+
+class _GrdeclRecord(object):
+    """Read values of the current record in a GRDECL file."""
+
+    def __init__(self, stream, kwname):
+        self._stream = stream
+        self.kwname = kwname
+        self.ended = False
+        # position in buffer, number filled, pending repeat count and value
+        self._state = np.zeros(4, dtype=np.float64)
+
+    def _parse(self, values, option=0):
+        """Parse from stream into values until full, record end or end of file."""
+
+        stream = self._stream
+        state = self._state
+        state[1] = 0
+
+        while True:
+            state[0] = stream.pos
+            status = _cxtgeo.grd3d_read_grdecl_values(
+                stream.buffer, int(stream.eof), values, state, option
+            )
+            stream.pos = int(state[0])
+
+            if status == 0 and not stream.eof:
+                stream.more()
+                continue
+
+            if status == -1:
+                raise ValueError(
+                    "Cannot parse {} in record {} in {}, near: {}".format(
+                        stream.token(), self.kwname, stream.filename, stream.context()
+                    )
+                )
+            if status in (0, 1):
+                self.ended = True
+
+            return int(state[1])
+
+    def read_values(self, values):
+        """Read values into a 1D float64 array, which shall be filled completely."""
+
+        nfill = self._parse(values)
+        if nfill < values.size:
+            raise ValueError(
+                "Too few values in record {} in {}: got {}, expected {}".format(
+                    self.kwname, self._stream.filename, nfill, values.size
+                )
+            )
+
+    def end(self):
+        """Read the terminating slash; there shall be no more values in record."""
+
+        if self.ended:
+            return
+        if self._parse(np.zeros(0, dtype=np.float64)) > 0 or not self.ended:
+            raise ValueError(
+                "Too many values in record {} in {}".format(
+                    self.kwname, self._stream.filename
+                )
+            )
+
+    def skip(self):
+        """Skip rest of record, which may have any type of values."""
+
+        if not self.ended:
+            self._state[2] = 0
+            self._parse(np.zeros(0, dtype=np.float64), option=1)
+
+    def read_tokens(self):
+        """Read rest of a (small) record as list of strings, e.g. for SPECGRID.
+
+        Repeat counts are not expanded, and quotes are removed.
+        """
+
+        stream = self._stream
+        stream.mark = stream.pos  # keep the record in buffer while reading
+        self.skip()
+        text = stream.buffer[stream.mark : stream.pos].decode("latin-1")
+        stream.mark = None
+
+        tokens = re.findall(r"'[^']*'|--[^\n]*|[^\s'/]+", text)
+        return [token.strip("'") for token in tokens if not token.startswith("--")]
+
+
+class _GrdeclStream(object):
+    """A GRDECL file read in chunks."""
+
+    def __init__(self, filename, chunksize=CHUNKSIZE):
+        self.filename = filename
+        self._file = open(filename, "rb")
+        self._chunksize = chunksize
+        # a keyword shall follow a newline, also on the first line
+        self.buffer = b"\n"
+        self.pos = 0
+        self.mark = None
+        self.eof = False
+
+    def close(self):
+        self._file.close()
+
+    def more(self):
+        """Read next chunk, keeping the unread part of the buffer.
+
+        The byte in front of the current position is also kept, as a keyword is
+        recognized by the newline in front.
+        """
+
+        chunk = self._file.read(self._chunksize)
+        keep = max(self.pos - 1, 0)
+        if self.mark is not None:
+            keep = min(self.mark, keep)
+        self.buffer = self.buffer[keep:] + chunk
+        self.pos -= keep
+        if self.mark is not None:
+            self.mark -= keep
+        if not chunk:
+            self.eof = True
+
+    def token(self):
+        """Return the token at current position (for error messages)."""
+        match = re.match(br"\S*", self.buffer[self.pos : self.pos + 80])
+        return match.group(0).decode("latin-1")
+
+    def context(self):
+        """Return the text near current position (for error messages)."""
+        return self.buffer[max(0, self.pos - 40) : self.pos + 40].decode("latin-1")
+
+    def next_keyword(self):
+        """Return next keyword (upper case), or None if end of file."""
+
+        state = np.zeros(4, dtype=np.float64)
+        while True:
+            state[0] = self.pos
+            status = _cxtgeo.grd3d_read_grdecl_values(
+                self.buffer, int(self.eof), np.zeros(0, dtype=np.float64), state, 2
+            )
+            self.pos = int(state[0])
+
+            if status == 3:
+                match = _KEYWORD.match(self.buffer, self.pos)
+                self.pos = match.end()
+                return match.group(0).decode("ascii").upper()
+
+            if status == 0:
+                if self.eof:
+                    return None
+                self.more()
+
+
+def grdecl_records(filename, keywords, chunksize=None, _level=0):
+    """Generator of (keyword, record) for a GRDECL file, including INCLUDE files.
+
+    Only records for the given keywords (upper case) are given. The caller may
+    read the record (cf. _GrdeclRecord), otherwise it is skipped. The file names
+    in INCLUDE are relative to the folder of the including file.
+    """
+
+    if _level > MAXINCLUDE:
+        raise RuntimeError("Too deep INCLUDE nesting (recursive?) in " + filename)
+
+    stream = _GrdeclStream(filename, chunksize=chunksize or CHUNKSIZE)
+    try:
+        while True:
+            kwname = stream.next_keyword()
+            if kwname is None or kwname == "END":
+                break
+
+            if kwname == "INCLUDE":
+                tokens = _GrdeclRecord(stream, kwname).read_tokens()
+                if not tokens:
+                    raise ValueError("Missing file name for INCLUDE in " + filename)
+                incfile = os.path.join(os.path.dirname(filename), tokens[0])
+                logger.info("Include %s", incfile)
+                for item in grdecl_records(
+                    incfile, keywords, chunksize, _level=_level + 1
+                ):
+                    yield item
+                continue
+
+            if kwname not in keywords:
+                continue
+
+            record = _GrdeclRecord(stream, kwname)
+            yield kwname, record
+            record.skip()
+    finally:
+        stream.close()
+
+
+def read_values(record, nvalues, nslab=None):
+    """Generator of arrays with nslab values (default: all) of a record.
+
+    The same array is reused for each slab, so slabs shall be copied (e.g. into
+    a larger array) by the caller. The record end is checked after last slab.
+    """
+
+    nslab = nvalues if nslab is None else nslab
+    values = np.empty(nslab, dtype=np.float64)
+    for _ in range(nvalues // nslab):
+        record.read_values(values)
+        yield values
+    record.end()
@@ -98,10 +98,14 @@ def get_randomline(
 def _update_tmpvars(self, force=False):
     """The self._tmp variables are needed to speed up calculations.
 
-    If they are already created, the no need to recreate
+    This is the grid's search index: a one layer version of the grid plus maps of
+    I J positions for top and base. If they are already created for the current
+    geometry, then no need to recreate. Methods that change the grid geometry shall
+    reset self._tmp (i.e. ``self._tmp = {}``), which triggers a rebuild here.
     """
 
     if "onegrid" not in self._tmp or force:
+        self._tmp = {}
         logger.info("Make a tmp onegrid instance...")
         self._tmp["onegrid"] = self.copy()
         self._tmp["onegrid"].reduce_to_one_layer()
@@ -4,11 +4,18 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import hashlib
+import json
+import os
+
 import pandas as pd
+import six
 
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
+from . import _grid_eclbin_record as _eclbin
+
 xtg = xtgeo.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
@@ -20,6 +27,17 @@ def scan_keywords(pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=
     Cf. grid_properties.py description
     """
 
+    if fformat == "xecl" and isinstance(pfile, str) and xtgeo.get_eclindex_cache():
+        kwindex = EclKeywordIndex.from_pfile(pfile, maxkeys=maxkeys)
+        data = kwindex.records[:maxkeys]
+        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART", "DATE"]
+        if not dates:
+            data = [record[:4] for record in data]
+            cols = cols[:4]
+        if dataframe:
+            return pd.DataFrame.from_records(data, columns=cols)
+        return data
+
     local_fhandle = False
     fhandle = pfile
     if isinstance(pfile, str):
@@ -50,6 +68,12 @@ def scan_dates(pfile, maxdates=1000, dataframe=False):
     Cf. grid_properties.py description
     """
 
+    if isinstance(pfile, str) and xtgeo.get_eclindex_cache():
+        zdates = EclKeywordIndex.from_pfile(pfile).tsteps[:maxdates]
+        if dataframe:
+            return pd.DataFrame.from_records(zdates, columns=["SEQNUM", "DATE"])
+        return zdates
+
     seq = _cxtgeo.new_intarray(maxdates)
     day = _cxtgeo.new_intarray(maxdates)
     mon = _cxtgeo.new_intarray(maxdates)
@@ -173,6 +197,275 @@ def _scan_ecl_keywords_w_dates(fhandle, maxkeys=100000, dataframe=False):
     return result
 
 
+class EclKeywordIndex(object):
+    """Keyword and date index of an Eclipse binary file, e.g. INIT or UNRST.
+
+    The file is scanned once, and the records are kept as a list of tuples
+    (KEYWORD, TYPE, NITEMS, BYTESTART, DATE) as in scan_keywords(..., dates=True),
+    with dictionaries for lookup on keyword and keyword + date. Records may be
+    prefetched in one pass ordered on byte position, and are then read from memory.
+
+    If a cache location is set (cf. xtgeo.set_eclindex_cache()), the index is
+    stored on disk and reused while the file is unchanged.
+
+    If the file is memory mapped (cf. open_mmap()), records are decoded directly
+    from the memory map instead, and prefetching is not needed.
+    """
+
+    # version of the cache file format
+    CACHEVERSION = 1
+
+    def __init__(self, records, tsteps=None, maxkeys=100000):
+        self.records = records
+        self.tsteps = tsteps if tsteps is not None else []
+        self.maxkeys = maxkeys
+        self.dates = []
+        self._bykey = dict()
+        self._bydate = set()
+        self._first = dict()
+        self._data = dict()
+        self._mmap = None
+
+        for record in records:
+            kwname, _kwtype, _kwlen, _kwbyte, kwdate = record
+            if kwname == "SEQNUM":
+                self.dates.append(kwdate)
+            self._bykey.setdefault((kwname, str(kwdate)), []).append(record)
+            self._first.setdefault(kwname, record)
+            self._bydate.add(str(kwdate))
+
+    @classmethod
+    def from_file(cls, fhandle, maxkeys=100000):
+        """Scan keywords in file, and find date per record from INTEHEAD.
+
+        This gives the same as scan_keywords(..., dates=True), but the INTEHEAD
+        records are read directly, instead of scanning the file again. The
+        (SEQNUM, DATE) per INTEHEAD are kept in tsteps, as in scan_dates().
+        """
+        xkeys = _scan_ecl_keywords(fhandle, maxkeys=maxkeys, dataframe=False)
+
+        tsteps = []
+        seqnum = 0
+        for name, kwtype, reclen, bytepos in xkeys:
+            if name == "SEQNUM":
+                seqnum = int(
+                    _eclbin.eclbin_record(fhandle, name, reclen, kwtype, bytepos)[0]
+                )
+            elif name == "INTEHEAD":
+                intehead = _eclbin.eclbin_record(fhandle, name, reclen, kwtype, bytepos)
+                dday, dmon, dyer = intehead[64:67].tolist()
+                tsteps.append(
+                    (seqnum, int("{0:4}{1:02}{2:02}".format(dyer, dmon, dday)))
+                )
+
+        records = []
+        nv = -1
+        date = 0
+        for name, kwtype, reclen, bytepos in xkeys:
+            if name == "SEQNUM":
+                nv += 1
+                date = tsteps[nv][1]
+            records.append((name, kwtype, reclen, bytepos, date))
+
+        return cls(records, tsteps=tsteps, maxkeys=maxkeys)
+
+    @classmethod
+    def from_pfile(cls, pfile, maxkeys=100000):
+        """Get index for a file name or _XTGeoCFile, from the cache if possible.
+
+        The file is only opened (and scanned) if no valid cached index is found.
+        """
+        local_fhandle = False
+        if not isinstance(pfile, xtgeo._XTGeoCFile):
+            pfile = xtgeo._XTGeoCFile(pfile)
+            local_fhandle = True
+
+        cachefile = None
+        if xtgeo.get_eclindex_cache() and not pfile.memstream:
+            filename = os.path.abspath(pfile.name)
+            cachefile = _eclindex_cachefile(filename, xtgeo.get_eclindex_cache())
+            kwindex = cls._from_cache(cachefile, filename, maxkeys)
+            if kwindex is not None:
+                logger.info("Keyword index read from cache %s", cachefile)
+                return kwindex
+
+        kwindex = cls.from_file(pfile.fhandle, maxkeys=maxkeys)
+
+        if local_fhandle:
+            pfile.close()
+
+        if cachefile is not None:
+            kwindex._to_cache(cachefile, filename)
+
+        return kwindex
+
+    @classmethod
+    def _from_cache(cls, cachefile, filename, maxkeys):
+        """Return index from cache file, or None if missing, outdated or unusable."""
+
+        if not os.path.isfile(cachefile):
+            return None
+
+        try:
+            with open(cachefile, "r") as stream:
+                data = json.load(stream)
+        except (IOError, OSError, ValueError) as err:
+            logger.warning("Cannot read keyword index cache %s: %s", cachefile, err)
+            return None
+
+        stat = os.stat(filename)
+        if (
+            data.get("version") != cls.CACHEVERSION
+            or data.get("path") != filename
+            or data.get("size") != stat.st_size
+            or data.get("mtime") != stat.st_mtime
+        ):
+            logger.info("Keyword index cache %s is outdated", cachefile)
+            return None
+
+        # a cached index from a scan that was truncated at fewer keys is not valid
+        records = [tuple(record) for record in data["records"]]
+        if len(records) >= data["maxkeys"] and data["maxkeys"] < maxkeys:
+            return None
+
+        tsteps = [tuple(tstep) for tstep in data["tsteps"]]
+        return cls(records, tsteps=tsteps, maxkeys=data["maxkeys"])
+
+    def _to_cache(self, cachefile, filename):
+        """Store the index in cache file; failures (e.g. no write access) are ok."""
+
+        stat = os.stat(filename)
+        data = {
+            "version": self.CACHEVERSION,
+            "path": filename,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "maxkeys": self.maxkeys,
+            "records": self.records,
+            "tsteps": self.tsteps,
+        }
+
+        tmpfile = "{}.{}.tmp".format(cachefile, os.getpid())
+        try:
+            folder = os.path.dirname(cachefile)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            with open(tmpfile, "w") as stream:
+                json.dump(data, stream)
+            if six.PY2:  # no os.replace; os.rename overwrites on posix
+                os.rename(tmpfile, cachefile)
+            else:
+                os.replace(tmpfile, cachefile)
+        except (IOError, OSError) as err:
+            logger.warning("Cannot write keyword index cache %s: %s", cachefile, err)
+            if os.path.exists(tmpfile):
+                os.remove(tmpfile)
+            return
+
+        logger.info("Keyword index stored in cache %s", cachefile)
+
+    @property
+    def keywords(self):
+        """List of unique keywords, in file order."""
+        return list(self._first.keys())
+
+    def first(self, keyword):
+        """Return first record of keyword, or None."""
+        return self._first.get(keyword, None)
+
+    def get(self, keyword, date, occurrence=0):
+        """Return record of keyword at date (0 for no date), or None.
+
+        The occurrence is the zero based count if keyword is repeated at date.
+        """
+        records = self._bykey.get((keyword, str(date)), [])
+        if occurrence < len(records):
+            return records[occurrence]
+        return None
+
+    def has(self, keyword, date):
+        """Return True if keyword exists at date."""
+        return (keyword, str(date)) in self._bykey
+
+    def has_date(self, date):
+        """Return True if date is present for any record."""
+        return str(date) in self._bydate
+
+    def open_mmap(self, pfile):
+        """Memory map the file (_XTGeoCFile) for reading records, if possible."""
+
+        if pfile.memstream:
+            return
+        try:
+            self._mmap = _eclbin.EclBinaryMmap(pfile.name)
+        except (IOError, OSError, ValueError) as err:
+            logger.warning("Cannot memory map %s, use file reads: %s", pfile.name, err)
+
+    def close(self):
+        """Remove prefetched records and close the memory map, if any."""
+        self.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def prefetch(self, fhandle, records):
+        """Read records in one pass ordered on byte position, keep in memory."""
+
+        if self._mmap is not None:
+            return
+
+        records = sorted(set(records), key=lambda rec: rec[3])
+        logger.info("Prefetch %s records", len(records))
+        for kwname, kwtype, kwlen, kwbyte, _kwdate in records:
+            if kwbyte not in self._data:
+                self._data[kwbyte] = _eclbin.eclbin_record(
+                    fhandle, kwname, kwlen, kwtype, kwbyte
+                )
+
+    def release(self, records):
+        """Remove given records from memory."""
+        for record in records:
+            self._data.pop(record[3], None)
+
+    def clear(self):
+        """Remove all prefetched records from memory."""
+        self._data.clear()
+
+    def eclbin_record(self, fhandle, kwname, kwlen, kwtype, kwbyte, dtype=None):
+        """Return record, from memory if prefetched, otherwise read from file.
+
+        If dtype is given, the values are returned with that type, e.g. float64
+        for REAL records.
+        """
+
+        if self._mmap is not None:
+            return self._mmap.record(kwname, kwlen, kwtype, kwbyte, dtype=dtype)
+
+        if kwbyte in self._data:
+            values = self._data[kwbyte]
+        else:
+            values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+
+def _eclindex_cachefile(filename, location):
+    """Return name of cache file for the keyword index of an Eclipse file.
+
+    The cache folder is not made here, but when the index is stored.
+    """
+
+    filename = os.path.abspath(filename)
+    if location == "sidecar":
+        folder, fname = os.path.split(filename)
+        return os.path.join(folder, ".{}.xtgidx".format(fname))
+
+    key = hashlib.sha1(filename.encode("utf-8")).hexdigest()
+    return os.path.join(location, "{}.xtgidx".format(key))
+
+
 def _scan_roff_keywords(fhandle, maxkeys=100000, dataframe=False):
 
     # In case fhandle is not a file name but a swig pointer to a file handle,
@@ -2,6 +2,7 @@
 
 from __future__ import print_function, absolute_import
 
+import mmap
 
 import numpy as np
 
@@ -64,3 +65,127 @@ def eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte):
         del npflt
 
     return npuse
+
+
+# big endian item type and native type per record type
+ECLTYPES = {
+    "INTE": (">i4", np.int32),
+    "REAL": (">f4", np.float32),
+    "DOUB": (">f8", np.float64),
+    "LOGI": (">i4", np.int32),
+}
+
+
+class EclBinaryMmap(object):
+    """Memory mapped Eclipse binary file (e.g. INIT, UNRST, EGRID).
+
+    Records are given as numpy views into the file, with big endian items. The
+    data of a record is stored in Fortran blocks (e.g. 1000 items) with a 4 byte
+    length marker before and after each block, hence the views are one 2D strided
+    view for the full blocks (one row per block) and one 1D view for the rest.
+    Nothing is read from file before the views are used, and the byteswap (and
+    type cast, if any) is done in one step per record when decoded.
+    """
+
+    def __init__(self, filename):
+        self._stream = open(filename, "rb")
+        try:
+            self._mmap = mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # e.g. empty file
+            self._stream.close()
+            raise
+        logger.info("Memory mapped %s", filename)
+
+    def close(self):
+        """Close the memory map and the file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._stream.close()
+            self._mmap = None
+
+    def _marker(self, pos):
+        return int(np.ndarray((1,), dtype=">i4", buffer=self._mmap, offset=pos)[0])
+
+    def views(self, kwname, kwlen, kwtype, kwbyte):
+        """Return (full, rest) big endian views of the items in a record.
+
+        The full view has shape (nblocks, blocksize) and the rest view has the
+        remaining items; the record items are hence full.ravel() + rest.
+        """
+
+        if kwtype not in ECLTYPES:
+            raise ValueError(
+                "Wrong type of kwtype {} for {}, must be INTE, REAL, DOUB "
+                "or LOGI".format(kwtype, kwname)
+            )
+
+        bigtype = np.dtype(ECLTYPES[kwtype][0])
+        isize = bigtype.itemsize
+
+        pos = int(kwbyte) + 24  # record header is 24 bytes
+        if kwlen == 0:
+            return np.zeros((0, 0), dtype=bigtype), np.zeros((0,), dtype=bigtype)
+
+        nblock = self._marker(pos) // isize
+        if nblock <= 0:
+            raise RuntimeError("Corrupt record {} at byte {}".format(kwname, kwbyte))
+
+        nfull = kwlen // nblock
+        nrest = kwlen - nfull * nblock
+        stride = nblock * isize + 8
+
+        # the markers before and after each full block shall have the block size
+        ok = True
+        if nfull > 0:
+            markers = np.ndarray(
+                (2, nfull),
+                dtype=">i4",
+                buffer=self._mmap,
+                offset=pos,
+                strides=(stride - 4, stride),
+            )
+            ok = bool((markers == nblock * isize).all())
+
+        full = np.ndarray(
+            (nfull, nblock),
+            dtype=bigtype,
+            buffer=self._mmap,
+            offset=pos + 4,
+            strides=(stride, isize),
+        )
+
+        pos += nfull * stride
+        rest = np.zeros((0,), dtype=bigtype)
+        if nrest > 0:
+            rest = np.ndarray(
+                (nrest,), dtype=bigtype, buffer=self._mmap, offset=pos + 4
+            )
+            ok = ok and self._marker(pos) == self._marker(pos + 4 + nrest * isize)
+            ok = ok and self._marker(pos) == nrest * isize
+
+        if not ok:
+            raise RuntimeError("Corrupt record {} at byte {}".format(kwname, kwbyte))
+
+        return full, rest
+
+    def record(self, kwname, kwlen, kwtype, kwbyte, dtype=None):
+        """Return a record as a native numpy array, as eclbin_record().
+
+        The dtype may be given in order to decode e.g. REAL directly to float64,
+        otherwise the native type of the record type is used.
+        """
+
+        full, rest = self.views(kwname, kwlen, kwtype, kwbyte)
+
+        if dtype is None:
+            dtype = ECLTYPES[kwtype][1]
+
+        values = np.empty(kwlen, dtype=dtype)
+        nfull = full.size
+        values[:nfull].reshape(full.shape)[:] = full
+        values[nfull:] = rest
+
+        if kwtype == "LOGI":
+            np.negative(values, out=values)  # stored as -1 for True
+
+        return values
@@ -5,6 +5,7 @@ from __future__ import print_function, absolute_import, division
 import inspect
 import warnings
 from copy import deepcopy
+from contextlib import contextmanager
 from math import atan2, degrees
 from collections import OrderedDict
 
@@ -30,6 +31,9 @@ logger = xtg.functionlogger(__name__)
 
 # Note that "self" is the grid instance
 
+# ZCORN values expanded to float64 at a time for a compact grid
+ZCORN_BLOCK = 2 ** 24
+
 
 def create_box(
     self,
@@ -231,11 +235,16 @@ def get_ijk_from_points(
     columnnames=("IX", "JY", "KZ"),
     fmt="int",
     undef=-1,
+    _ver=2,
 ):
     """Get I J K indices as a list of tuples or a dataframe
 
     It is here tried to get fast execution. This requires a preprosessing
-    of the grid to store a onlayer version, and maps with IJ positions
+    of the grid to store a onlayer version, and maps with IJ positions. This
+    search index is kept on the grid and reused until the geometry changes.
+
+    The _ver is a developer option for the K search within a column; 1 scans all
+    layers, while 2 (default) use bisection on the layer depths.
     """
 
     logger.info("Getting IJK indices from Points...")
@@ -244,7 +253,7 @@ def get_ijk_from_points(
     if not activeonly:
         actnumoption = 0
 
-    _update_tmpvars(self, force=True)
+    _update_tmpvars(self)
 
     arrsize = points.dataframe[points.xname].values.size
 
@@ -280,6 +289,7 @@ def get_ijk_from_points(
         self._tmp["onegrid"]._zcornsv,
         actnumoption,
         useflip,
+        1 if _ver == 2 else 0,
         arrsize,
         arrsize,
         arrsize,
@@ -496,6 +506,95 @@ def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS")):
     return tuple(grid_props)
 
 
+CELLGEOMETRY = ("X_UTME", "Y_UTMN", "Z_TVDSS", "dX", "dY", "dZ", "BULKVOL")
+
+
+def get_cell_geometry(self, activeonly=True, layer_range=None, corners=False):
+    """Get cell centers, dX, dY, dZ, bulk volume (and corners) in one pass.
+
+    The result is cached in self._tmp, which is reset when the geometry changes.
+    The corners (24 values per cell) are not cached, only the other arrays.
+    """
+
+    if layer_range is not None:
+        k1, k2 = layer_range
+    else:
+        k1 = 1
+        k2 = self.nlay
+
+    if not 1 <= k1 <= k2 <= self.nlay:
+        raise ValueError("Invalid layer range: {}".format(layer_range))
+
+    cache = self._tmp.setdefault("cellgeometry", {})
+    key = (bool(activeonly), k1, k2)
+    if key in cache and not corners:
+        logger.info("Cell geometry for %s from cache", key)
+        return OrderedDict(cache[key])
+
+    nkk = k2 - k1 + 1
+    ngeom = len(CELLGEOMETRY) + (24 if corners else 0)
+    geomv = np.zeros((ngeom, self._ncol, self._nrow, nkk), dtype=np.float64)
+
+    option = 0
+    if activeonly:
+        option += 1
+    if corners:
+        option += 2
+
+    for kb1, kb2, zcornsv, actnumsv in zcorn_layer_blocks(self, k1, k2):
+        nkb = kb2 - kb1 + 1
+        blockv = geomv
+        if nkb < nkk:
+            blockv = np.zeros((ngeom, self._ncol, self._nrow, nkb), dtype=np.float64)
+
+        ier = _cxtgeo.grd3d_cell_geometry(
+            self._ncol,
+            self._nrow,
+            nkb,
+            self._coordsv,
+            zcornsv,
+            actnumsv,
+            1,
+            nkb,
+            blockv,
+            option,
+        )
+        if ier != 0:
+            raise RuntimeError("Error code {} from grd3d_cell_geometry".format(ier))
+
+        if blockv is not geomv:
+            geomv[..., kb1 - k1 : kb2 - k1 + 1] = blockv
+
+    # the cached arrays are shared, so they are made read only; with corners, the
+    # cached arrays are copied so the large corner array is not kept alive
+    geomv.flags.writeable = False
+    cachev = geomv
+    if corners:
+        cachev = geomv[: len(CELLGEOMETRY)].copy()
+        cachev.flags.writeable = False
+
+    geom = OrderedDict()
+    for num, name in enumerate(CELLGEOMETRY):
+        geom[name] = _cell_geometry_values(cachev[num], activeonly)
+    cache[key] = OrderedDict(geom)
+
+    if corners:
+        cornersv = np.moveaxis(geomv[len(CELLGEOMETRY) :], 0, -1)
+        geom["CORNERS"] = _cell_geometry_values(cornersv, activeonly)
+
+    return geom
+
+
+def _cell_geometry_values(values, activeonly):
+    if activeonly:
+        values = ma.masked_greater(values, xtgeo.UNDEF_LIMIT, copy=False)
+        if values.mask is not ma.nomask:
+            values.mask.flags.writeable = False
+    else:
+        values = ma.array(values, copy=False)
+    return values
+
+
 def get_layer_slice(self, layer, top=True, activeonly=True):
     """Get X Y cell corners (XY per cell; 5 per cell) as array"""
     ntot = self._ncol * self._nrow * self._nlay
@@ -689,15 +788,16 @@ def inactivate_by_dz(self, threshold):
     # assumption (unless somebody finds a Petrel made grid):
     nflip = 1
 
-    _cxtgeo.grd3d_inact_by_dz(
-        self.ncol,
-        self.nrow,
-        self.nlay,
-        self._zcornsv,
-        self._actnumsv,
-        threshold,
-        nflip,
-    )
+    with zcorn_expanded(self):
+        _cxtgeo.grd3d_inact_by_dz(
+            self.ncol,
+            self.nrow,
+            self.nlay,
+            self._zcornsv,
+            self._actnumsv,
+            threshold,
+            nflip,
+        )
 
 
 def make_zconsistent(self, zsep):
@@ -708,9 +808,10 @@ def make_zconsistent(self, zsep):
     if not isinstance(zsep, float):
         raise ValueError('The "zsep" is not a float or int')
 
-    _cxtgeo.grd3d_make_z_consistent(
-        self.ncol, self.nrow, self.nlay, self._zcornsv, zsep,
-    )
+    with zcorn_expanded(self):
+        _cxtgeo.grd3d_make_z_consistent(
+            self.ncol, self.nrow, self.nlay, self._zcornsv, zsep,
+        )
 
 
 def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=False):
@@ -760,9 +861,74 @@ def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=Fal
 def collapse_inactive_cells(self):
     """Collapse inactive cells"""
 
-    _cxtgeo.grd3d_collapse_inact(
-        self.ncol, self.nrow, self.nlay, self._zcornsv, self._actnumsv
-    )
+    with zcorn_expanded(self):
+        _cxtgeo.grd3d_collapse_inact(
+            self.ncol, self.nrow, self.nlay, self._zcornsv, self._actnumsv
+        )
+
+
+def is_compact(self):
+    """Return True if ZCORN is stored compact (float32)."""
+    return self._zcornsv is not None and self._zcornsv.dtype == np.float32
+
+
+def set_compact(self, compact):
+    """Store ZCORN as float32 (compact) or as float64."""
+
+    if self._zcornsv is None:
+        raise ValueError("The grid has no geometry, cannot set compact storage")
+
+    dtype = np.float32 if compact else np.float64
+    if self._zcornsv.dtype != dtype:
+        logger.info("Convert ZCORN to %s", np.dtype(dtype).name)
+        self._zcornsv = self._zcornsv.astype(dtype)
+        self._tmp = {}
+
+
+@contextmanager
+def zcorn_expanded(self):
+    """Expand a compact ZCORN to float64 while in the context, then compact again.
+
+    The C routines that read ZCORN accept float32 (they get a float64 copy per
+    call, cf. zcorn_layer_blocks() for readers that work per layer), while the C
+    routines that update ZCORN in place need float64.
+    """
+
+    compact = is_compact(self)
+    if compact:
+        self._zcornsv = self._zcornsv.astype(np.float64)
+    try:
+        yield
+    finally:
+        if compact:
+            self._zcornsv = self._zcornsv.astype(np.float32)
+
+
+def zcorn_layer_blocks(self, k1=1, k2=None):
+    """Yield (kb1, kb2, zcornsv, actnumsv) for blocks of layers kb1 to kb2.
+
+    The layers k1 to k2 (1 based, inclusive) are split in blocks, where zcornsv
+    and actnumsv are the float64 ZCORN and the ACTNUM of a grid with only the
+    layers kb1 to kb2. For a compact grid, ZCORN is hence expanded one block at a
+    time (about ZCORN_BLOCK values), while a float64 grid gives one block with
+    views of the full arrays.
+    """
+
+    if k2 is None:
+        k2 = self._nlay
+
+    nlayz = self._ncol * self._nrow * 4  # ZCORN values per layer of nodes
+    nlaya = self._ncol * self._nrow
+
+    nblock = k2 - k1 + 1
+    if is_compact(self):
+        nblock = max(1, ZCORN_BLOCK // nlayz - 1)
+
+    for kb1 in range(k1, k2 + 1, nblock):
+        kb2 = min(kb1 + nblock - 1, k2)
+        zcornsv = self._zcornsv[(kb1 - 1) * nlayz : (kb2 + 1) * nlayz]
+        actnumsv = self._actnumsv[(kb1 - 1) * nlaya : kb2 * nlaya]
+        yield kb1, kb2, zcornsv.astype(np.float64, copy=False), actnumsv
 
 
 def copy(self):
@@ -866,7 +1032,7 @@ def crop(self, spec, props=None):  # pylint: disable=too-many-locals
     )
 
     self._coordsv = new_coordsv
-    self._zcornsv = new_zcornsv
+    self._zcornsv = new_zcornsv.astype(self._zcornsv.dtype, copy=False)
     self._actnumsv = new_actnumsv
 
     self._ncol = nncol
@@ -940,7 +1106,7 @@ def reduce_to_one_layer(self):
     )
 
     self._nlay = 1
-    self._zcornsv = new_zcorn
+    self._zcornsv = new_zcorn.astype(self._zcornsv.dtype, copy=False)
     self._actnumsv = new_actnum
     self._props = None
     self._subgrids = None
@@ -951,19 +1117,20 @@ def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
     tx, ty, tz = translate
     fx, fy, fz = flip
 
-    ier = _cxtgeo.grd3d_translate(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        fx,
-        fy,
-        fz,
-        tx,
-        ty,
-        tz,
-        self._coordsv,
-        self._zcornsv,
-    )
+    with zcorn_expanded(self):
+        ier = _cxtgeo.grd3d_translate(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            fx,
+            fy,
+            fz,
+            tx,
+            ty,
+            tz,
+            self._coordsv,
+            self._zcornsv,
+        )
     if ier != 0:
         raise RuntimeError("Something went wrong in translate, code: {}".format(ier))
 
@@ -976,14 +1143,15 @@ def reverse_row_axis(self, ijk_handedness=None):
     if ijk_handedness == self.ijk_handedness:
         return
 
-    ier = _cxtgeo.grd3d_reverse_jrows(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-    )
+    with zcorn_expanded(self):
+        ier = _cxtgeo.grd3d_reverse_jrows(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            self._coordsv,
+            self._zcornsv,
+            self._actnumsv,
+        )
 
     if ier != 0:
         raise RuntimeError("Something went wrong in jswapping, code: {}".format(ier))
@@ -56,5 +56,5 @@ def make_hybridgrid(
     del rvalues
 
     self._nlay = newnlay
-    self._zcornsv = hyb_zcornsv
+    self._zcornsv = hyb_zcornsv.astype(self._zcornsv.dtype, copy=False)
     self._actnumsv = hyb_actnumsv
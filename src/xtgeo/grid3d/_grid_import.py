@@ -9,6 +9,7 @@ from xtgeo.common import XTGeoDialog
 
 from xtgeo.grid3d import _grid_import_roff
 from xtgeo.grid3d import _grid_import_ecl
+from xtgeo.grid3d import _grid_etc1
 
 
 xtg = XTGeoDialog()
@@ -17,7 +18,14 @@ logger = xtg.functionlogger(__name__)
 
 
 def from_file(
-    self, gfile, fformat=None, initprops=None, restartprops=None, restartdates=None,
+    self,
+    gfile,
+    fformat=None,
+    initprops=None,
+    restartprops=None,
+    restartdates=None,
+    compact=False,
+    lazyprops=False,
 ):
 
     """Import grid geometry from file, and makes an instance of this class."""
@@ -71,14 +79,18 @@ def from_file(
             initprops=initprops,
             restartprops=restartprops,
             restartdates=restartdates,
+            lazyprops=lazyprops,
         )
     elif fformat == "grdecl":
-        _grid_import_ecl.import_ecl_grdecl(self, gfile)
+        _grid_import_ecl.import_ecl_grdecl(self, gfile, compact=compact)
     elif fformat == "bgrdecl":
         _grid_import_ecl.import_ecl_bgrdecl(self, gfile)
     else:
         raise SystemExit("Invalid file format")
 
+    if compact:
+        _grid_etc1.set_compact(self, True)
+
     self.name = os.path.splitext(os.path.basename(gfile))[0]
 
     return self
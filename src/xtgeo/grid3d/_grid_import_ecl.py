@@ -4,9 +4,6 @@
 
 from __future__ import print_function, absolute_import
 
-import re
-import os
-from tempfile import mkstemp
 import numpy as np
 
 import xtgeo
@@ -15,6 +12,7 @@ import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.grid3d._grid_eclbin_record import eclbin_record
 
 from . import _grid3d_utils as utils
+from . import _grdecl_stream
 
 xtg = xtgeo.XTGeoDialog()
 
@@ -118,7 +116,9 @@ def import_ecl_egrid(self, gfile):
 # Import eclipse run suite: EGRID + properties from INIT and UNRST
 # For the INIT and UNRST, props dates shall be selected
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-def import_ecl_run(self, groot, initprops=None, restartprops=None, restartdates=None):
+def import_ecl_run(
+    self, groot, initprops=None, restartprops=None, restartdates=None, lazyprops=False
+):
 
     ecl_grid = groot + ".EGRID"
     ecl_init = groot + ".INIT"
@@ -132,13 +132,23 @@ def import_ecl_run(self, groot, initprops=None, restartprops=None, restartdates=
     # import the init properties unless list is empty
     if initprops:
         grdprops.from_file(
-            ecl_init, names=initprops, fformat="init", dates=None, grid=self
+            ecl_init,
+            names=initprops,
+            fformat="init",
+            dates=None,
+            grid=self,
+            lazy=lazyprops,
         )
 
     # import the restart properties for dates unless lists are empty
     if restartprops and restartdates:
         grdprops.from_file(
-            ecl_rsta, names=restartprops, fformat="unrst", dates=restartdates, grid=self
+            ecl_rsta,
+            names=restartprops,
+            fformat="unrst",
+            dates=restartdates,
+            grid=self,
+            lazy=lazyprops,
         )
 
     self.gridprops = grdprops
@@ -146,74 +156,119 @@ def import_ecl_run(self, groot, initprops=None, restartprops=None, restartdates=
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Import eclipse input .GRDECL
-# Uses a tmp file so not very efficient
+# The file is read in one pass, in chunks (cf. _grdecl_stream)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-def import_ecl_grdecl(self, gfile):
-
-    # make a temporary file
-    fds, tmpfile = mkstemp(prefix="tmpxtgeo")
-    os.close(fds)
-
-    with open(gfile) as oldfile, open(tmpfile, "w") as newfile:
-        for line in oldfile:
-            if not (re.search(r"^--", line) or re.search(r"^\s+$", line)):
-                newfile.write(line)
-
-    newfile.close()
-    oldfile.close()
-
-    # find ncol nrow nz
-    mylist = []
-    found = False
-    with open(tmpfile) as xfile:
-        for line in xfile:
-            if found:
-                logger.info(line)
-                mylist = line.split()
-                break
-            if re.search(r"^SPECGRID", line):
-                found = True
-
-    if not found:
-        logger.error("SPECGRID not found. Nothing imported!")
-        return
-    xfile.close()
+def import_ecl_grdecl(self, gfile, compact=False):
 
-    self._ncol, self._nrow, self._nlay = int(mylist[0]), int(mylist[1]), int(mylist[2])
+    mapaxes = None
+    found = set()
 
-    logger.info("NX NY NZ in grdecl file: %s %s %s", self._ncol, self._nrow, self._nlay)
+    keywords = ("SPECGRID", "MAPAXES", "COORD", "ZCORN", "ACTNUM")
+    for kwname, record in _grdecl_stream.grdecl_records(gfile, keywords):
 
-    ncoord, nzcorn, ntot = self.vectordimensions
+        if kwname == "SPECGRID":
+            mylist = record.read_tokens()
+            ncol, nrow, nlay = int(mylist[0]), int(mylist[1]), int(mylist[2])
+            self._ncol, self._nrow, self._nlay = ncol, nrow, nlay
 
-    logger.info("Reading...")
+            logger.info("NX NY NZ in grdecl file: %s %s %s", ncol, nrow, nlay)
 
-    self._coordsv = np.zeros(ncoord, dtype=np.float64)
-    self._zcornsv = np.zeros(nzcorn, dtype=np.float64)
-    self._actnumsv = np.zeros(ntot, dtype=np.int32)
+            ncoord, nzcorn, ntot = self.vectordimensions
+            self._coordsv = np.zeros(ncoord, dtype=np.float64)
+            zdtype = np.float32 if compact else np.float64
+            self._zcornsv = np.zeros(nzcorn, dtype=zdtype)
+            self._actnumsv = np.zeros(ntot, dtype=np.int32)
 
-    ptr_num_act = _cxtgeo.new_intpointer()
+        elif kwname == "MAPAXES":
+            mapaxes = [float(val) for val in record.read_tokens()[0:6]]
 
-    eclfile = xtgeo._XTGeoCFile(tmpfile)
+        elif kwname in ("COORD", "ZCORN", "ACTNUM"):
+            if "SPECGRID" not in found:
+                raise ValueError(
+                    "Cannot import grid, {} before SPECGRID in file {}".format(
+                        kwname, gfile
+                    )
+                )
+            logger.info("Reading %s...", kwname)
+            _import_ecl_grdecl_array(self, kwname, record)
+
+        found.add(kwname)
+        if found.issuperset(("SPECGRID", "COORD", "ZCORN", "ACTNUM")):
+            break
+
+    missing = [
+        kwname for kwname in ("SPECGRID", "COORD", "ZCORN") if kwname not in found
+    ]
+    if missing:
+        raise xtgeo.KeywordNotFoundError(
+            "Cannot import grid, {} not found in file {}".format(
+                ", ".join(missing), gfile
+            )
+        )
 
-    _cxtgeo.grd3d_import_grdecl(
-        eclfile.fhandle,
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-        ptr_num_act,
-    )
+    if mapaxes is not None:
+        _import_ecl_grdecl_mapaxes(self, mapaxes)
 
-    # close and remove tmpfile
-    eclfile.close()
-    os.remove(tmpfile)
+    logger.info("Number of active cells: %s", np.count_nonzero(self._actnumsv == 1))
+    self._subgrids = None
 
-    nact = _cxtgeo.intpointer_value(ptr_num_act)
 
-    logger.info("Number of active cells: %s", nact)
-    self._subgrids = None
+def _import_ecl_grdecl_array(self, kwname, record):
+    """Read COORD, ZCORN or ACTNUM record directly into grid arrays."""
+
+    ncol, nrow, nlay = self._ncol, self._nrow, self._nlay
+
+    if kwname == "COORD":
+        record.read_values(self._coordsv)
+        record.end()
+        self._coordsv[self._coordsv == 9999900.0] = -9999.99
+
+    elif kwname == "ACTNUM":
+        actnum = self._actnumsv.reshape(nlay, nrow * ncol)
+        for klay, values in enumerate(
+            _grdecl_stream.read_values(record, actnum.size, nrow * ncol)
+        ):
+            actnum[klay, :] = values
+
+    else:
+        # Eclipse has 8 corners per cell, while XTGeo uses 4 corners (top of
+        # cell) for NZ+1 layers; i.e. the cell bottoms are used for the last
+        # layer only. Read one Eclipse layer of corners at the time (cell top or
+        # cell bottom), and reorder from (row, front/back, col, left/right)
+        zcorn = self._zcornsv.reshape(nlay + 1, nrow, ncol, 2, 2)
+        nslab = 4 * ncol * nrow
+        for kzread, values in enumerate(
+            _grdecl_stream.read_values(record, 2 * nlay * nslab, nslab)
+        ):
+            if kzread % 2 == 0 or kzread == 2 * nlay - 1:
+                layer = values.reshape(nrow, 2, ncol, 2).transpose(0, 2, 1, 3)
+                zcorn[(kzread + 1) // 2, ...] = layer
+
+
+def _import_ecl_grdecl_mapaxes(self, mapaxes):
+    """Convert COORD from MAPAXES, as in x_mapaxes() in C."""
+
+    x1, y1, x2, y2, x3, y3 = mapaxes
+
+    if all(abs(val) < 1.0e-05 for val in mapaxes):
+        logger.warning("All MAPAXES numbers ~zero; dubious settings")
+        return
+
+    xx1, yy1, xx3, yy3 = x1 - x2, y1 - y2, x3 - x2, y3 - y2
+    div1 = np.sqrt(xx3 * xx3 + yy3 * yy3)
+    div2 = np.sqrt(xx1 * xx1 + yy1 * yy1)
+    if div1 < 1.0e-05 or div2 < 1.0e-05:
+        logger.warning("Divisor wrt MAPAXES is ~zero")
+        return
+
+    xx3, yy3 = xx3 * (1.0 / div1), yy3 * (1.0 / div1)
+    xx1, yy1 = xx1 * (1.0 / div2), yy1 * (1.0 / div2)
+
+    coords = self._coordsv.reshape(-1, 3)
+    xval = coords[:, 0].copy()
+    yval = coords[:, 1].copy()
+    coords[:, 0] = x2 + xval * xx3 + yval * xx1
+    coords[:, 1] = y2 + xval * yy3 + yval * yy1
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -110,7 +110,7 @@ def refine_vertically(self, rfactor, zoneprop=None):
 
     # update instance:
     self._nlay = newnlay
-    self._zcornsv = ref_zcornsv
+    self._zcornsv = ref_zcornsv.astype(self._zcornsv.dtype, copy=False)
     self._actnumsv = ref_actnumsv
 
     if self.subgrids is None or len(self.subgrids) <= 1:
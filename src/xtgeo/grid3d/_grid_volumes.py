@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Private module for bulk and pore volumes of a grid"""
+from __future__ import print_function, absolute_import
+
+import numpy as np
+import pandas as pd
+
+import xtgeo
+from xtgeo.common import XTGeoDialog
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+
+from .grid_property import GridProperty
+from . import _grid_etc1
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+VOLUMES = ("BULK", "PORV", "HCPV")
+
+
+def get_bulk_volume(self, name="BULKVOL", asmasked=True):
+    """Get bulk volume per cell as property"""
+
+    bulkv = np.zeros(self.ntotal, dtype=np.float64)
+    _sum_volumes(self, bulkv=bulkv, activeonly=asmasked)
+
+    return GridProperty(
+        ncol=self._ncol,
+        nrow=self._nrow,
+        nlay=self._nlay,
+        values=np.ma.masked_greater(bulkv, xtgeo.UNDEF_LIMIT),
+        name=name,
+        discrete=False,
+    )
+
+
+def get_volumes(self, groupby=None, poro=None, ntg=None, sw=None, activeonly=True):
+    """Get sum of bulk, pore and HC pore volumes, per region, as a dataframe"""
+
+    regionv = None
+    regions = None
+    if groupby is not None:
+        values = _check_prop(self, groupby).ravel()
+        active = ~np.ma.getmaskarray(values)
+        regions, index = np.unique(np.ma.getdata(values)[active], return_inverse=True)
+        regionv = np.full(self.ntotal, -1, dtype=np.int32)
+        regionv[active] = index
+
+    nreg = 1 if regions is None else max(len(regions), 1)
+    sumsv = np.zeros(3 * nreg, dtype=np.float64)
+
+    _sum_volumes(
+        self,
+        regionv=regionv,
+        porov=_prop_values(self, poro),
+        ntgv=_prop_values(self, ntg),
+        swv=_prop_values(self, sw),
+        sumsv=sumsv,
+        activeonly=activeonly,
+    )
+
+    dfr = pd.DataFrame(sumsv.reshape(nreg, 3), columns=VOLUMES)
+    if regions is not None:
+        dfr = dfr.iloc[: len(regions)]
+        dfr.insert(0, groupby.name, regions)
+
+    return dfr
+
+
+def _sum_volumes(
+    self,
+    regionv=None,
+    porov=None,
+    ntgv=None,
+    swv=None,
+    bulkv=None,
+    sumsv=None,
+    activeonly=True,
+):
+    """Sum volumes, and/or get bulk volume per cell, for blocks of layers.
+
+    The per cell arrays are C order (as GridProperty values); each block of
+    layers (cf. _grid_etc1.zcorn_layer_blocks()) gets its own part of them.
+    """
+
+    if sumsv is None:
+        sumsv = np.zeros(3, dtype=np.float64)
+
+    def _block(values, kb1, kb2, dtype):
+        if values is None:
+            return np.zeros(0, dtype=dtype), None
+        view = values.reshape(self._ncol, self._nrow, self._nlay)[:, :, kb1 - 1 : kb2]
+        return np.ascontiguousarray(view).ravel(), view
+
+    sumsv[:] = 0.0
+    blocksumsv = np.zeros_like(sumsv)
+    for kb1, kb2, zcornsv, actnumsv in _grid_etc1.zcorn_layer_blocks(self):
+        bulkbv, bulkview = _block(bulkv, kb1, kb2, np.float64)
+
+        ier = _cxtgeo.grd3d_sum_volumes(
+            self._ncol,
+            self._nrow,
+            kb2 - kb1 + 1,
+            self._coordsv,
+            zcornsv,
+            actnumsv,
+            _block(regionv, kb1, kb2, np.int32)[0],
+            _block(porov, kb1, kb2, np.float64)[0],
+            _block(ntgv, kb1, kb2, np.float64)[0],
+            _block(swv, kb1, kb2, np.float64)[0],
+            bulkbv,
+            blocksumsv,
+            1 if activeonly else 0,
+        )
+        if ier != 0:
+            raise RuntimeError("Error code {} from grd3d_sum_volumes".format(ier))
+
+        sumsv += blocksumsv
+        if bulkview is not None:
+            bulkview[...] = bulkbv.reshape(bulkview.shape)
+
+
+def _check_prop(self, prop):
+    if not isinstance(prop, GridProperty):
+        raise ValueError("Input is not a GridProperty: {}".format(prop))
+
+    if prop.dimensions != self.dimensions:
+        raise ValueError(
+            "Property {} has dimensions {}, but grid has {}".format(
+                prop.name, prop.dimensions, self.dimensions
+            )
+        )
+    return prop.values
+
+
+def _prop_values(self, prop):
+    """Values of a property as a C order float64 array; masked cells are 0."""
+    if prop is None:
+        return None
+
+    values = _check_prop(self, prop)
+    return np.ma.filled(values, 0.0).astype(np.float64, copy=False).ravel()
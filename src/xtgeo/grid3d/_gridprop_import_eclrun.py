@@ -7,7 +7,6 @@ import numpy.ma as ma
 
 import xtgeo
 
-from . import _grid_eclbin_record as _eclbin
 from . import _grid3d_utils as utils
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -40,11 +39,12 @@ SIMULATOR = {100: "E100", 300: "E300", 700: "IX"}
 
 
 def import_eclbinary(
-    self, pfile, name=None, etype=1, date=None, grid=None, fracture=False, _kwlist=None
+    self, pfile, name=None, etype=1, date=None, grid=None, fracture=False, _kwindex=None
 ):
 
     # if pfile is a file, then the file is opened/closed here; otherwise, the
-    # "outer" routine must handle that
+    # "outer" routine must handle that. The _kwindex is a EclKeywordIndex instance,
+    # which may be given (with prefetched records) when importing many properties
 
     local_fhandle = False
     fhandle = pfile
@@ -58,77 +58,85 @@ def import_eclbinary(
     logger.info("Import ECL binary, name requested is %s", name)
 
     # scan file for properties byte positions etc
-    if _kwlist is None:
-        logger.info("Make kwlist, scan keywords")
-        kwlist = utils.scan_keywords(
-            fhandle, fformat="xecl", maxkeys=100000, dataframe=True, dates=True
-        )
+    if _kwindex is None and local_fhandle:
+        logger.info("Make keyword index, scan keywords (or use cached index)")
+        kwlist = utils.EclKeywordIndex.from_pfile(pfile, maxkeys=100000)
+        kwlist.open_mmap(pfile)
+    elif _kwindex is None:
+        logger.info("Make keyword index, scan keywords")
+        kwlist = utils.EclKeywordIndex.from_file(fhandle, maxkeys=100000)
     else:
-        kwlist = _kwlist
-
-    metadata = _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid)
-    date = metadata["DATE"]
+        kwlist = _kwindex
 
-    # Importing phases is a challenge. It depends on the fluid system and simulator; e.g
-    # typically in a 3 phase system, only SGAS and SWAT is given while SOIL must be
-    # computed, if E100. E300 and IX may behave different...
+    try:
+        metadata = _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid)
+        date = metadata["DATE"]
 
-    if name == "SGAS":
-        status = _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture)
+        # Importing phases is a challenge. It depends on the fluid system and
+        # simulator; e.g typically in a 3 phase system, only SGAS and SWAT is given
+        # while SOIL must be computed, if E100. E300 and IX may behave different...
 
-    elif name == "SOIL":
-        status = _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture)
+        if name == "SGAS":
+            status = _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture)
 
-    elif name == "SWAT":
-        status = _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture)
+        elif name == "SOIL":
+            status = _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture)
 
-    if status == 0:
-        name = name.replace("{__}", "")
+        elif name == "SWAT":
+            status = _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture)
 
-        logger.info("Importing %s", name)
+        if status == 0:
+            name = name.replace("{__}", "")
 
-        _import_eclbinary_checks1(self, grid)
+            logger.info("Importing %s", name)
 
-        kwname, kwlen, kwtype, kwbyte = _import_eclbinary_checks2(
-            kwlist, name, etype, date
-        )
+            _import_eclbinary_checks1(self, grid)
 
-        if grid._dualporo:  # _dualporo shall always be True if _dualperm is True
-            _import_eclbinary_dualporo(
-                self,
-                grid,
-                fhandle,
-                kwname,
-                kwlen,
-                kwtype,
-                kwbyte,
-                name,
-                date,
-                etype,
-                fracture,
-            )
-        else:
-            _import_eclbinary_prop(
-                self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype
+            kwname, kwlen, kwtype, kwbyte = _import_eclbinary_checks2(
+                kwlist, name, etype, date
             )
 
+            if grid._dualporo:  # _dualporo shall always be True if _dualperm is True
+                _import_eclbinary_dualporo(
+                    self,
+                    grid,
+                    fhandle,
+                    kwlist,
+                    kwname,
+                    kwlen,
+                    kwtype,
+                    kwbyte,
+                    name,
+                    date,
+                    etype,
+                    fracture,
+                )
+            else:
+                _import_eclbinary_prop(
+                    self,
+                    grid,
+                    fhandle,
+                    kwlist,
+                    kwname,
+                    kwlen,
+                    kwtype,
+                    kwbyte,
+                    name,
+                    date,
+                    etype,
+                )
+    finally:
+        if _kwindex is None:
+            kwlist.close()
+
     if local_fhandle and not pfile.close(cond=local_fhandle):
         raise RuntimeError("Error in closing file handle for binary Eclipse file")
 
 
-def _chk_kw_date(df, keyword, date):
-    """Check if a keyword exists for a given date"""
-
-    for ir in range(len(df)):
-        if df.loc[ir, "KEYWORD"] == keyword and str(df.loc[ir, "DATE"]) == str(date):
-            return True
-    return False
-
-
 def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
     """Import SWAT; this may lack in very special cases"""
 
-    s_exists = _chk_kw_date(kwlist, "SWAT", date)
+    s_exists = kwlist.has("SWAT", date)
     logger.info("SWAT: S_EXISTS %s for date %s", s_exists, date)
 
     if s_exists or metadata["IPHS"] in (0, 3, 6, 7, -2345):
@@ -140,7 +148,7 @@ def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
             grid=grid,
             date=date,
             fracture=fracture,
-            _kwlist=kwlist,
+            _kwindex=kwlist,
         )
 
     else:
@@ -175,7 +183,7 @@ def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
 def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
     """Import SGAS; this may be lack of oil/water (need to verify)"""
 
-    s_exists = _chk_kw_date(kwlist, "SGAS", date)
+    s_exists = kwlist.has("SGAS", date)
     logger.info("SGAS: S_EXISTS %s for date %s", s_exists, date)
 
     flag = 0
@@ -188,7 +196,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
             grid=grid,
             date=date,
             fracture=fracture,
-            _kwlist=kwlist,
+            _kwindex=kwlist,
         )
 
     elif metadata["IPHS"] == 6:
@@ -203,7 +211,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
             grid=grid,
             date=date,
             fracture=fracture,
-            _kwlist=kwlist,
+            _kwindex=kwlist,
         )
 
         self.name = "SGAS" + "_" + str(date)
@@ -246,7 +254,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
 
 def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
     # pylint: disable=too-many-branches, too-many-statements
-    s_exists = _chk_kw_date(kwlist, "SOIL", date)
+    s_exists = kwlist.has("SOIL", date)
     logger.info("SOIL: S_EXISTS %s for date %s", s_exists, date)
 
     phases = metadata["IPHS"]
@@ -268,7 +276,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
             grid=grid,
             date=date,
             fracture=fracture,
-            _kwlist=kwlist,
+            _kwindex=kwlist,
         )
 
     elif phases in (3, 5, 7):
@@ -286,7 +294,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
                 grid=grid,
                 date=date,
                 fracture=fracture,
-                _kwlist=kwlist,
+                _kwindex=kwlist,
             )
 
         if phases in (5, 7):
@@ -299,7 +307,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
                 grid=grid,
                 date=date,
                 fracture=fracture,
-                _kwlist=kwlist,
+                _kwindex=kwlist,
             )
 
         self.name = "SOIL" + "_" + str(date)
@@ -359,7 +367,6 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
         A dictionary of metadata
 
     """
-    nentry = 0
     metadata = {}
 
     datefound = True
@@ -367,35 +374,26 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
         datefound = False
         logger.info("Look for date %s", date)
 
-        # scan for date and find SEQNUM entry number; also potentially update date!
-        dtlist = kwlist["DATE"].values.tolist()
+        # scan for date; also potentially update date!
         if date == 0:
-            date = dtlist[0]
+            date = kwlist.records[0][4]
         elif date == 9:
-            date = dtlist[-1]
+            date = kwlist.records[-1][4]
 
         logger.info("Redefined date is %s", date)
 
-        for ientry, dtentry in enumerate(dtlist):
-            if str(dtentry) == str(date):
-                datefound = True
-                nentry = ientry
-                break
+        datefound = kwlist.has_date(date)
 
         if not datefound:
-            msg = "Date {} not found, nentry={}".format(date, nentry)
+            msg = "Date {} not found".format(date)
             xtg.warn(msg)
             raise xtgeo.DateNotFoundError(msg)
 
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
     # INTEHEAD is needed to verify grid dimensions:
-    for kwitem in kwxlist:
-        if kwitem[0] == "INTEHEAD":
-            kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
-            break
+    kwname, kwtype, kwlen, kwbyte, _kwdate = kwlist.first("INTEHEAD")
 
     # read INTEHEAD record:
-    intehead = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
+    intehead = kwlist.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
     ncol, nrow, nlay = intehead[8:11]
     logger.info("Dimensions detected %s %s %s", ncol, nrow, nlay)
 
@@ -407,13 +405,13 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
 
     # LOGIHEAD item [14] in restart should be True, if dualporo model...
     # LOGIHEAD item [15] in restart should be True, if dualperm (+ dualporo) model.
-    for kwitem in kwxlist:
-        if kwitem[0] == "LOGIHEAD":
-            kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
-            break
+    # (LOGIHEAD may be missing, e.g. in INIT files from other simulators)
+    logihead = [False] * 15
+    if kwlist.first("LOGIHEAD") is not None:
+        kwname, kwtype, kwlen, kwbyte, _kwdate = kwlist.first("LOGIHEAD")
 
-    # read INTEHEAD record:
-    logihead = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
+        # read LOGIHEAD record:
+        logihead = kwlist.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
 
     # DUAL; which kind if doubles (not exact!) the layers when reading,
     # and assign first half* to Matrix (M) and second half to Fractures (F).
@@ -504,18 +502,17 @@ def _import_eclbinary_checks2(kwlist, name, etype, date):
         usedate = str(date)
         restart = True
 
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
-    for kwitem in kwxlist:
-        kwname, kwtype, kwlen, kwbyte, kwdate = kwitem
-        logger.debug("Keyword %s -  date: %s usedate: %s", kwname, kwdate, usedate)
-        if name == kwname:
-            kwfound = True
+    kwitem = kwlist.get(name, usedate)
+    if kwitem is not None:
+        logger.info("Keyword %s ok at date %s", name, usedate)
+        kwfound = True
+        datefoundhere = True
+    else:
+        kwitem = kwlist.first(name)
+        kwfound = kwitem is not None
 
-        if name == kwname and usedate == str(kwdate):
-            logger.info("Keyword %s ok at date %s", name, usedate)
-            kwname, kwtype, kwlen, kwbyte, kwdate = kwitem
-            datefoundhere = True
-            break
+    if kwfound:
+        kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
 
     if restart:
         if datefound and not kwfound:
@@ -537,11 +534,13 @@ def _import_eclbinary_checks2(kwlist, name, etype, date):
 
 
 def _import_eclbinary_prop(
-    self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype
+    self, grid, fhandle, kwlist, kwname, kwlen, kwtype, kwbyte, name, date, etype
 ):
     """Import the actual record"""
 
-    values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+    # cast REAL (float32) to float64 when decoding
+    dtype = None if kwtype == "INTE" else np.float64
+    values = kwlist.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte, dtype=dtype)
 
     self._isdiscrete = False
     use_undef = xtgeo.UNDEF
@@ -557,9 +556,6 @@ def _import_eclbinary_prop(
         codes = {key: str(val) for key, val in codes.items()}  # val: strings
         self.codes = codes
 
-    else:
-        values = values.astype(np.float64)  # cast REAL (float32) to float64
-
     # arrays from Eclipse INIT or UNRST are usually for inactive values only.
     # Use the ACTNUM index array for vectorized numpy remapping (need both C
     # and F order)
@@ -608,7 +604,18 @@ def _import_eclbinary_prop(
 
 
 def _import_eclbinary_dualporo(
-    self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype, fracture
+    self,
+    grid,
+    fhandle,
+    kwlist,
+    kwname,
+    kwlen,
+    kwtype,
+    kwbyte,
+    name,
+    date,
+    etype,
+    fracture,
 ):
     """Import the actual record for dual poro scheme"""
 
@@ -617,7 +624,7 @@ def _import_eclbinary_dualporo(
     # A lot of code duplication here, as this is under testing
     #
 
-    values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+    values = kwlist.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
 
     # arrays from Eclipse INIT or UNRST are usually for inactive values only.
     # Use the ACTNUM index array for vectorized numpy remapping (need both C
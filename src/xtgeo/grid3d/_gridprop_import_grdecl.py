@@ -2,18 +2,14 @@
 
 from __future__ import print_function, absolute_import
 
-import re
-import os
-from tempfile import mkstemp
-
 import numpy as np
 import numpy.ma as ma
 
 import xtgeo
-import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 from . import _grid_eclbin_record as _eclbin
 from . import _grid3d_utils as utils
+from . import _grdecl_stream
 
 xtg = xtgeo.common.XTGeoDialog()
 
@@ -53,7 +49,24 @@ def import_bgrdecl_prop(self, pfile, name="unknown", grid=None):
     self._nrow = grid.nrow
     self._nlay = grid.nlay
 
-    values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+    # cast REAL (float32) to float64 when decoding
+    dtype = None if kwtype == "INTE" else np.float64
+    ecl = None
+    if local_fhandle:
+        try:
+            ecl = _eclbin.EclBinaryMmap(pfile.name)
+        except (IOError, OSError, ValueError) as err:
+            logger.warning("Cannot memory map %s, use file reads: %s", pfile.name, err)
+
+    if ecl is not None:
+        try:
+            values = ecl.record(kwname, kwlen, kwtype, kwbyte, dtype=dtype)
+        finally:
+            ecl.close()
+    else:
+        values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+        values = values.astype(dtype) if dtype else values
+
     if kwtype == "INTE":
         self._isdiscrete = True
         # make the code list
@@ -64,7 +77,6 @@ def import_bgrdecl_prop(self, pfile, name="unknown", grid=None):
 
     else:
         self._isdiscrete = False
-        values = values.astype(np.float64)  # cast REAL (float32) to float64
         self.codes = {}
 
     # property arrays from binary GRDECL will be for all cells, but they
@@ -94,28 +106,20 @@ def import_grdecl_prop(self, pfile, name="unknown", grid=None):
     self._filesrc = pfile
     actnumv = grid.get_actnum().values
 
-    # This requires that the Python part clean up comments
-    # etc, and make a tmp file.
-    fds, tmpfile = mkstemp(prefix="tmpxtgeo")
-    os.close(fds)
-
-    with open(pfile, "r") as oldfile, open(tmpfile, "w") as newfile:
-        for line in oldfile:
-            if not (re.search(r"^--", line) or re.search(r"^\s+$", line)):
-                newfile.write(line)
-
-    # now read the property
-    nlen = self._ncol * self._nrow * self._nlay
-    ier, values = _cxtgeo.grd3d_import_grdecl_prop(
-        tmpfile, self._ncol, self._nrow, self._nlay, name, nlen, 0,
-    )
-
-    os.remove(tmpfile)
+    # values are in Fortran order in file, i.e. as (nlay, nrow, ncol) in C order
+    values = None
+    for kwname, record in _grdecl_stream.grdecl_records(pfile, (name.upper(),)):
+        if kwname == name.upper():
+            values = np.empty((self._nlay, self._nrow, self._ncol), dtype=np.float64)
+            record.read_values(values.ravel())
+            record.end()
+            break
 
-    if ier != 0:
+    if values is None:
         raise xtgeo.KeywordNotFoundError(
             "Cannot import {}, not present in file {}?".format(name, pfile)
         )
 
+    values = np.ascontiguousarray(values.transpose(2, 1, 0))
     self.values = values.reshape(self.dimensions)
     self.values = ma.masked_equal(self.values, actnumv == 0)
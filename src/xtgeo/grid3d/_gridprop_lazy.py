@@ -0,0 +1,187 @@
+"""Grid property values read on demand from an Eclipse INIT or UNRST file."""
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+from collections import OrderedDict
+import os
+
+import numpy as np
+
+import xtgeo
+from xtgeo.common import XTGeoDialog
+
+from . import _gridprop_import_eclrun
+
+xtg = XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+# pylint: disable=protected-access
+
+
+class _LazyEclSource(object):
+    """An Eclipse INIT or UNRST file, shared by the lazy properties from it.
+
+    The keyword index is made once (when the properties are scanned), and each
+    property holds only its keyword record (name, type, length and byte position).
+    Values are read through a memory map when a property is used. The loaded
+    properties are kept in a LRU list, and if cachesize (MB) is given, the least
+    recently used properties are unloaded (and read again when needed) so the
+    total size of loaded values stays within cachesize.
+    """
+
+    def __init__(self, filename, kwindex, grid, cachesize=None):
+        self.filename = filename
+        self._kwindex = kwindex
+        self._grid = grid
+        self._filestat = _filestat(filename)
+
+        self._maxbytes = None
+        if cachesize is not None:
+            self._maxbytes = int(cachesize * 1024 * 1024)
+
+        self._loaded = OrderedDict()  # id(prop): (prop, values), LRU first
+        self.nbytes = 0
+
+    def load(self, prop, lazyvalues):
+        """Read the values of a property from file."""
+
+        if _filestat(self.filename) != self._filestat:
+            raise RuntimeError(
+                "The file {} has changed after it was scanned, cannot read {}".format(
+                    self.filename, prop.name
+                )
+            )
+
+        logger.info("Read values of lazy property %s", prop.name)
+
+        pfile = xtgeo._XTGeoCFile(self.filename)
+        self._kwindex.open_mmap(pfile)
+        try:
+            _gridprop_import_eclrun.import_eclbinary(
+                prop,
+                pfile.fhandle,
+                name=lazyvalues.name,
+                date=lazyvalues.date,
+                grid=self._grid,
+                etype=lazyvalues.etype,
+                _kwindex=self._kwindex,
+            )
+        finally:
+            self._kwindex.close()
+            pfile.close()
+
+        self._loaded[id(prop)] = (prop, prop._values)
+        self.nbytes += _nbytes(prop._values)
+        self._unload_lru(keep=prop)
+
+    def touch(self, prop):
+        """Mark a loaded property as most recently used."""
+
+        key = id(prop)
+        if key not in self._loaded:
+            return
+        _prop, values = self._loaded.pop(key)
+        if prop._values is not values:
+            # the values are replaced, so the property is not lazy anymore
+            self.nbytes -= _nbytes(values)
+            prop._lazyvalues = None
+            return
+        self._loaded[key] = (prop, values)
+
+    def forget(self, prop):
+        """Remove a property from the LRU list (e.g. when values are set)."""
+
+        entry = self._loaded.pop(id(prop), None)
+        if entry is not None:
+            self.nbytes -= _nbytes(entry[1])
+
+    def _unload_lru(self, keep):
+        if self._maxbytes is None:
+            return
+
+        for key in list(self._loaded.keys()):
+            if self.nbytes <= self._maxbytes:
+                break
+            prop, values = self._loaded[key]
+            if prop is keep:
+                continue
+            del self._loaded[key]
+            self.nbytes -= _nbytes(values)
+            if prop._values is values:
+                logger.info("Unload values of lazy property %s", prop.name)
+                prop._values = None
+            else:
+                prop._lazyvalues = None  # replaced values are kept
+
+
+class _LazyValues(object):
+    """The file source and keyword record for the values of one property.
+
+    The record is (KEYWORD, TYPE, NITEMS, BYTESTART, DATE) as in the keyword index,
+    or None for saturations that are derived from other saturations.
+    """
+
+    def __init__(self, source, name, date, etype, record):
+        self.source = source
+        self.name = name
+        self.date = date
+        self.etype = etype
+        self.record = record
+
+
+def _filestat(filename):
+    fstat = os.stat(filename)
+    return (fstat.st_size, fstat.st_mtime)
+
+
+def _nbytes(values):
+    if values is None:
+        return 0
+    nbytes = np.ma.getdata(values).nbytes
+    if np.ma.getmask(values) is not np.ma.nomask:
+        nbytes += np.ma.getmask(values).nbytes
+    return nbytes
+
+
+def make_lazy(self, source, name, date, etype, grid, record):
+    """Make a property where values are read on demand.
+
+    The metadata are set as import_eclbinary() will set them when values are read.
+    """
+
+    self._ncol = grid.ncol
+    self._nrow = grid.nrow
+    self._nlay = grid.nlay
+    self._dualporo = grid.dualporo
+    self._dualperm = grid.dualperm
+    self._filesrc = source.filename
+
+    append = "M" if grid.dualporo else ""
+    if etype == 1:
+        self._name = name + append
+    else:
+        self._name = name + append + "_" + str(date)
+        self._date = date
+
+    self._isdiscrete = record is not None and record[1] == "INTE"
+    self._codes = {}
+    self._values = None
+    self._lazyvalues = _LazyValues(source, name, date, etype, record)
+
+
+def load_values(self):
+    """Read values of a lazy property if not loaded, otherwise mark as used."""
+
+    lazyvalues = self._lazyvalues
+    if self._values is None:
+        lazyvalues.source.load(self, lazyvalues)
+    else:
+        lazyvalues.source.touch(self)
+
+
+def detach(self):
+    """Make a lazy property an ordinary property (e.g. when values are set)."""
+
+    if self._lazyvalues is not None:
+        self._lazyvalues.source.forget(self)
+        self._lazyvalues = None
@@ -85,7 +85,7 @@ def update_carray(self, undef=None, discrete=None, dtype=None, order="F"):
 
     logger.debug("Entering conversion from numpy to C array ...")
 
-    values = self._values.copy()
+    values = self.values.copy()
 
     if not dtype:
         if dstatus:
@@ -5,6 +5,7 @@ from collections import OrderedDict
 import pandas as pd
 import numpy as np
 
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
 
 from ._grid3d import Grid3D
@@ -101,3 +102,155 @@ def dataframe(
     logger.debug("Dataframe: \n%s", mydataframe)
 
     return mydataframe
+
+
+def dataframe_chunks(
+    self,
+    chunksize=1000000,
+    activeonly=True,
+    ijk=False,
+    xyz=False,
+    doubleformat=False,
+    grid=None,
+):
+    """Yield the dataframe() table as pandas dataframes of chunksize rows.
+
+    The cells are processed in slabs of grid columns (I index), so cell centres
+    and IJK are computed for one slab at the time, not for the whole grid. The
+    rows, columns and dtypes are as in dataframe(), and the index of each chunk
+    continues from the previous. At least one (maybe empty) chunk is yielded.
+    """
+
+    if chunksize < 1:
+        raise ValueError("The chunksize must be a positive integer")
+
+    if xyz and grid is None:
+        raise ValueError("You ask for xyz but no Grid is present. Use " "grid=...")
+
+    props = self.props if self.props is not None else []
+
+    if grid is not None and isinstance(grid, Grid3D):
+        ncol, nrow, nlay = grid.dimensions
+        actnum = grid.get_actnum().values
+        dualactnum = grid.get_actnum(dual=True).values
+    else:
+        ncol, nrow, nlay = self.dimensions
+        if props:
+            actnum = (~np.ma.getmaskarray(props[0].values)).astype(np.int32)
+        else:
+            actnum = np.ones((ncol, nrow, nlay), dtype=np.int32)
+        dualactnum = actnum
+
+    # number of grid columns per slab, so a slab is about one chunk
+    ncolslab = max(1, chunksize // max(1, nrow * nlay))
+
+    carry = []
+    ncarry = 0
+    nrows = 0
+    for icol in range(0, ncol, ncolslab):
+        slab = _dataframe_slab(
+            props,
+            grid,
+            (icol, min(icol + ncolslab, ncol)),
+            actnum,
+            dualactnum,
+            activeonly,
+            ijk,
+            xyz,
+            doubleformat,
+        )
+        carry.append(slab)
+        ncarry += len(slab)
+
+        while ncarry >= chunksize:
+            frame = pd.concat(carry) if len(carry) > 1 else carry[0]
+            chunk = frame.iloc[:chunksize]
+            chunk.index = pd.RangeIndex(nrows, nrows + chunksize)
+            nrows += chunksize
+            yield chunk
+            carry = [frame.iloc[chunksize:]]
+            ncarry -= chunksize
+
+    if ncarry > 0 or nrows == 0:
+        frame = pd.concat(carry) if len(carry) > 1 else carry[0]
+        frame.index = pd.RangeIndex(nrows, nrows + ncarry)
+        yield frame
+
+
+def _dataframe_slab(
+    props, grid, icols, actnum, dualactnum, activeonly, ijk, xyz, doubleformat
+):
+    """Return the dataframe for a slab of grid columns (icols is (start, stop))."""
+
+    icol1, icol2 = icols
+    ncol, nrow, nlay = actnum.shape
+    nslab = icol2 - icol1
+
+    active = actnum[icol1:icol2].ravel() > 0
+    select = active if activeonly else slice(None)
+
+    proplist = OrderedDict()
+
+    if ijk:
+        cells = np.arange(nslab * nrow * nlay, dtype=np.int32)
+        if not activeonly:
+            proplist["ACTNUM"] = dualactnum[icol1:icol2].ravel()
+        proplist["IX"] = (cells // (nrow * nlay) + icol1 + 1)[select]
+        proplist["JY"] = (cells // nlay % nrow + 1)[select]
+        proplist["KZ"] = (cells % nlay + 1)[select]
+
+    if xyz:
+        xcv, ycv, zcv = _slab_xyz(grid, icol1, icol2)
+        proplist["X_UTME"] = xcv[select]
+        proplist["Y_UTMN"] = ycv[select]
+        proplist["Z_TVDSS"] = zcv[select]
+
+    for prop in props:
+        values = prop.values[icol1:icol2].ravel()
+        if activeonly:
+            vector = values.compressed()
+        elif prop.isdiscrete:
+            vector = values.filled(fill_value=0)
+        else:
+            vector = values.filled(fill_value=np.nan)
+
+        if doubleformat:
+            vector = vector.astype(np.float64)
+        else:
+            vector = vector.astype(np.float32)
+
+        proplist[prop.name] = vector
+
+    return pd.DataFrame.from_dict(proplist)
+
+
+def _slab_xyz(grid, icol1, icol2):
+    """Cell centres for a slab of grid columns, as grid.get_xyz() per cell.
+
+    The slab is made as a subgrid of the COORD and ZCORN for these columns.
+    """
+
+    ncol, nrow, nlay = grid.dimensions
+    nslab = icol2 - icol1
+
+    coordsv = grid._coordsv.reshape(nrow + 1, ncol + 1, 6)[:, icol1 : icol2 + 1, :]
+    zcornsv = grid._zcornsv.reshape(nlay + 1, nrow, ncol, 4)[:, :, icol1:icol2, :]
+
+    ntot = nslab * nrow * nlay
+    xcv = np.zeros(ntot, dtype=np.float64)
+    ycv = np.zeros(ntot, dtype=np.float64)
+    zcv = np.zeros(ntot, dtype=np.float64)
+
+    _cxtgeo.grd3d_calc_xyz(
+        nslab,
+        nrow,
+        nlay,
+        coordsv.ravel(),
+        zcornsv.ravel(),
+        np.ones(ntot, dtype=np.int32),
+        xcv,
+        ycv,
+        zcv,
+        0,
+    )
+    return xcv, ycv, zcv
@@ -4,6 +4,7 @@
 import xtgeo
 
 from xtgeo.grid3d import _gridprop_import_eclrun
+from xtgeo.grid3d import _gridprop_lazy
 
 from .grid_property import GridProperty
 from . import _grid3d_utils as utils
@@ -14,7 +15,14 @@ logger = xtg.functionlogger(__name__)
 
 
 def import_ecl_output(
-    props, pfile, names=None, dates=None, grid=None, namestyle=0
+    props,
+    pfile,
+    names=None,
+    dates=None,
+    grid=None,
+    namestyle=0,
+    lazy=False,
+    cachesize=None,
 ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 
     logger.debug("'namestyle' is %s (not in use)", namestyle)
@@ -32,12 +40,11 @@ def import_ecl_output(
         fhandle = pfile.fhandle
         local_fhandle = True
 
-    # scan valid keywords
-    kwlist = utils.scan_keywords(
-        fhandle, fformat="xecl", maxkeys=100000, dataframe=True, dates=True
-    )
+    # scan valid keywords; the index is made once and used for all properties
+    kwindex = utils.EclKeywordIndex.from_pfile(pfile, maxkeys=100000)
+    kwindex.open_mmap(pfile)
 
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
+    kwxlist = kwindex.records
 
     usenames = list()
 
@@ -76,14 +83,12 @@ def import_ecl_output(
 
     validdates = [None]
     if dates:
-        dlist = utils.scan_dates(fhandle)
-
         validdates = []
         alldates = []
         for date in dates:
-            for ditem in dlist:
-                alldates.append(str(ditem[1]))
-                if str(date) == str(ditem[1]):
+            for ditem in kwindex.dates:
+                alldates.append(str(ditem))
+                if str(date) == str(ditem):
                     validdates.append(date)
 
         if not validdates:
@@ -105,6 +110,18 @@ def import_ecl_output(
     logger.info("Use names: %s", use2names)
     logger.info("Valid dates: %s", validdates)
 
+    heads = [kwindex.first("INTEHEAD"), kwindex.first("LOGIHEAD")]
+    kwindex.prefetch(fhandle, [record for record in heads if record is not None])
+
+    if lazy:
+        _import_ecl_output_lazy(
+            props, pfile, fhandle, kwindex, use2names, validdates, grid, cachesize
+        )
+        kwindex.close()
+        if local_fhandle:
+            pfile.close()
+        return
+
     # now import each property
     firstproperty = True
 
@@ -112,6 +129,10 @@ def import_ecl_output(
         # xprop = dict()
         # soil_ok = False
 
+        # read all records needed for this date in one pass, ordered on position
+        records = _needed_records(kwindex, use2names, date)
+        kwindex.prefetch(fhandle, records)
+
         for name in use2names:
 
             logger.info("Get %s", name)
@@ -135,7 +156,7 @@ def import_ecl_output(
                 date=date,
                 grid=grid,
                 etype=etype,
-                _kwlist=kwlist,
+                _kwindex=kwindex,
             )
             if firstproperty:
                 ncol = prop.ncol
@@ -147,6 +168,10 @@ def import_ecl_output(
             props._names.append(propname)
             props._props.append(prop)
 
+        kwindex.release(records)
+
+    kwindex.close()
+
     props._ncol = ncol
     props._nrow = nrow
     props._nlay = nlay
@@ -156,3 +181,101 @@ def import_ecl_output(
 
     if local_fhandle:
         pfile.close()
+
+
+def _import_ecl_output_lazy(
+    props, pfile, fhandle, kwindex, names, validdates, grid, cachesize
+):
+    """Make properties where values are read on demand.
+
+    The grid dimensions and the keywords are checked now, as in import_eclbinary(),
+    so errors are found before values are read.
+    """
+
+    check = GridProperty()
+    _gridprop_import_eclrun._import_eclbinary_meta(
+        check, fhandle, kwindex, 1, None, grid
+    )
+    _gridprop_import_eclrun._import_eclbinary_checks1(check, grid)
+
+    source = _gridprop_lazy._LazyEclSource(
+        pfile.name, kwindex, grid, cachesize=cachesize
+    )
+
+    for date in validdates:
+        etype = 1 if date is None else 5
+        for name in names:
+            record = None
+            if name not in ("SOIL", "SGAS", "SWAT") or kwindex.has(name, date or 0):
+                checked = _gridprop_import_eclrun._import_eclbinary_checks2(
+                    kwindex, name, etype, date
+                )
+                kwname, kwlen, kwtype, kwbyte = checked
+                record = (kwname, kwtype, kwlen, kwbyte, date or 0)
+
+            prop = GridProperty()
+            _gridprop_lazy.make_lazy(prop, source, name, date, etype, grid, record)
+
+            props._names.append(name if date is None else name + "_" + str(date))
+            props._props.append(prop)
+
+    props._ncol = grid.ncol
+    props._nrow = grid.nrow
+    props._nlay = grid.nlay
+
+    if validdates[0] != 0:
+        props._dates = validdates
+
+
+def _needed_records(kwindex, names, date):
+    """Find the records needed to import names for a date (None if INIT).
+
+    The saturations may be derived from each other, so SWAT and SGAS are
+    included if any saturation is asked for.
+    """
+
+    records = []
+
+    usedate = 0 if date is None else date
+    for name in names:
+        usenames = [name]
+        if name in ("SOIL", "SGAS", "SWAT"):
+            usenames.extend(["SWAT", "SGAS"])
+        for usename in usenames:
+            records.append(kwindex.get(usename, usedate))
+
+    return [record for record in records if record is not None]
+
+
+def export_dataframe(props, dfile, fformat="parquet", chunksize=1000000, **kwargs):
+    """Export the dataframe of properties to file, one chunk at the time."""
+
+    fformat = fformat.lower()
+    if fformat not in ("parquet", "csv"):
+        raise ValueError("Invalid file format for dataframe export: " + fformat)
+
+    chunks = props.get_dataframe_chunks(chunksize=chunksize, **kwargs)
+
+    if fformat == "csv":
+        mode = "w"
+        for chunk in chunks:
+            chunk.to_csv(dfile, mode=mode, header=(mode == "w"), index=False)
+            mode = "a"
+        return
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("The pyarrow package is required for parquet export")
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(dfile, table.schema)
+            writer.write_table(table, row_group_size=chunksize)
+    finally:
+        if writer is not None:
+            writer.close()
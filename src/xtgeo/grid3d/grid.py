@@ -21,6 +21,7 @@ from . import _grid_hybrid
 from . import _grid_import
 from . import _grid_export
 from . import _grid_refine
+from . import _grid_volumes
 from . import _grid_etc1
 from . import _grid_wellzone
 from . import _grid3d_fence
@@ -47,12 +48,13 @@ logger = xtg.functionlogger(__name__)
 # METHODS as wrappers to class init + import
 
 
-def grid_from_file(gfile, fformat=None):
+def grid_from_file(gfile, fformat=None, compact=False):
     """Read a grid (cornerpoint) from file and an returns a Grid() instance.
 
     Args:
         gfile(str): Name of file to read grid from
         fformat (str): File format, default is None which means "guess"
+        compact (bool): If True, store ZCORN as float32, cf. :attr:`Grid.compact`
 
     Example::
 
@@ -63,7 +65,7 @@ def grid_from_file(gfile, fformat=None):
 
     obj = Grid()
 
-    obj.from_file(gfile, fformat=fformat)
+    obj.from_file(gfile, fformat=fformat, compact=compact)
 
     return obj
 
@@ -193,12 +195,16 @@ class Grid(Grid3D):
             initprops = kwargs.get("initprops", None)
             restartprops = kwargs.get("restartprops", None)
             restartdates = kwargs.get("restartdates", None)
+            compact = kwargs.get("compact", False)
+            lazyprops = kwargs.get("lazyprops", False)
             self.from_file(
                 args[0],
                 fformat=fformat,
                 initprops=initprops,
                 restartprops=restartprops,
                 restartdates=restartdates,
+                compact=compact,
+                lazyprops=lazyprops,
             )
         logger.info("Ran __init__ for %s", repr(self))
 
@@ -278,6 +284,35 @@ class Grid(Grid3D):
 
         return (ncoord, nzcorn, ntot)
 
+    @property
+    def compact(self):
+        """bool: True if the ZCORN geometry is stored compact, as float32.
+
+        A compact ZCORN takes half the memory, which matters for large grids. It
+        is expanded to float64 on demand, i.e. while a method is computing on the
+        geometry. The precision of float32 is about 7 digits, which is within
+        0.1 m for depths less than 10 000 m.
+
+        :meth:`get_cell_geometry`, :meth:`get_bulk_volume` and
+        :meth:`get_volumes` expand ZCORN for a block of layers at a time. Other
+        methods that compute on the geometry, e.g. :meth:`get_xyz`,
+        :meth:`get_dz`, the search index for cells of points and export, get
+        a full float64 copy of ZCORN while they run, i.e. their peak memory for
+        ZCORN is about 1.5 times the memory of ZCORN stored as float64.
+
+        Example::
+
+            grd = xtgeo.grid_from_file("large.roff", compact=True)
+            grd.compact = False  # convert back to full precision storage
+
+        .. versionadded:: 2.8.0
+        """
+        return _grid_etc1.is_compact(self)
+
+    @compact.setter
+    def compact(self, value):
+        _grid_etc1.set_compact(self, value)
+
     @property
     def ijk_handedness(self):
         """IJK handedness for grids, "right" or "left"
@@ -528,7 +563,14 @@ class Grid(Grid3D):
         self._tmp = {}
 
     def from_file(
-        self, gfile, fformat=None, initprops=None, restartprops=None, restartdates=None,
+        self,
+        gfile,
+        fformat=None,
+        initprops=None,
+        restartprops=None,
+        restartdates=None,
+        compact=False,
+        lazyprops=False,
     ):
 
         """Import grid geometry from file, and makes an instance of this class.
@@ -545,6 +587,12 @@ class Grid(Grid3D):
                 is "eclipserun", then list the names of the properties here.
             restartprops (str list): Optional, see initprops
             restartdates (int list): Optional, required if restartprops
+            compact (bool): If True, store ZCORN as float32, cf. :attr:`compact`.
+                For GRDECL, the values are read directly into float32, while the
+                other formats are converted after import. Default is False.
+            lazyprops (bool): If True, and file format is "eclipserun", the values
+                of initprops and restartprops are read from file when first used,
+                cf. :meth:`GridProperties.from_file`. Default is False.
             _roffapiv (int): Developer option (i.e. don't change)
 
         Example::
@@ -565,6 +613,8 @@ class Grid(Grid3D):
             initprops=initprops,
             restartprops=restartprops,
             restartdates=restartdates,
+            compact=compact,
+            lazyprops=lazyprops,
         )
         self._tmp = {}
 
@@ -1032,6 +1082,7 @@ class Grid(Grid3D):
         val1d = actnum.values.ravel(order="K")
 
         self._actnumsv = _gridprop_lowlevel.c2f_order(self, val1d)
+        self._tmp = {}
 
     def get_dz(self, name="dZ", flip=True, asmasked=True, mask=None):
         """
@@ -1166,6 +1217,34 @@ class Grid(Grid3D):
         # return the dataframe or list of tuples
         return ijklist
 
+    def build_search_index(self, force=False):
+        """Build the search index used for fast point to cell lookups.
+
+        The index is a one layer version of the grid together with maps of I J
+        positions at top and base. It is stored on the grid instance and shared by
+        e.g. :meth:`get_ijk_from_points`, :meth:`get_randomline`,
+        :meth:`report_zone_mismatch` and :meth:`Well.make_ijk_from_grid()
+        <xtgeo.well.Well.make_ijk_from_grid>`. Building it explicitly is not
+        required, but may be done up front when many lookups are planned, e.g.
+        when blocking many wells against the same grid.
+
+        The index is invalidated when the grid geometry (or ACTNUM) is changed
+        through Grid methods, and is then rebuilt on next use.
+
+        Args:
+            force (bool): If True, rebuild the index even if a valid index exists.
+
+        Example::
+
+            grd = xtgeo.Grid("mygrid.roff")
+            grd.build_search_index()
+            for wll in mywells.wells:
+                wll.make_ijk_from_grid(grd)
+
+        .. versionadded:: 2.8.0
+        """
+        _grid3d_fence._update_tmpvars(self, force=force)
+
     def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True, mask=None):
         """Returns 3 xtgeo.grid3d.GridProperty objects: x coordinate,
         ycoordinate, zcoordinate.
@@ -1276,6 +1355,111 @@ class Grid(Grid3D):
         # return the 24 objects in a long tuple (x1, y1, z1, ... x8, y8, z8)
         return grid_props
 
+    def get_cell_geometry(self, activeonly=True, layer_range=None, corners=False):
+        """Returns cell centers, dX, dY, dZ and bulk volume (and corners) at once.
+
+        This computes the cell corners once per cell and derives all the
+        quantities from them, which is much faster than calling
+        :meth:`get_xyz`, :meth:`get_dz`, :meth:`get_dxdy` and
+        :meth:`get_xyz_corners` in sequence. The result is cached on the grid
+        (7 values per cell), until the grid geometry or ACTNUM is changed by a
+        grid method. The corners (24 values per cell) are not cached, but
+        computed in each call where they are asked for.
+
+        The result is a dictionary of masked 3D numpy arrays (not GridProperty
+        objects) with shape (ncol, nrow, nlay) for the layers in layer_range,
+        and keys "X_UTME", "Y_UTMN", "Z_TVDSS" (cell center), "dX", "dY", "dZ"
+        and "BULKVOL". If corners is True, the key "CORNERS" has an array with
+        shape (ncol, nrow, nlay, 24), with x, y, z for each of the 8 corners,
+        ordered as in :meth:`get_xyz_cell_corners`.
+
+        dX and dY are the average lengths of the cell edges in I and J
+        direction, measured in XY, and dZ is the difference between the
+        average base and top depths of the cell. BULKVOL is the (exact) volume
+        of the cell, where faces are bilinear surfaces between the corners.
+
+        The arrays are read only, as they are shared with the cache; make a
+        copy before modifying them.
+
+        Args:
+            activeonly (bool): If True, inactive cells are masked (and not
+                computed).
+            layer_range (tuple): A tuple of two ints, upper layer and lower
+                layer (1-based, inclusive). Default is all layers.
+            corners (bool): If True, include the cell corners.
+
+        Example::
+
+            >>> grid = Grid("gullfaks2.roff")
+            >>> geom = grid.get_cell_geometry(layer_range=(1, 10))
+            >>> print(geom["BULKVOL"].sum(), geom["dZ"].mean())
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _grid_etc1.get_cell_geometry(
+            self, activeonly=activeonly, layer_range=layer_range, corners=corners
+        )
+
+    def get_bulk_volume(self, name="BULKVOL", asmasked=True):
+        """Return the bulk volume of each cell, as a GridProperty object.
+
+        The bulk volume is exact for the corner point geometry, i.e. the cell
+        faces are bilinear surfaces between the cell corners.
+
+        Args:
+            name (str): Name of the property.
+            asmasked (bool): If True, inactive cells are masked (and not
+                computed).
+
+        Example::
+
+            >>> grid = Grid("gullfaks2.roff")
+            >>> bulk = grid.get_bulk_volume()
+            >>> print(bulk.values.sum())
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _grid_volumes.get_bulk_volume(self, name=name, asmasked=asmasked)
+
+    def get_volumes(self, groupby=None, poro=None, ntg=None, sw=None, activeonly=True):
+        """Return sum of bulk, pore and hydrocarbon pore volume, as a dataframe.
+
+        The volumes are summed for each value of a (discrete) property, e.g.
+        zones or regions, in one pass through the grid where the bulk volume
+        of each cell is computed as in :meth:`get_bulk_volume`, and
+        PORV = BULK * poro * ntg and HCPV = PORV * (1 - sw) per cell.
+
+        The layers may be processed in parallel, see :func:`xtgeo.set_nthreads`.
+
+        Args:
+            groupby (GridProperty): Sum per value of this property, e.g. zones.
+                If None, sum for the whole grid. Masked cells are skipped.
+            poro (GridProperty): Porosity. If None, PORV is equal to BULK.
+            ntg (GridProperty): Net to gross. If None, 1 is used.
+            sw (GridProperty): Water saturation. If None, HCPV is equal to PORV.
+            activeonly (bool): If True, only active cells are included.
+
+        Returns:
+            A Pandas dataframe with columns BULK, PORV and HCPV, and one row
+            per value of groupby (in a column named as groupby), sorted
+            by value.
+
+        Example::
+
+            >>> grid = Grid("reek.roff")
+            >>> zones = GridProperty("reek_zones.roff", name="Zone")
+            >>> poro = GridProperty("reek_poro.roff", name="PORO")
+            >>> print(grid.get_volumes(groupby=zones, poro=poro))
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _grid_volumes.get_volumes(
+            self, groupby=groupby, poro=poro, ntg=ntg, sw=sw, activeonly=activeonly
+        )
+
     def get_layer_slice(self, layer, top=True, activeonly=True):
         """Get numpy arrays for cell coordinates e.g. for plotting.
 
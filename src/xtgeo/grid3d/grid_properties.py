@@ -9,6 +9,7 @@ import warnings
 
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGDescription
+import xtgeo.common.sys as xtgeosys
 
 from ._grid3d import Grid3D
 from .grid_property import GridProperty
@@ -250,7 +251,15 @@ class GridProperties(Grid3D):
     # for some file types such as Eclipse INIT and UNRST, and Roff
 
     def from_file(
-        self, pfile, fformat="roff", names=None, dates=None, grid=None, namestyle=0
+        self,
+        pfile,
+        fformat="roff",
+        names=None,
+        dates=None,
+        grid=None,
+        namestyle=0,
+        lazy=False,
+        cachesize=None,
     ):
         """Import grid properties from file in one go.
 
@@ -267,17 +276,31 @@ class GridProperties(Grid3D):
             grid (obj): The grid geometry object (optional if ROFF)
             namestyle (int): 0 (default) for style SWAT_20110223,
                 1 for SWAT--2011_02_23 (applies to restart only)
+            lazy (bool): If True (INIT and UNRST only), the file is scanned now,
+                while the values of each property are read from file when
+                first used (cf. :attr:`GridProperty.lazy`). Default is False.
+            cachesize (int): For lazy properties, the maximum size (MB) of values
+                kept in memory; the least recently used values are unloaded and
+                read again when needed. Note that changes made directly in the
+                values array of an unloaded property are lost. Default is None,
+                meaning no limit.
 
         Example::
             >>> props = GridProperties()
             >>> props.from_file('ECL.UNRST', fformat='unrst',
                 dates=[20110101, 20141212], names=['PORO', 'DZ']
 
+            >>> # lazy; only the properties used are read from file
+            >>> props.from_file('ECL.UNRST', fformat='unrst', names='all',
+                dates=alldates, grid=grd, lazy=True, cachesize=1000)
+            >>> pres = props.get_prop_by_name('PRESSURE_20141212').values
+
         Raises:
             FileNotFoundError: if input file is not found
             ValueError: if a property is not found
             RuntimeWarning: if some dates are not found
 
+        .. versionchanged:: 2.8.0 Added lazy and cachesize keys
         """
 
         # work on file extension
@@ -312,7 +335,14 @@ class GridProperties(Grid3D):
 
         elif fformat.lower() in ("init", "unrst"):
             _gridprops_io.import_ecl_output(
-                self, pfile, dates=dates, grid=grid, names=names, namestyle=namestyle
+                self,
+                pfile,
+                dates=dates,
+                grid=grid,
+                names=names,
+                namestyle=namestyle,
+                lazy=lazy,
+                cachesize=cachesize,
             )
         else:
             raise IOError("Invalid file format")
@@ -371,6 +401,101 @@ class GridProperties(Grid3D):
 
     dataframe = get_dataframe  # for compatibility, but deprecated
 
+    def get_dataframe_chunks(
+        self,
+        chunksize=1000000,
+        activeonly=False,
+        ijk=False,
+        xyz=False,
+        doubleformat=False,
+        grid=None,
+    ):
+        """Returns a generator of Pandas dataframes, each with chunksize rows.
+
+        This is as :meth:`get_dataframe`, but the table is made in chunks, so
+        large grids with many properties can be processed (or written to file)
+        without making the complete table in memory. The cell centres and cell
+        indices (xyz and ijk) are computed per chunk.
+
+        Args:
+            chunksize (int): Number of rows per chunk (the last chunk may
+                have fewer rows).
+            activeonly (bool): If True, return only active cells.
+            ijk (bool): If True, show cell indices, IX JY KZ columns
+            xyz (bool): If True, show cell center coordinates (needs grid).
+            doubleformat (bool): If True, floats are 64 bit, otherwise 32 bit.
+            grid (Grid): The grid geometry object. This is required for the
+                xyz option.
+
+        Example::
+
+            for chunk in xpr.get_dataframe_chunks(chunksize=500000, grid=grd,
+                                                  activeonly=True, xyz=True):
+                print(chunk["PRESSURE_19991201"].mean())
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _gridprops_etc.dataframe_chunks(
+            self,
+            chunksize=chunksize,
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=grid,
+        )
+
+    def dataframe_to_file(
+        self,
+        dfile,
+        fformat="parquet",
+        chunksize=1000000,
+        activeonly=False,
+        ijk=False,
+        xyz=False,
+        doubleformat=False,
+        grid=None,
+    ):
+        """Export the :meth:`get_dataframe` table to file, chunk by chunk.
+
+        The table is never made in full, cf. :meth:`get_dataframe_chunks`.
+
+        Args:
+            dfile (str): Name of output file.
+            fformat (str): File format, "parquet" (requires the pyarrow package)
+                or "csv".
+            chunksize (int): Number of rows processed per chunk; for parquet,
+                this is also the row group size.
+            activeonly (bool): If True, export only active cells.
+            ijk (bool): If True, export cell indices, IX JY KZ columns
+            xyz (bool): If True, export cell center coordinates (needs grid).
+            doubleformat (bool): If True, floats are 64 bit, otherwise 32 bit.
+            grid (Grid): The grid geometry object. This is required for the
+                xyz option.
+
+        Example::
+
+            xpr.dataframe_to_file("reek.parquet", grid=grd, activeonly=True,
+                                  ijk=True, xyz=True)
+
+        .. versionadded:: 2.8.0
+        """
+
+        xtgeosys.check_folder(dfile, raiseerror=OSError)
+
+        _gridprops_io.export_dataframe(
+            self,
+            dfile,
+            fformat=fformat,
+            chunksize=chunksize,
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=grid,
+        )
+
     # Static methods (scans etc)
     # Don't make a GridProperties instance inside other XTGeo classes
     # as it make cyclic imports. I.e. use only these functions in clients
@@ -32,6 +32,7 @@ from . import _gridprop_import
 from . import _gridprop_roxapi
 from . import _gridprop_export
 from . import _gridprop_lowlevel
+from . import _gridprop_lazy
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
@@ -197,6 +198,7 @@ class GridProperty(Grid3D):
         self._roxar_dtype = kwargs.get("roxar_dtype", np.float32)
 
         self._values = kwargs.get("values", None)
+        self._lazyvalues = None  # file source if values are read on demand
 
         if len(args) == 1:
             # make instance through grid instance or file import
@@ -314,7 +316,7 @@ class GridProperty(Grid3D):
         When setting, note that the the dtype must correspond to the
         `isdiscrete` property.
         """
-        return self._values.dtype
+        return self.values.dtype
 
     @dtype.setter
     def dtype(self, dtype):
@@ -391,9 +393,23 @@ class GridProperty(Grid3D):
         """Number of codes if discrete grid property (read only)."""
         return len(self._codes)
 
+    @property
+    def lazy(self):
+        """True if values are read on demand from file (read-only).
+
+        Cf. :meth:`GridProperties.from_file` with ``lazy=True``. The values are
+        read when used, e.g. by ``values``. Setting ``values`` will make the
+        property an ordinary property.
+
+        .. versionadded:: 2.8.0
+        """
+        return self._lazyvalues is not None
+
     @property
     def values(self):
         """ Return or set the grid property as a masked 3D numpy array"""
+        if self._lazyvalues is not None:
+            _gridprop_lazy.load_values(self)
         return self._values
 
     @values.setter
@@ -401,6 +417,7 @@ class GridProperty(Grid3D):
 
         values = self.ensure_correct_values(self.ncol, self.nrow, self.nlay, values)
 
+        _gridprop_lazy.detach(self)
         self._values = values
 
     @property
@@ -423,7 +440,7 @@ class GridProperty(Grid3D):
     @property
     def values3d(self):
         """For backward compatibility (use values instead)"""
-        return self._values
+        return self.values
 
     @values3d.setter
     def values3d(self, values):
@@ -433,7 +450,7 @@ class GridProperty(Grid3D):
     @property
     def values1d(self):
         """Returns a 1D view of values (masked numpy) (read only)."""
-        return self._values.reshape(-1)
+        return self.values.reshape(-1)
 
     @property
     def undef(self):
@@ -496,9 +513,10 @@ class GridProperty(Grid3D):
         """
 
         currentmask = None
-        if self._values is not None:
-            if isinstance(self._values, np.ma.MaskedArray):
-                currentmask = np.ma.getmaskarray(self._values)
+        if not isinstance(invalues, np.ma.MaskedArray):
+            # use self.values, as a lazy property shall be loaded to get its mask
+            if isinstance(self.values, np.ma.MaskedArray):
+                currentmask = np.ma.getmaskarray(self.values)
 
         if np.isscalar(invalues):
             vals = np.ma.zeros((ncol, nrow, nlay), order="C", dtype=self.dtype)
@@ -703,7 +721,7 @@ class GridProperty(Grid3D):
         dsc.txt("Codes", self._codes)
         dsc.txt("Shape: NCOL, NROW, NLAY", self.ncol, self.nrow, self.nlay)
         np.set_printoptions(threshold=16)
-        dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
+        dsc.txt("Values", self.values.reshape(-1), self.values.dtype)
         np.set_printoptions(threshold=1000)
         dsc.txt(
             "Values, mean, stdev, minimum, maximum",
@@ -837,7 +855,7 @@ class GridProperty(Grid3D):
             ncol=self._ncol,
             nrow=self._nrow,
             nlay=self._nlay,
-            values=self._values.copy(),
+            values=self.values.copy(),
             name=newname,
         )
 
@@ -855,9 +873,9 @@ class GridProperty(Grid3D):
     def mask_undef(self):
         """Make UNDEF values masked."""
         if self._isdiscrete:
-            self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_INT_LIMIT)
+            self._values = np.ma.masked_greater(self.values, xtgeo.UNDEF_INT_LIMIT)
         else:
-            self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_LIMIT)
+            self._values = np.ma.masked_greater(self.values, xtgeo.UNDEF_LIMIT)
 
     def crop(self, spec):
         """Crop a property, see method under grid"""
@@ -957,7 +975,7 @@ class GridProperty(Grid3D):
 
         if self.isdiscrete:
             logger.info("Converting to continuous ...")
-            val = self._values.copy()
+            val = self.values.copy()
             val = val.astype("float64")
             self._values = val
             self._isdiscrete = False
@@ -971,7 +989,7 @@ class GridProperty(Grid3D):
 
         if not self.isdiscrete:
             logger.info("Converting to discrete ...")
-            val = self._values.copy()
+            val = self.values.copy()
             val = val.astype(np.int32)
             self._values = val
             self._isdiscrete = True
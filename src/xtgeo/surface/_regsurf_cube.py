@@ -10,6 +10,7 @@ import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGShowProgress
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 
@@ -56,6 +57,9 @@ def slice_cube(
     else:
         opt2 = 1
 
+    if cube.lazy:
+        cube = _lazy_subcube(other, cube, 0.0)
+
     if deadtraces:
         # set dead traces to cxtgeo UNDEF -> special treatment in the C code
         olddead = cube.values_dead_traces(xtgeo.UNDEF)
@@ -172,25 +176,48 @@ def slice_cube_window(
     logger.info("ZRANGE is %s", zrange)
     logger.info("NDIV is set to %s (%s)", ndiv, ndivmode)
 
-    # This will run slice in a loop within a window. Then, numpy methods
-    # are applied to get the attributes
+    if cube.lazy:
+        cube = _lazy_subcube(this, cube, zrange)
 
-    if other is None and algorithm == 1:
-        attvalues = _slice_constant_window(
+    if algorithm == 2:
+        # one pass in C per trace, with no stack of slices
+        zincr = zrange / float(ndiv)
+        if other is None:
+            nabove = nbelow = ndiv
+        elif other_position == "above":
+            nabove, nbelow = ndiv, 0
+        else:
+            nabove, nbelow = 0, ndiv
+
+        attvalues = _slice_window_engine(
             this,
             cube,
             sampling,
-            zrange,
-            ndiv,
+            zincr,
+            nabove,
+            nbelow,
             mask,
             attrlist,
             snapxy,
-            showprogress=showprogress,
+            other=other,
             deadtraces=deadtraces,
             deletecube=deletecube,
         )
-    elif other is None and algorithm == 2:
-        attvalues = _slice_constant_window2(
+
+        if other is not None:
+            # for cases with erosion, the two surfaces are equal
+            mul = -1 if other_position == "above" else 1
+            isovalues = mul * (other.values - this.values)
+            for attr in attrlist:
+                attvalues[attr] = ma.masked_where(
+                    isovalues < maskthreshold, attvalues[attr]
+                )
+
+    # This will run slice in a loop within a window. Then, numpy methods
+    # are applied to get the attributes (algorithm 1)
+
+    elif other is None:
+        attvalues = _slice_constant_window(
             this,
             cube,
             sampling,
@@ -223,20 +250,31 @@ def slice_cube_window(
 
     results = dict()
 
-    if algorithm != 2:
-        for attr in attrlist:
-            scopy = self.copy()
-            scopy.values = attvalues[attr]
-            results[attr] = scopy
+    for attr in attrlist:
+        scopy = self.copy()
+        scopy.values = attvalues[attr]
+        results[attr] = scopy
+
+    # for backward compatibility
+    if qattr_is_string:
+        self.values = attvalues[attrlist[0]]
+        return None
+
+    return results
+
 
-        # for backward compatibility
-        if qattr_is_string:
-            self.values = attvalues[attrlist[0]]
-            return None
+def _lazy_subcube(this, cube, zrange):
+    """Return the part of a lazy cube needed for sampling within zrange of this."""
 
-        return results
+    xcoords, ycoords, zvalues = this.get_xyz_values1d(activeonly=True)
 
-    return None
+    if zvalues.size == 0:
+        zmin = zmax = cube.zori
+    else:
+        zmin = zvalues.min() - zrange
+        zmax = zvalues.max() + zrange
+
+    return _cube_lazy.subcube(cube, xcoords, ycoords, zmin, zmax)
 
 
 def _slice_constant_window(
@@ -305,27 +343,34 @@ def _slice_constant_window(
     return attvalues  # this is dict with numpies, one per attribute
 
 
-# NOT FINISHED:
-def _slice_constant_window2(  # pylint: disable=unused-argument
+def _slice_window_engine(
     this,
     cube,
     sampling,
-    zrange,
-    ndiv,
+    zincr,
+    nabove,
+    nbelow,
     mask,
     attrlist,
     snapxy,
-    showprogress=False,
+    other=None,
     deadtraces=True,
     deletecube=False,
 ):
-    """Slice a window, (constant in vertical extent); faster and better
-    algorithm (algorithm2).
+    """Slice a window and compute attributes in C (algorithm 2).
+
+    All attributes are computed trace by trace in one pass with streaming
+    accumulators, so no stack of slices is made. The window is nabove increments
+    above and nbelow increments below the surface. If other is given, samples
+    beyond other are not used.
     """
 
-    zincr = zrange / float(ndiv)
-    ztmp = this.copy()
-    ztmp.values = ztmp.values - zincr * (ndiv + 1)
+    for attr in attrlist:
+        if attr not in ALLATTRS:
+            raise ValueError("Invalid attribute applied: {}".format(attr))
+
+    attrsel = np.array([1 if attr in attrlist else 0 for attr in ALLATTRS], np.int32)
+    selected = [attr for attr in ALLATTRS if attr in attrlist]
 
     if mask:
         opt2 = 0
@@ -344,11 +389,16 @@ def _slice_constant_window2(  # pylint: disable=unused-argument
         if snapxy:
             usesampling = 2
 
-    # allocate the attribute maps
-    nattr = 5  # predefined attributes
-    nsurf = ztmp.ncol * ztmp.nrow * nattr
+    zvalues = this.get_values1d()
+    useother = 0
+    othervalues = zvalues
+    if other is not None:
+        useother = 1
+        othervalues = other.get_values1d()
+
+    nsurf = this.ncol * this.nrow
 
-    istat, _attrmaps = _cxtgeo.surf_slice_cube_window(
+    istat, attrmaps = _cxtgeo.surf_slice_cube_window(
         cube.ncol,
         cube.nrow,
         cube.nlay,
@@ -361,19 +411,22 @@ def _slice_constant_window2(  # pylint: disable=unused-argument
         cube.rotation,
         cube.yflip,
         cubeval1d,
-        ztmp.ncol,
-        ztmp.nrow,
-        ztmp.xori,
-        ztmp.xinc,
-        ztmp.yori,
-        ztmp.yinc,
-        ztmp.yflip,
-        ztmp.rotation,
-        ztmp.get_values1d(),
+        this.ncol,
+        this.nrow,
+        this.xori,
+        this.xinc,
+        this.yori,
+        this.yinc,
+        this.yflip,
+        this.rotation,
+        zvalues,
+        othervalues,
         zincr,
-        ndiv * 2,
-        nsurf,
-        nattr,
+        nabove,
+        nbelow,
+        useother,
+        attrsel,
+        nsurf * len(selected),
         usesampling,
         opt2,
     )
@@ -387,7 +440,12 @@ def _slice_constant_window2(  # pylint: disable=unused-argument
     if deletecube:
         del cube
 
-    return istat
+    attvalues = dict()
+    for num, attr in enumerate(selected):
+        values = attrmaps[num * nsurf : (num + 1) * nsurf].reshape(this.ncol, this.nrow)
+        attvalues[attr] = ma.masked_greater(values, xtgeo.UNDEF_LIMIT)
+
+    return attvalues  # this is dict with numpies, one per attribute
 
 
 def _slice_between_surfaces(
@@ -5,11 +5,18 @@ from __future__ import division, absolute_import
 from __future__ import print_function
 
 import warnings
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 import numpy.ma as ma
 import scipy.interpolate
 import scipy.ndimage
+import scipy.sparse
+import scipy.spatial
 
 import xtgeo
 
@@ -71,6 +78,7 @@ def avgsum_from_3dprops_gridding(
     coarsen=1,
     zone_avg=False,
     mask_outside=False,
+    workers=1,
 ):
 
     """Get surface average from a 3D grid prop."""
@@ -124,73 +132,46 @@ def avgsum_from_3dprops_gridding(
     zoneprop = ma.masked_less(zoneprop, zone_minmax[0])
     zoneprop = ma.masked_greater(zoneprop, zone_minmax[1])
 
-    for klay0 in range(gnlay):
-
-        k1lay = klay0 + 1
-
-        if k1lay == 1:
-            msum = np.zeros((self.ncol, self.nrow), order="C")
-            dzsum = np.zeros((self.ncol, self.nrow), order="C")
-
-        numz = zoneprop[::, ::, klay0].mean()
-        if isinstance(numz, float):
-            numz = int(round(zoneprop[::, ::, klay0].mean()))
-            if numz < zone_minmax[0] or numz > zone_minmax[1]:
-                continue
-        else:
-            continue
-
-        qmcompute = True
-        if summing:
-            propsum = mprop[:, :, klay0].sum()
-            if abs(propsum) < 1e-12:
-                logger.info("Too little HC, skip layer K = %s", k1lay)
-                qmcompute = False
-            else:
-                logger.debug("Z property sum is %s", propsum)
-
-        logger.info("Mapping for layer or zone %s ....", k1lay)
-
-        xcv = xprop[::, ::, klay0].ravel(order="C")
-        ycv = yprop[::, ::, klay0].ravel(order="C")
-        mvv = mprop[::, ::, klay0].ravel(order="C")
-        dzv = dzprop[::, ::, klay0].ravel(order="C")
-        wei = weights[::, ::, klay0].ravel(order="C")
-
-        # this is done to avoid problems if undef values still remains
-        # in the coordinates (assume Y undef where X undef):
-        xcc = xcv.copy()
-        xcv = xcv[xcc < 1e20]
-        ycv = ycv[xcc < 1e20]
-        mvv = mvv[xcc < 1e20]
-        dzv = dzv[xcc < 1e20]
-        wei = wei[xcc < 1e20]
-
-        if summing:
-            mvdz = mvv * wei
-        else:
-            mvdz = mvv * dzv * wei
-
-        if qmcompute:
-            try:
-                mvdzi = scipy.interpolate.griddata(
-                    (xcv, ycv), mvdz, (xiv, yiv), method="linear", fill_value=0.0
-                )
-            except ValueError:
-                warnings.warn("Some problems in gridding ... will contue", UserWarning)
-                continue
+    # the triangulation and interpolation weights depend only on the xy footprint
+    # of the layer, so they are computed once and reused by layers that share it
+    wcache = _GriddingWeights(xiv, yiv)
+
+    layerjob = functools.partial(
+        _avgsum_layer,
+        xprop=xprop,
+        yprop=yprop,
+        mprop=mprop,
+        dzprop=dzprop,
+        zoneprop=zoneprop,
+        weights=weights,
+        zone_minmax=zone_minmax,
+        summing=summing,
+        trimbydz=trimbydz,
+        wcache=wcache,
+    )
 
-            msum = msum + mvdzi
+    msum = np.zeros((self.ncol, self.nrow), order="C")
+    dzsum = np.zeros((self.ncol, self.nrow), order="C")
 
-        if trimbydz:
-            try:
-                dzi = scipy.interpolate.griddata(
-                    (xcv, ycv), dzv, (xiv, yiv), method="linear", fill_value=0.0
-                )
-            except ValueError:
-                continue
+    # layers are gridded in parallel if workers > 1, but the partial results are
+    # always summed in layer order so that the result is identical to serial mode
+    pool = None
+    if workers is not None and workers > 1 and gnlay > 1:
+        logger.info("Gridding layers using %s threads", workers)
+        pool = ThreadPool(processes=min(workers, gnlay))
+        layerresults = pool.imap(layerjob, range(gnlay))
+    else:
+        layerresults = (layerjob(klay0) for klay0 in range(gnlay))
 
-            dzsum = dzsum + dzi
+    try:
+        for mvdzi, dzi in layerresults:
+            if mvdzi is not None:
+                msum = msum + mvdzi
+            if dzi is not None:
+                dzsum = dzsum + dzi
+    finally:
+        if pool is not None:
+            pool.terminate()
 
     if not summing:
         dzsum[dzsum == 0.0] = 1e-20
@@ -213,6 +194,155 @@ def avgsum_from_3dprops_gridding(
     return True
 
 
+def _avgsum_layer(
+    klay0,
+    xprop=None,
+    yprop=None,
+    mprop=None,
+    dzprop=None,
+    zoneprop=None,
+    weights=None,
+    zone_minmax=None,
+    summing=False,
+    trimbydz=False,
+    wcache=None,
+):
+    """Grid one layer (or zone); returns (mvdzi, dzi) where each may be None."""
+
+    k1lay = klay0 + 1
+
+    numz = zoneprop[::, ::, klay0].mean()
+    if isinstance(numz, float):
+        numz = int(round(zoneprop[::, ::, klay0].mean()))
+        if numz < zone_minmax[0] or numz > zone_minmax[1]:
+            return None, None
+    else:
+        return None, None
+
+    qmcompute = True
+    if summing:
+        propsum = mprop[:, :, klay0].sum()
+        if abs(propsum) < 1e-12:
+            logger.info("Too little HC, skip layer K = %s", k1lay)
+            qmcompute = False
+        else:
+            logger.debug("Z property sum is %s", propsum)
+
+    if not qmcompute and not trimbydz:
+        return None, None
+
+    logger.info("Mapping for layer or zone %s ....", k1lay)
+
+    xcv = xprop[::, ::, klay0].ravel(order="C")
+    ycv = yprop[::, ::, klay0].ravel(order="C")
+    mvv = mprop[::, ::, klay0].ravel(order="C")
+    dzv = dzprop[::, ::, klay0].ravel(order="C")
+    wei = weights[::, ::, klay0].ravel(order="C")
+
+    # this is done to avoid problems if undef values still remains
+    # in the coordinates (assume Y undef where X undef):
+    xcc = xcv.copy()
+    xcv = xcv[xcc < 1e20]
+    ycv = ycv[xcc < 1e20]
+    mvv = mvv[xcc < 1e20]
+    dzv = dzv[xcc < 1e20]
+    wei = wei[xcc < 1e20]
+
+    if summing:
+        mvdz = mvv * wei
+    else:
+        mvdz = mvv * dzv * wei
+
+    try:
+        wmat = wcache.get(xcv, ycv)
+    except ValueError:
+        warnings.warn("Some problems in gridding ... will contue", UserWarning)
+        return None, None
+
+    mvdzi = None
+    dzi = None
+
+    if qmcompute:
+        mvdzi = wcache.apply(wmat, mvdz)
+
+    if trimbydz:
+        dzi = wcache.apply(wmat, dzv)
+
+    return mvdzi, dzi
+
+
+class _GriddingWeights(object):
+    """Linear (Delaunay) gridding weights, cached per xy footprint.
+
+    A call to scipy.interpolate.griddata() with method "linear" builds a Delaunay
+    triangulation of the input points and interpolates with barycentric weights.
+    Here the weights are stored as a sparse matrix W (nmapnodes x npoints) so
+    that W.dot(values) gives the same result as griddata with fill_value=0.0,
+    and any number of value arrays on the same footprint cost one mat-vec each.
+    """
+
+    def __init__(self, xiv, yiv, maxsize=4):
+        self._shape = xiv.shape
+        self._xyi = np.column_stack((xiv.ravel(), yiv.ravel()))
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()  # layers may be gridded in threads
+
+    def get(self, xcv, ycv):
+        """Get (cached) weights for points xcv, ycv; ValueError if impossible."""
+
+        key = hashlib.sha1(xcv.tobytes() + ycv.tobytes()).hexdigest()
+
+        with self._lock:
+            cached = self._cache.get(key, None)
+
+        if cached is not None:
+            xcc, ycc, wmat = cached
+            if np.array_equal(xcc, xcv) and np.array_equal(ycc, ycv):
+                logger.debug("Reuse triangulation for xy footprint")
+                return wmat
+
+        wmat = self._make_weights(xcv, ycv)
+
+        with self._lock:
+            self._cache[key] = (xcv.copy(), ycv.copy(), wmat)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        return wmat
+
+    def apply(self, wmat, values):
+        """Return interpolated map nodes as 2D array (fill value is 0.0)."""
+        return wmat.dot(values).reshape(self._shape)
+
+    def _make_weights(self, xcv, ycv):
+        if xcv.size < 3:
+            raise ValueError("Too few points for linear gridding")
+
+        points = np.column_stack((xcv, ycv))
+        try:
+            tri = scipy.spatial.Delaunay(points)
+        except RuntimeError as err:  # QhullError
+            raise ValueError("Could not triangulate: {}".format(err))
+
+        simplex = tri.find_simplex(self._xyi)
+        inside = np.flatnonzero(simplex >= 0)
+        isimp = simplex[inside]
+
+        # barycentric coordinates, as in scipy's LinearNDInterpolator
+        trans = tri.transform[isimp]
+        bary2 = np.einsum(
+            "ijk,ik->ij", trans[:, :2, :], self._xyi[inside] - trans[:, 2, :]
+        )
+        bary = np.column_stack((bary2, 1.0 - bary2.sum(axis=1)))
+
+        wmat = scipy.sparse.csr_matrix(
+            (bary.ravel(), (np.repeat(inside, 3), tri.simplices[isimp].ravel())),
+            shape=(self._xyi.shape[0], points.shape[0]),
+        )
+        return wmat
+
+
 def _zone_averaging(
     xprop, yprop, zoneprop, zone_minmax, coarsen, zone_avg, dzprop, mprop, summing=False
 ):
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Statistics of Surfaces, where surfaces are folded in one by one.
+
+The memory use is independent of the number of surfaces, and surfaces given as
+files (lazy) are read only when needed. Mean and standard deviation are
+computed with Welford's algorithm, together with min, max and count of defined
+values per node.
+
+Percentiles are approximated from a histogram per node, made in a second pass
+with nbins bins between the min and max value of each node.
+"""
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import numpy as np
+
+import xtgeo
+
+xtg = xtgeo.common.XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+
+def statistics(self, percentiles=None, nbins=100):
+    """Mean, std, min, max and count (and percentiles) per node."""
+
+    template = None
+    count = mean = msum2 = vmin = vmax = None
+
+    for surf in self._iter_surfaces():
+        if template is None:
+            template = surf.copy()
+            shape = template.values.shape
+            count = np.zeros(shape, dtype=np.int64)
+            mean = np.zeros(shape, dtype=np.float64)
+            msum2 = np.zeros(shape, dtype=np.float64)
+            vmin = np.full(shape, np.nan)
+            vmax = np.full(shape, np.nan)
+
+        values, valid = _surface_values(template, surf)
+
+        count += valid
+        delta = np.where(valid, values - mean, 0.0)
+        mean += delta / np.maximum(count, 1)
+        msum2 += delta * np.where(valid, values - mean, 0.0)
+        np.fmin(vmin, values, out=vmin)
+        np.fmax(vmax, values, out=vmax)
+
+    if template is None:
+        raise ValueError("Cannot do statistics, there are no surfaces")
+
+    result = {}
+
+    template.values = np.ma.array(mean, mask=count == 0)
+    result["mean"] = template.copy()
+
+    # std, run with degree of freedom ddof=1, similar to RMS
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(msum2 / (count - 1))
+    template.values = np.ma.array(std, mask=count < 2)
+    result["std"] = template.copy()
+
+    template.values = np.ma.array(vmin, mask=count == 0)
+    result["min"] = template.copy()
+
+    template.values = np.ma.array(vmax, mask=count == 0)
+    result["max"] = template.copy()
+
+    template.values = count.astype(np.float64)
+    result["count"] = template.copy()
+
+    if percentiles:
+        pvalues = _percentiles(self, template, percentiles, nbins, count, vmin, vmax)
+        for pcent, pval in zip(percentiles, pvalues):
+            template.values = np.ma.array(pval, mask=count == 0)
+            result["p{:g}".format(pcent)] = template.copy()
+
+    return result
+
+
+def _surface_values(template, surf):
+    """Values as float64 array with nan for undefined, and the defined flags."""
+
+    if not template.compare_topology(surf, strict=False):
+        raise ValueError("Cannot do statistics, surfaces differ in topology")
+
+    values = np.ma.filled(surf.values.astype(np.float64), fill_value=np.nan)
+    return values, np.isfinite(values)
+
+
+def _percentiles(self, template, percentiles, nbins, count, vmin, vmax):
+    """Approximate percentiles from a histogram per node (second pass)."""
+
+    for pcent in percentiles:
+        if not 0 <= pcent <= 100:
+            raise ValueError("Percentile shall be in range 0 - 100: {}".format(pcent))
+
+    nodes = np.arange(count.size).reshape(count.shape)
+    width = (vmax - vmin) / nbins
+    hdtype = np.uint16 if count.max() < np.iinfo(np.uint16).max else np.uint32
+    hist = np.zeros((nbins,) + count.shape, dtype=hdtype)
+    hflat = hist.reshape(-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for surf in self._iter_surfaces():
+            values, valid = _surface_values(template, surf)
+            ibin = np.where(width > 0, (values - vmin) / width, 0.0)
+            ibin = np.clip(np.where(valid, ibin, 0), 0, nbins - 1).astype(np.int64)
+            hflat[(ibin * count.size + nodes)[valid]] += 1
+
+    # rank as in numpy.percentile (linear interpolation between the values at
+    # the nearest ranks), where values are assumed evenly spread within a bin
+    cumhist = np.cumsum(hist, axis=0, dtype=np.int32 if hdtype == np.uint16 else None)
+    del hist, hflat
+
+    result = []
+    for pcent in percentiles:
+        rank = pcent / 100.0 * np.maximum(count - 1, 0)
+        rlow = np.floor(rank)
+        vlow = _value_at_rank(cumhist, rlow, vmin, width)
+        vhigh = _value_at_rank(cumhist, np.minimum(rlow + 1, count - 1), vmin, width)
+        pvalues = vlow + (rank - rlow) * (vhigh - vlow)
+        result.append(np.clip(pvalues, vmin, vmax))
+
+    return result
+
+
+def _value_at_rank(cumhist, rank, vmin, width):
+    """Estimate the value with given (integer) rank per node from the histogram."""
+
+    nbins = cumhist.shape[0]
+    ibin = np.minimum((cumhist <= rank).sum(axis=0), nbins - 1)
+
+    # as np.take_along_axis (numpy >= 1.15) along the first axis
+    flat = cumhist.reshape(nbins, -1)
+    nodes = np.arange(ibin.size)
+    above = flat[ibin.ravel(), nodes].reshape(ibin.shape)
+    below = np.where(
+        ibin > 0, flat[np.maximum(ibin - 1, 0).ravel(), nodes].reshape(ibin.shape), 0
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = (rank - below + 0.5) / (above - below)
+    return vmin + width * (ibin + frac)
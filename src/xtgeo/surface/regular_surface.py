@@ -2099,7 +2099,11 @@ class RegularSurface(object):
             deadtraces (bool): If True (default) then dead cube traces
                 (given as value 2 in SEGY trace headers), are treated as
                 undefined, nad map will be undefined at dead trace location.
-            algorithm (int): 1 for old method, 2 for new alternative.
+            algorithm (int): 1 (default) makes a stack of sliced maps and
+                applies numpy functions on that. 2 computes all attributes in one
+                pass per trace, without keeping the sliced maps in memory, which
+                is much faster and uses less memory for large maps. The results
+                are equal within float rounding.
 
         Example::
 
@@ -2123,6 +2127,8 @@ class RegularSurface(object):
             If attribute is a string, then the instance is updated and
             None is returned. If attribute is a list, then a dictionary
             of surface objects is returned.
+
+        .. versionchanged:: 2.8.0 Algorithm 2 supports all attributes
         """
 
         if other is None and zrange is None:
@@ -2237,6 +2243,7 @@ class RegularSurface(object):
         zone_avg=False,
         coarsen=1,
         mask_outside=False,
+        workers=1,
     ):
         """Make a thickness weighted HC thickness map.
 
@@ -2267,8 +2274,13 @@ class RegularSurface(object):
                 speed up process, but less precise result. Default=1
             mask_outside (bool): Will mask the result map undef where sum of DZ
                 is zero. Default is False as it costs some extra CPU.
+            workers (int): Number of threads used for gridding layers (or zones)
+                in parallel. The result is identical to the serial result.
+                Default is 1.
         Returns:
             True if operation went OK (but check result!), False if not
+
+        .. versionchanged:: 2.8.0 Added workers
         """
 
         for inum, myprop in enumerate([xprop, yprop, hcpfzprop, zoneprop]):
@@ -2292,6 +2304,7 @@ class RegularSurface(object):
             zone_avg=zone_avg,
             coarsen=coarsen,
             mask_outside=mask_outside,
+            workers=workers,
         )
 
         if status is False:
@@ -2308,6 +2321,7 @@ class RegularSurface(object):
         zone_minmax=None,
         coarsen=1,
         zone_avg=False,
+        workers=1,
     ):
         """
         Make an average map (DZ weighted) based on numpy arrays of
@@ -2327,9 +2341,14 @@ class RegularSurface(object):
             zoneprop: 3D numpy to a zone property
             zone_minmax: a tuple with from-to zones to combine
                 (e.g. (1,3))
+            workers (int): Number of threads used for gridding layers (or zones)
+                in parallel. The result is identical to the serial result.
+                Default is 1.
 
         Returns:
             Nothing explicit, but updates the surface object.
+
+        .. versionchanged:: 2.8.0 Added workers
         """
 
         for inum, myprop in enumerate([xprop, yprop, mprop, dzprop, zoneprop]):
@@ -2353,6 +2372,7 @@ class RegularSurface(object):
             zone_minmax=zone_minmax,
             coarsen=coarsen,
             zone_avg=zone_avg,
+            workers=workers,
         )
 
     def quickplot(
@@ -5,10 +5,13 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
+
 import numpy as np
 
 import xtgeo
 from . import _surfs_import
+from . import _surfs_stats
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
@@ -28,28 +31,38 @@ class Surfaces(object):
         input (list, optional): A list of XTGeo objects and/or file names)
         subtype (str): "tops", "isochores", or None (default)
         order (str): Assummed order: "same", "stratigraphic", None(default)
+        lazy (bool): If True, files are not read until needed, see
+            :meth:`append`.
 
     .. seealso::
        Class :class:`~xtgeo.surface.regular_surface.RegularSurface` class.
 
     .. versionadded:: 2.1.0
+    .. versionchanged:: 2.8.0 Added lazy option
     """
 
     def __init__(self, *args, **kwargs):
 
-        self._surfaces = []  # list of RegularSurface objects
+        self._surfaces = []  # list of RegularSurface objects (or files if lazy)
         self._subtype = None  # could be "tops", "isochores" or None
         self._order = None  # could be "same", "stratigraphic" or None
 
         if args:
-            self.append(args[0])
+            self.append(args[0], lazy=kwargs.get("lazy", False))
             self._subtype = kwargs.get("subtype", None)
             self._order = kwargs.get("order", None)
 
     @property
     def surfaces(self):
-        """Get or set a list of individual surfaces"""
-        return self._surfaces
+        """Get or set a list of individual surfaces
+
+        Files that are not read yet (lazy) are read each time this is used, and
+        the returned list is then a new list which is not kept by the instance,
+        so the instance stays lazy.
+        """
+        if all(isinstance(item, xtgeo.RegularSurface) for item in self._surfaces):
+            return self._surfaces
+        return list(self._iter_surfaces())
 
     @surfaces.setter
     def surfaces(self, slist):
@@ -62,12 +75,27 @@ class Surfaces(object):
 
         self._surfaces = slist
 
-    def append(self, slist):
+    def append(self, slist, lazy=False):
         """Append surfaces from either a list of RegularSurface objects,
-        a list of files, or a mix."""
+        a list of files, or a mix.
+
+        Args:
+            slist (list): List of RegularSurface objects and/or file names
+            lazy (bool): If True, files are not read here, but when they are
+                needed. In :meth:`statistics` only one surface is read at the
+                time, so large ensembles can be processed with little memory.
+                Note that :meth:`apply` still needs all surfaces in memory.
+
+        .. versionchanged:: 2.8.0 Added lazy option
+        """
         for item in slist:
             if isinstance(item, xtgeo.RegularSurface):
                 self._surfaces.append(item)
+            elif lazy:
+                if os.path.isfile(str(item)):
+                    self._surfaces.append(item)
+                else:
+                    xtg.warnuser("Cannot read as file, skip: {}".format(item))
             else:
                 try:
                     sobj = xtgeo.surface_from_file(item, fformat="guess")
@@ -75,6 +103,15 @@ class Surfaces(object):
                 except OSError:
                     xtg.warnuser("Cannot read as file, skip: {}".format(item))
 
+    def _iter_surfaces(self):
+        """Generator of the surfaces, where files (lazy) are read one by one."""
+        for item in self._surfaces:
+            if isinstance(item, xtgeo.RegularSurface):
+                yield item
+            else:
+                logger.info("Read lazy surface from %s", item)
+                yield xtgeo.surface_from_file(item, fformat="guess")
+
     def describe(self, flush=True):
         """Describe an instance by printing to stdout"""
 
@@ -82,8 +119,11 @@ class Surfaces(object):
         dsc.title("Description of {} instance".format(self.__class__.__name__))
         dsc.txt("Object ID", id(self))
 
-        for inum, surf in enumerate(self.surfaces):
-            dsc.txt("Surface:", inum, surf.name)
+        for inum, surf in enumerate(self._surfaces):
+            if isinstance(surf, xtgeo.RegularSurface):
+                dsc.txt("Surface:", inum, surf.name)
+            else:
+                dsc.txt("Surface (not read):", inum, surf)
 
         if flush:
             dsc.flush()
@@ -97,8 +137,9 @@ class Surfaces(object):
         new = Surfaces()
 
         for surf in self._surfaces:
-            newsurf = surf.copy()
-            new._surfaces.append(newsurf)
+            if isinstance(surf, xtgeo.RegularSurface):
+                surf = surf.copy()
+            new._surfaces.append(surf)
 
         new._order = self._order
         new._subtype = self._subtype
@@ -109,7 +150,7 @@ class Surfaces(object):
         """Get a RegularSurface() instance by name, or return None if name not found"""
 
         logger.info("Asking for a surface with name %s", name)
-        for surf in self._surfaces:
+        for surf in self._iter_surfaces():
             if surf.name == name:
                 return surf
         return None
@@ -126,6 +167,11 @@ class Surfaces(object):
 
         E.g. surfs.apply(np.nanmean, axis=0) will return the mean surface.
 
+        The function is applied to a stack of all surface values, i.e. an array of
+        shape (nsurfaces, ncol, nrow), so all surfaces are in memory at once, also
+        for surfaces appended as lazy files. Use :meth:`statistics` to process
+        large ensembles with little memory.
+
         Args:
             func: Function to apply
             args: The function arguments
@@ -136,9 +182,11 @@ class Surfaces(object):
 
         """
 
-        template = self.surfaces[0].copy()
+        template = None
         slist = []
-        for surf in self.surfaces:
+        for surf in self._iter_surfaces():
+            if template is None:
+                template = surf.copy()
             status = template.compare_topology(surf, strict=False)
             if not status:
                 raise ValueError("Cannot do statistics, surfaces differ in topology")
@@ -149,16 +197,30 @@ class Surfaces(object):
         template.values = func(xlist, *args, **kwargs)
         return template
 
-    def statistics(self):
+    def statistics(self, percentiles=None, nbins=100):
         """Return statistical measures from the surfaces.
 
         The statistics returned is:
         * mean: the arithmetic mean surface
         * std: the standard deviation surface (where ddof = 1)
+        * min, max: the minimum and maximum surface
+        * count: the number of defined values per node
+        * p10, p50, etc: approximate percentiles, if asked for
+
+        The surfaces are folded in one by one, so memory use does not depend
+        on the number of surfaces (use lazy to read files one by one). The
+        percentiles are estimated from a histogram per node, with nbins bins
+        between min and max, which needs a second pass through the surfaces.
+        The error is at most (max - min) / nbins per node.
 
         Currently this function expects that the surfaces all have the same
         shape/topology.
 
+        Args:
+            percentiles (list): Percentiles (0 - 100) to estimate, e.g.
+                [10, 50, 90]. Default is None.
+            nbins (int): Number of histogram bins per node, for percentiles.
+
         Returns:
             dict: A dictionary of statistical measures, see list above
 
@@ -167,43 +229,13 @@ class Surfaces(object):
 
         Example::
 
-            surfs = Surfaces(mylist)  # mylist is a collection of files
-            stats = surfs.statistics()
+            surfs = Surfaces(mylist, lazy=True)  # mylist is a collection of files
+            stats = surfs.statistics(percentiles=[10, 90])
             # export the mean surface
             stats["mean"].to_file("mymean.gri")
-        """
-        result = {}
-
-        template = self.surfaces[0].copy()
-
-        slist = []
-        for surf in self.surfaces:
-            status = template.compare_topology(surf, strict=False)
-            if not status:
-                raise ValueError("Cannot do statistics, surfaces differ in topology")
-            slist.append(np.ma.filled(surf.values, fill_value=np.nan))
-
-        xlist = np.array(slist)
-
-        # mean
-        template.values = np.nanmean(xlist, axis=0)
-        result["mean"] = template.copy()
+            stats["p90"].to_file("myp90.gri")
 
-        # std, run with degree of freedom ddof=1, similar to RMS
-        template.values = np.nanstd(xlist, axis=0, ddof=1)
-        result["std"] = template.copy()
-
-        # # median P50 (SLOW!)
-        # template.values = np.nanpercentile(xlist, 50, axis=0)
-        # result["median"] = template.copy()
-        # result["p50"] = result["median"]
-
-        # # P10
-        # template.values = np.nanpercentile(xlist, 10, axis=0)
-        # result["p10"] = template.copy()
-
-        # # P90
-        # template.values = np.nanpercentile(xlist, 90, axis=0)
-        # result["p90"] = template.copy()
+        .. versionchanged:: 2.8.0 Streaming, added min, max, count and percentiles
+        """
 
-        return result
+        return _surfs_stats.statistics(self, percentiles=percentiles, nbins=nbins)
@@ -3,10 +3,14 @@
 
 from __future__ import print_function, absolute_import
 
+import io
+from distutils.version import StrictVersion
+
 import numpy as np
 import pandas as pd
 
 from xtgeo.common import XTGeoDialog
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 xtg = XTGeoDialog()
 
@@ -21,8 +25,74 @@ def import_rms_ascii(
     strict=False,
     lognames="all",
     lognames_strict=False,
+    lazy=False,
+    discrete_dtype=None,
 ):
-    """Import RMS ascii table well"""
+    """Import RMS ascii table well.
+
+    The file is read once; the header is parsed line by line and the rest is
+    given as one buffer to the table parser. If lazy, only the header is read
+    here, and the log data is read by import_rms_ascii_data() on first access.
+    """
+    with open(wfile, "rb") as fwell:
+        hdr = _import_rms_ascii_header(fwell)
+        buf = None if lazy else fwell.read()
+
+    wname = hdr["wname"]
+
+    if lazy:
+        # check log names on an empty frame, so errors are found at import
+        dfr = pd.DataFrame(columns=hdr["lognames_all"])
+    else:
+        dfr = _import_rms_ascii_logs(buf, hdr["lognames_all"])
+
+    dfr = _trim_on_lognames(dfr, lognames, lognames_strict, wname)
+    mdlogname, zonelogname = _check_special_logs(
+        dfr, mdlogname, zonelogname, strict, wname
+    )
+
+    self._wlogtype = hdr["wlogtype"]
+    self._wlogrecord = hdr["wlogrecord"]
+    self._rkb = hdr["rkb"]
+    self._xpos = hdr["xpos"]
+    self._ypos = hdr["ypos"]
+    self._wname = wname
+    self._mdlogname = mdlogname
+    self._zonelogname = zonelogname
+
+    if lazy:
+        self._df = None
+        self._wlognames = list(dfr.columns)
+        self._lazy = {
+            "wfile": wfile,
+            "offset": hdr["offset"],
+            "lognames_all": hdr["lognames_all"],
+            "lognames": lognames,
+            "discrete_dtype": discrete_dtype,
+        }
+    else:
+        self._df = _set_discrete_dtype(dfr, hdr["wlogtype"], discrete_dtype)
+
+
+def import_rms_ascii_data(self):
+    """Read the log data for a well that was imported with lazy=True"""
+    lazy = self._lazy
+    logger.info("Load logs for %s from %s", self._wname, lazy["wfile"])
+
+    with open(lazy["wfile"], "rb") as fwell:
+        fwell.seek(lazy["offset"])
+        buf = fwell.read()
+
+    dfr = _import_rms_ascii_logs(buf, lazy["lognames_all"])
+    dfr = _trim_on_lognames(dfr, lazy["lognames"], False, self._wname)
+    self._df = _set_discrete_dtype(dfr, self._wlogtype, lazy["discrete_dtype"])
+
+
+def _import_rms_ascii_header(fwell):
+    """Read the header of a RMS ascii well from a binary file handle.
+
+    The file handle is left at the start of the log table.
+    """
     # pylint: disable=too-many-locals, too-many-branches, too-many-statements
     wlogtype = dict()
     wlogrecord = dict()
@@ -31,107 +101,145 @@ def import_rms_ascii(
     xlognames = []
 
     lnum = 1
-    with open(wfile, "r") as fwell:
-        for line in fwell:
-            if lnum == 1:
-                _ffver = line.strip()  # noqa, file version
-            elif lnum == 2:
-                _wtype = line.strip()  # noqa, well type
-            elif lnum == 3:
-                # usually 4 fields, but last (rkb) can be missing. A
-                # complication is that first field (well name) may have spaces,
-                # hence some clever guessing is needed. However, this cannot be
-                # 100% foolproof... if Ycoord < 1000 and last item of a well
-                # name with spaces is a number, then this may fail.
-                assume_rkb = False
-                row = line.strip().split()
-                newrow = []
-                if len(row) > 3:
-                    for item in row:
-                        try:
-                            item = float(item)
-                        except ValueError:
-                            item = str(item)
-                        newrow.append(item)
-                    if all(isinstance(var, float) for var in newrow[-3:]):
-                        if abs(newrow[-1] < 1000.0):
-                            assume_rkb = True
-
-                if assume_rkb:
-                    rkb = float(row.pop())
-                else:
-                    rkb = None
-                ypos = float(row.pop())
-                xpos = float(row.pop())
-                wname = " ".join(map(str, row))
-
-            elif lnum == 4:
-                nlogs = int(line)
-                nlogread = 1
-                logger.debug("Number of logs: %s", nlogs)
-
+    for line in iter(fwell.readline, b""):
+        if not isinstance(line, str):
+            line = line.decode()
+
+        if lnum == 1:
+            _ffver = line.strip()  # noqa, file version
+        elif lnum == 2:
+            _wtype = line.strip()  # noqa, well type
+        elif lnum == 3:
+            # usually 4 fields, but last (rkb) can be missing. A
+            # complication is that first field (well name) may have spaces,
+            # hence some clever guessing is needed. However, this cannot be
+            # 100% foolproof... if Ycoord < 1000 and last item of a well
+            # name with spaces is a number, then this may fail.
+            assume_rkb = False
+            row = line.strip().split()
+            newrow = []
+            if len(row) > 3:
+                for item in row:
+                    try:
+                        item = float(item)
+                    except ValueError:
+                        item = str(item)
+                    newrow.append(item)
+                if all(isinstance(var, float) for var in newrow[-3:]):
+                    if abs(newrow[-1] < 1000.0):
+                        assume_rkb = True
+
+            if assume_rkb:
+                rkb = float(row.pop())
             else:
-                row = line.strip().split()
-                lname = row[0]
+                rkb = None
+            ypos = float(row.pop())
+            xpos = float(row.pop())
+            wname = " ".join(map(str, row))
 
-                # if i_index etc, make uppercase to I_INDEX
-                # however it is most practical to treat indexes as CONT logs
-                if "_index" in lname:
-                    lname = lname.upper()
+        elif lnum == 4:
+            nlogs = int(line)
+            nlogread = 1
+            logger.debug("Number of logs: %s", nlogs)
 
-                ltype = row[1].upper()
+        else:
+            row = line.strip().split()
+            lname = row[0]
 
-                rxv = row[2:]
+            # if i_index etc, make uppercase to I_INDEX
+            # however it is most practical to treat indexes as CONT logs
+            if "_index" in lname:
+                lname = lname.upper()
 
-                xlognames_all.append(lname)
-                xlognames.append(lname)
+            ltype = row[1].upper()
 
-                wlogtype[lname] = ltype
+            rxv = row[2:]
 
-                logger.debug("Reading log name %s of type %s", lname, ltype)
+            xlognames_all.append(lname)
+            xlognames.append(lname)
 
-                if ltype == "DISC":
-                    xdict = {int(rxv[i]): rxv[i + 1] for i in range(0, len(rxv), 2)}
-                    wlogrecord[lname] = xdict
-                else:
-                    wlogrecord[lname] = rxv
+            wlogtype[lname] = ltype
 
-                nlogread += 1
+            logger.debug("Reading log name %s of type %s", lname, ltype)
 
-                if nlogread > nlogs:
-                    break
+            if ltype == "DISC":
+                xdict = {int(rxv[i]): rxv[i + 1] for i in range(0, len(rxv), 2)}
+                wlogrecord[lname] = xdict
+            else:
+                wlogrecord[lname] = rxv
+
+            nlogread += 1
+
+            if nlogread > nlogs:
+                break
+
+        lnum += 1
+
+    return {
+        "wname": wname,
+        "xpos": xpos,
+        "ypos": ypos,
+        "rkb": rkb,
+        "wlogtype": wlogtype,
+        "wlogrecord": wlogrecord,
+        "lognames_all": xlognames_all,
+        "offset": fwell.tell(),
+    }
+
+
+def _import_rms_ascii_logs(buf, lognames_all):
+    """Parse the log table of a RMS ascii well from a byte buffer, as dataframe.
+
+    The fast parser in C handles plain numeric tables, otherwise pandas is used.
+    """
+    ncol = len(lognames_all)
+    values = np.empty((buf.count(b"\n") + 1, ncol), dtype=np.float64)
+    nrow = _cxtgeo.well_import_rms_ascii(buf, ncol, values)
+
+    if nrow < 0:
+        logger.info("Table not parsed by fast parser, use pandas")
+        return pd.read_csv(
+            io.BytesIO(buf),
+            delim_whitespace=True,
+            header=None,
+            names=lognames_all,
+            dtype=np.float64,
+            na_values=-999,
+        )
+
+    values = values[:nrow]
+    values[values == -999.0] = np.nan
 
-            lnum += 1
+    # undef values have a high float number? or keep Nan?
+    # df.fillna(Well.UNDEF, inplace=True)
 
-    # now import all logs as pandas framework
+    return pd.DataFrame(values, columns=lognames_all)
 
-    dfr = pd.read_csv(
-        wfile,
-        delim_whitespace=True,
-        skiprows=lnum,
-        header=None,
-        names=xlognames_all,
-        dtype=np.float64,
-        na_values=-999,
-    )
 
-    # undef values have a high float number? or keep Nan?
-    # df.fillna(Well.UNDEF, inplace=True)
+def _set_discrete_dtype(dfr, wlogtype, discrete_dtype):
+    """Store DISC logs as nullable int32 or categorical instead of float64
 
-    dfr = _trim_on_lognames(dfr, lognames, lognames_strict, wname)
-    mdlogname, zonelogname = _check_special_logs(
-        dfr, mdlogname, zonelogname, strict, wname
-    )
+    Well methods read such logs through Well._get_log_values(), i.e. as float64
+    with NaN for undefined values.
+    """
+    if discrete_dtype is None or discrete_dtype == "float64":
+        return dfr
 
-    self._wlogtype = wlogtype
-    self._wlogrecord = wlogrecord
-    self._rkb = rkb
-    self._xpos = xpos
-    self._ypos = ypos
-    self._wname = wname
-    self._df = dfr
-    self._mdlogname = mdlogname
-    self._zonelogname = zonelogname
+    if discrete_dtype not in ("int32", "category"):
+        raise ValueError("Invalid discrete_dtype: {}".format(discrete_dtype))
+
+    if discrete_dtype == "int32" and StrictVersion(pd.__version__) < StrictVersion(
+        "0.24.0"
+    ):
+        raise ValueError("discrete_dtype='int32' requires pandas >= 0.24")
+
+    for lname in dfr.columns:
+        if wlogtype.get(lname) == "DISC":
+            if discrete_dtype == "int32":
+                dfr[lname] = dfr[lname].round().astype("Int32")
+            else:
+                dfr[lname] = dfr[lname].round().astype("category")
+    return dfr
 
 
 def _trim_on_lognames(dfr, lognames, lognames_strict, wname):
@@ -219,6 +327,9 @@ def export_rms_ascii(self, wfile, precision=4):
 
     # now export all logs as pandas framework
     tmpdf = self._df.copy()
+    for lname in self._wlogtype:
+        if self._wlogtype[lname] == "DISC" and lname in tmpdf:
+            tmpdf[lname] = self._get_log_values(lname)
     tmpdf.fillna(value=-999, inplace=True)
 
     # make the disc as is np.int
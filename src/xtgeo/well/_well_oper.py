@@ -3,6 +3,8 @@
 
 from __future__ import print_function, absolute_import
 import copy
+import hashlib
+from collections import OrderedDict
 from distutils.version import StrictVersion
 
 import numpy as np
@@ -17,6 +19,9 @@ xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# max number of well trajectories with cell index cached per grid
+WELLCELLS_CACHESIZE = 1000
+
 
 def delete_log(self, lname):
     """Delete/remove an existing log, or list of logs."""
@@ -65,7 +70,11 @@ def rescale(self, delta=0.15, tvdrange=None):
     dfrcolumns1 = self._df.columns
     columnsadded = list(set(dfrcolumns1) - set(dfrcolumns0))  # new tmp columns, if any
 
-    dfr = self._df.copy().set_index(self.mdlogname)
+    dfr = self._df.copy()
+    for lname in dfr.columns:
+        if self._wlogtype.get(lname) == "DISC":
+            dfr[lname] = self._get_log_values(lname)  # interpolate needs float64
+    dfr = dfr.set_index(self.mdlogname)
 
     logger.debug("Initial dataframe\n %s", dfr)
 
@@ -201,24 +210,42 @@ def _make_ijk_from_grid_v1(self, grid, grid_id=""):
     """
     Getting IJK from a grid and make as well logs.
 
-    This is the first version, using _cxtgeo.grd3d_well_ijk from C
+    This is the first version, using _cxtgeo.grd3d_wells_ijk from C
+    (same search as grd3d_well_ijk, but on numpy arrays and a private copy
+    of ZCORN, so the grid is not changed)
 
     """
     logger.info("Using algorithm 1 in %s", __name__)
 
-    wxarr = self.get_carray("X_UTME")
-    wyarr = self.get_carray("Y_UTMN")
-    wzarr = self.get_carray("Z_TVDSS")
+    ijk = wells_ijk_from_grid_v1([self], grid)[0]
+    set_ijk_logs(self, grid, ijk, grid_id=grid_id)
 
-    nlen = self.nrow
-    wivec = _cxtgeo.new_intarray(nlen)
-    wjvec = _cxtgeo.new_intarray(nlen)
-    wkvec = _cxtgeo.new_intarray(nlen)
 
-    onelayergrid = grid.copy()
-    onelayergrid.reduce_to_one_layer()
+def wells_ijk_from_grid_v1(wells, grid):
+    """Get I J K (float arrays, 1 based, NaN if not in grid) for a list of wells.
 
-    cstatus = _cxtgeo.grd3d_well_ijk(
+    All wells are done in one call to C, working directly on the numpy arrays,
+    and the wells may be done in parallel (cf. xtgeo.set_nthreads()). The search
+    per well is the same as in the C routine grd3d_well_ijk. The one layer grid
+    is taken from the grid's (cached) search index.
+    """
+
+    xvs, yvs, zvs = (
+        np.ascontiguousarray(
+            np.concatenate([well.dataframe[name].values for well in wells] or [[]]),
+            dtype=np.float64,
+        )
+        for name in ("X_UTME", "Y_UTMN", "Z_TVDSS")
+    )
+    wellstart = np.zeros(len(wells) + 1, dtype=np.int32)
+    wellstart[1:] = np.cumsum([len(well.dataframe) for well in wells])
+
+    # the one layer grid is part of the grid's (cached) search index
+    grid.build_search_index()
+    onelayergrid = grid._tmp["onegrid"]
+
+    nval = xvs.size
+    cstatus, iarr, jarr, karr = _cxtgeo.grd3d_wells_ijk(
         grid.ncol,
         grid.nrow,
         grid.nlay,
@@ -227,50 +254,40 @@ def _make_ijk_from_grid_v1(self, grid, grid_id=""):
         grid._actnumsv,
         onelayergrid._zcornsv,
         onelayergrid._actnumsv,
-        self.nrow,
-        wxarr,
-        wyarr,
-        wzarr,
-        wivec,
-        wjvec,
-        wkvec,
-        0,
+        xvs,
+        yvs,
+        zvs,
+        wellstart,
+        nval,
+        nval,
+        nval,
     )
 
     if cstatus != 0:
         raise RuntimeError("Error from C routine, code is {}".format(cstatus))
 
-    indarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wivec).astype("float")
-    jndarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wjvec).astype("float")
-    kndarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wkvec).astype("float")
+    result = []
+    for inum in range(len(wells)):
+        ijk = []
+        for arr in (iarr, jarr, karr):
+            warr = arr[wellstart[inum] : wellstart[inum + 1]].astype("float")
+            warr[warr == 0] = np.nan
+            ijk.append(warr)
+        result.append(ijk)
 
-    indarray[indarray == 0] = np.nan
-    jndarray[jndarray == 0] = np.nan
-    kndarray[kndarray == 0] = np.nan
+    return result
 
-    icellname = "ICELL" + grid_id
-    jcellname = "JCELL" + grid_id
-    kcellname = "KCELL" + grid_id
 
-    self._df[icellname] = indarray
-    self._df[jcellname] = jndarray
-    self._df[kcellname] = kndarray
+def set_ijk_logs(self, grid, ijk, grid_id=""):
+    """Set the I J K (float arrays) as discrete logs in the well"""
 
-    for cellname in [icellname, jcellname, kcellname]:
+    cellnames = ("ICELL" + grid_id, "JCELL" + grid_id, "KCELL" + grid_id)
+    for cellname, arr in zip(cellnames, ijk):
+        self._df[cellname] = arr
         self._wlogtype[cellname] = "DISC"
 
-    self._wlogrecord[icellname] = {ncel: str(ncel) for ncel in range(1, grid.ncol + 1)}
-    self._wlogrecord[jcellname] = {ncel: str(ncel) for ncel in range(1, grid.nrow + 1)}
-    self._wlogrecord[kcellname] = {ncel: str(ncel) for ncel in range(1, grid.nlay + 1)}
-
-    _cxtgeo.delete_intarray(wivec)
-    _cxtgeo.delete_intarray(wjvec)
-    _cxtgeo.delete_intarray(wkvec)
-    _cxtgeo.delete_doublearray(wxarr)
-    _cxtgeo.delete_doublearray(wyarr)
-    _cxtgeo.delete_doublearray(wzarr)
-
-    del onelayergrid
+    for cellname, ncell in zip(cellnames, (grid.ncol, grid.nrow, grid.nlay)):
+        self._wlogrecord[cellname] = {ncel: str(ncel) for ncel in range(1, ncell + 1)}
 
 
 def _make_ijk_from_grid_v2(self, grid, grid_id=""):
@@ -316,20 +333,16 @@ def _make_ijk_from_grid_v2(self, grid, grid_id=""):
 def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_id=""):
     """Getting gridproperties as logs"""
 
-    if not isinstance(gridprops, (xtgeo.GridProperty, xtgeo.GridProperties)):
-        raise ValueError('"gridprops" not a GridProperties or GridProperty instance')
-
-    if isinstance(gridprops, xtgeo.GridProperty):
-        gprops = xtgeo.GridProperties()
-        gprops.append_props([gridprops])
-    else:
-        gprops = gridprops
+    props = _gridprops_list(gridprops)
 
     if isinstance(grid, tuple):
         icl, jcl, kcl = grid
     elif isinstance(grid, xtgeo.Grid):
-        self.make_ijk_from_grid(grid, grid_id="_tmp", algorithm=2)
-        icl, jcl, kcl = ("ICELL_tmp", "JCELL_tmp", "KCELL_tmp")
+        cellindex = cell_index(self, grid)
+        for prop in props:
+            _set_gridprop_log(self, prop, gather_values(prop, cellindex), prop_id)
+        self._ensure_consistency()
+        return
     else:
         raise ValueError('The "grid" is of wrong type, must be a tuple or ' "a Grid")
 
@@ -348,17 +361,103 @@ def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_i
     jind = jind.astype("int")
     kind = kind.astype("int")
 
-    for prop in gprops.props:
+    for prop in props:
         arr = prop.values[iind, jind, kind].astype("float")
         arr[np.isnan(xind)] = np.nan
-        pname = prop.name + prop_id
-        self.dataframe[pname] = arr
-        self._wlognames.append(pname)
-        if prop.isdiscrete:
-            self._wlogtype[pname] = "DISC"
-            self._wlogrecord[pname] = copy.deepcopy(prop.codes)
+        _set_gridprop_log(self, prop, arr, prop_id)
     self._ensure_consistency()
-    self.delete_logs(["ICELL_tmp", "JCELL_tmp", "KCELL_tmp"])
+
+
+def _gridprops_list(gridprops):
+    """Return a list of GridProperty from GridProperty, GridProperties or list"""
+
+    if isinstance(gridprops, xtgeo.GridProperty):
+        return [gridprops]
+    if isinstance(gridprops, xtgeo.GridProperties):
+        return gridprops.props
+    if isinstance(gridprops, (list, tuple)) and all(
+        isinstance(prop, xtgeo.GridProperty) for prop in gridprops
+    ):
+        return list(gridprops)
+
+    raise ValueError('"gridprops" not a GridProperties or GridProperty instance')
+
+
+def _set_gridprop_log(self, prop, arr, prop_id):
+    pname = prop.name + prop_id
+    self.dataframe[pname] = arr
+    self._wlognames.append(pname)
+    if prop.isdiscrete:
+        self._wlogtype[pname] = "DISC"
+        self._wlogrecord[pname] = copy.deepcopy(prop.codes)
+
+
+def _trajectory_key(self):
+    """A key for the well trajectory, which changes if any X Y Z value changes"""
+
+    hsh = hashlib.sha1()
+    for name in ("X_UTME", "Y_UTMN", "Z_TVDSS"):
+        values = np.ascontiguousarray(self._df[name].values, dtype=np.float64)
+        hsh.update(values.tobytes())
+    return hsh.hexdigest()
+
+
+def cell_index(self, grid):
+    """Cell index (C order, zero based) per well sample, -1 if not in active cell.
+
+    The index is computed as in make_ijk_from_grid (algorithm 2), and is cached
+    together with the grid's search index; hence it is computed once per well
+    trajectory and grid geometry. Only the WELLCELLS_CACHESIZE most recently used
+    trajectories are kept.
+    """
+
+    grid.build_search_index()
+    cache = grid._tmp.setdefault("wellcells", OrderedDict())
+
+    key = _trajectory_key(self)
+    if key in cache:
+        cache[key] = cache.pop(key)  # most recently used
+    else:
+        index = np.full(len(self._df), -1, dtype=np.int64)
+        if index.size > 0:
+            wpoints = xtgeo.Points()
+            wpdf = self._df.loc[:, ["X_UTME", "Y_UTMN", "Z_TVDSS"]].copy()
+            wpdf.reset_index(inplace=True, drop=True)
+            wpoints.dataframe = wpdf
+
+            ijk = grid.get_ijk_from_points(
+                wpoints, activeonly=True, zerobased=False, includepoints=False
+            )
+            iarr, jarr, karr = (ijk[col].values for col in ijk.columns)
+            inside = iarr > 0
+            index[inside] = (
+                (iarr[inside] - 1) * grid.nrow + (jarr[inside] - 1)
+            ) * grid.nlay + (karr[inside] - 1)
+
+        cache[key] = index
+        while len(cache) > WELLCELLS_CACHESIZE:
+            cache.popitem(last=False)
+        logger.info("Cell index for well %s is computed and cached", self.name)
+
+    return cache[key]
+
+
+def gather_values(prop, cellindex):
+    """Property values (float, NaN if undefined) for the cell indices (-1: NaN).
+
+    Masked property values are NaN, as masked values are in the well logs made
+    by get_gridproperties().
+    """
+
+    if isinstance(prop, xtgeo.GridProperty):
+        values = prop.values
+    else:
+        values = prop
+
+    values = np.ma.filled(np.ma.asarray(values).astype(np.float64), fill_value=np.nan)
+    arr = values.ravel()[cellindex]
+    arr[cellindex < 0] = np.nan
+    return arr
 
 
 def report_zonation_holes(self, threshold=5):
@@ -370,7 +469,7 @@ def report_zonation_holes(self, threshold=5):
 
     wellreport = []
 
-    zlog = self._df[self.zonelogname].values.copy()
+    zlog = self._get_log_values(self.zonelogname)
 
     mdlog = None
     if self.mdlogname:
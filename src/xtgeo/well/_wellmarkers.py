@@ -16,6 +16,122 @@ xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+def get_zonation_points(
+    self, tops=True, incl_limit=80, top_prefix="Top", zonelist=None, use_undef=False
+):
+    """Zonation points for a well as dataframe, None if zonelog is missing.
+
+    See Well.get_zonation_points()
+    """
+
+    columns = _zonation_columns(
+        self,
+        tops=tops,
+        incl_limit=incl_limit,
+        top_prefix=top_prefix,
+        zonelist=zonelist,
+        use_undef=use_undef,
+    )
+    if columns is None:
+        return None
+
+    return _columns_to_dataframe(columns)
+
+
+def get_zonation_points_wells(
+    wells, tops=True, incl_limit=80, top_prefix="Top", zonelist=None, use_undef=False
+):
+    """Zonation points for a list of wells, as one dataframe.
+
+    Returns the dataframe (None if no well has a zonelog) and the number of wells
+    with zonelog. The result is as concatenating the dataframes for each well.
+    """
+
+    allcolumns = []
+    for well in wells:
+        columns = _zonation_columns(
+            well,
+            tops=tops,
+            incl_limit=incl_limit,
+            top_prefix=top_prefix,
+            zonelist=zonelist,
+            use_undef=use_undef,
+        )
+        if columns is not None:
+            allcolumns.append(columns)
+
+    if not allcolumns:
+        return None, 0
+
+    names = list(allcolumns[0].keys())
+    nonempty = [columns for columns in allcolumns if len(columns[names[0]]) > 0]
+    if not nonempty:
+        return _columns_to_dataframe(allcolumns[0]), len(allcolumns)
+
+    dfr = pd.DataFrame(
+        OrderedDict(
+            (name, np.concatenate([columns[name] for columns in nonempty]))
+            for name in names
+        )
+    )
+    if len(nonempty) < len(allcolumns):
+        # as concatenating with the (object type) dataframe of a well with no points
+        dfr = pd.concat([dfr, pd.DataFrame([], columns=names)], ignore_index=True)
+
+    return dfr, len(allcolumns)
+
+
+def _columns_to_dataframe(columns):
+    if len(columns[next(iter(columns))]) == 0:
+        return pd.DataFrame([], columns=list(columns.keys()))
+    return pd.DataFrame(columns)
+
+
+def _zonation_columns(
+    self, tops=True, incl_limit=80, top_prefix="Top", zonelist=None, use_undef=False
+):
+    """Zonation points for a well as columns, None if zonelog is missing."""
+
+    # get the relevant logs:
+
+    self.geometrics()
+
+    # as zlog is float64; need to convert to int array with high
+    # number as undef
+    if self.zonelogname is not None:
+        zlog = self._get_log_values(self.zonelogname)
+        zlog[np.isnan(zlog)] = const.UNDEF_INT
+        zlog = np.rint(zlog).astype(int)
+    else:
+        return None
+
+    xvv = self._df["X_UTME"].values
+    yvv = self._df["Y_UTMN"].values
+    zvv = self._df["Z_TVDSS"].values
+    incl = self._df["Q_INCL"].values
+    mdv = self._df["Q_MDEPTH"].values
+
+    if self.mdlogname is not None:
+        mdv = self._df[self.mdlogname].values
+
+    if zonelist is None:
+        # need to declare as list; otherwise Py3 will get dict.keys
+        zonelist = list(self.get_logrecord(self.zonelogname).keys())
+
+    logger.info("Find values for %s", zonelist)
+
+    columns = _ztops_columns(
+        self, zonelist, xvv, yvv, zvv, zlog, mdv, incl, top_prefix, use_undef
+    )
+    if tops:
+        return columns
+
+    if incl_limit is None:
+        incl_limit = 80
+
+    return _zisos_columns(columns, incl_limit, top_prefix)
+
+
 def extract_ztops(
     self,
     zonelist,
@@ -45,22 +161,42 @@ def extract_ztops(
         incl_limit (float): Limitation of zone computation (angle, degrees)
         use_undef (bool): If True, then transition from UNDEF is also
             used.
+
+    Returns:
+        The tops as a list of tuples and the list of names (columns) in tuple,
+        and then the same for zone points (None, None if tops is True).
     """
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 
-    # The wellpoints will be a list of tuples (one tuple per hit)
-    wpts = []
-    zlogname = self.zonelogname
+    columns = _ztops_columns(
+        self, zonelist, xcv, ycv, zcv, zlog, mdv, incl, prefix, use_undef
+    )
+    wpts = list(zip(*columns.values()))
+    wpts_names = list(columns.keys())
 
-    logger.debug(zlog)
-    logger.info("Well name is %s", self.wellname)
+    if tops:
+        return wpts, wpts_names, None, None
 
-    if not tops and incl_limit is None:
+    if incl_limit is None:
         incl_limit = 80
 
-    azi = -999.0  # tmp so far
+    zcolumns = _zisos_columns(columns, incl_limit, prefix)
+    return wpts, wpts_names, list(zip(*zcolumns.values())), list(zcolumns.keys())
+
+
+def _ztops_columns(self, zonelist, xcv, ycv, zcv, zlog, mdv, incl, prefix, use_undef):
+    """Find tops from transitions in the zonelog, as columns (numpy arrays).
+
+    The zonelog is compared with the previous sample (all at once). If the zone
+    increases, the tops of the zones from previous + 1 to current are at the
+    current sample; if the zone decreases, the tops of the zones from previous
+    down to current + 1 are at the previous sample. Transitions to or from
+    UNDEF are skipped, unless use_undef is True, where UNDEF is taken as a zone
+    above the first zone.
+    """
+    # pylint: disable=too-many-locals
+
+    logger.info("Well name is %s", self.wellname)
 
-    usezonerange = range(0, 99999)
     if isinstance(zonelist, tuple) and len(zonelist) == 2:
         usezonerange = range(zonelist[0], zonelist[1] + 1)
     elif isinstance(zonelist, list) and len(zonelist) > 1:
@@ -68,142 +204,103 @@ def extract_ztops(
     else:
         raise ValueError("Something is wrong with zonelist input")
 
-    iundef = const.UNDEF_INT
     iundeflimit = const.UNDEF_INT_LIMIT
-    pzone = iundef
-
-    if use_undef:
-        pzone = zlog.min() - 1
-
-    for ind, zone in np.ndenumerate(zlog):
-
-        ino = ind[0]  # since ind is a tuple...
-
-        if use_undef and zone > iundeflimit:
-            zone = zlog.min() - 1
-
-        if pzone != zone and pzone < iundeflimit and zone < iundeflimit:
-            logger.debug("Found break in zonation")
-            if pzone < zone:
-                logger.debug("Found match with zonation increasing")
-                for kzv in range(pzone + 1, zone + 1):
-                    if kzv in usezonerange:
-                        zname = self.get_logrecord_codename(zlogname, kzv)
-                        zname = prefix + zname
-                        ztop = (
-                            xcv[ino],
-                            ycv[ino],
-                            zcv[ino],
-                            mdv[ino],
-                            incl[ino],
-                            azi,
-                            kzv,
-                            zname,
-                            self.xwellname,
-                        )
-                        wpts.append(ztop)
-            if pzone > zone and ino > 0:
-                logger.info("Found match, decreasing zonation")
-                for kzv in range(pzone, zone, -1):
-                    if kzv in usezonerange:
-                        zname = self.get_logrecord_codename(zlogname, kzv)
-                        zname = prefix + zname
-                        ztop = (
-                            xcv[ino - 1],
-                            ycv[ino - 1],
-                            zcv[ino - 1],
-                            mdv[ino - 1],
-                            incl[ino - 1],
-                            azi,
-                            kzv,
-                            zname,
-                            self.xwellname,
-                        )
-                        wpts.append(ztop)
-        pzone = zone
+
+    zlog = np.asarray(zlog)
+    prevzone = np.empty_like(zlog)
+    if zlog.size > 0:
+        prevzone[0] = const.UNDEF_INT
+    if use_undef and zlog.size > 0:
+        zundef = zlog.min() - 1
+        zlog = np.where(zlog > iundeflimit, zundef, zlog)
+        prevzone[0] = zundef
+    prevzone[1:] = zlog[:-1]
+
+    transition = (prevzone != zlog) & (prevzone < iundeflimit) & (zlog < iundeflimit)
+    increasing = transition & (prevzone < zlog)
+    decreasing = transition & (prevzone > zlog)
+    decreasing[:1] = False
+
+    # one top per zone between previous and current zone, in order of samples
+    ino = np.flatnonzero(increasing | decreasing)
+    nzones = np.abs(zlog[ino] - prevzone[ino])
+    step = np.repeat(np.where(increasing[ino], 1, -1), nzones)
+    first = np.repeat(
+        np.where(increasing[ino], prevzone[ino] + 1, prevzone[ino]), nzones
+    )
+    offset = np.arange(nzones.sum()) - np.repeat(np.cumsum(nzones) - nzones, nzones)
+    zone = first + step * offset
+    isample = np.repeat(np.where(increasing[ino], ino, ino - 1), nzones)
+
+    if isinstance(usezonerange, range):
+        use = (zone >= usezonerange.start) & (zone < usezonerange.stop)
+    else:
+        use = np.isin(zone, usezonerange)
+    zone = zone[use]
+    isample = isample[use]
+
+    zlogname = self.zonelogname
+    znames = {}
+    for kzv in np.unique(zone):
+        znames[kzv] = prefix + self.get_logrecord_codename(zlogname, kzv)
 
     mdname = "Q_MDEPTH"
     if self.mdlogname is not None:
         mdname = "M_MDEPTH"
 
-    wpts_names = [
-        "X_UTME",
-        "Y_UTMN",
-        "Z_TVDSS",
-        mdname,
-        "Q_INCL",
-        "Q_AZI",
-        "Zone",
-        "TopName",
-        "WellName",
-    ]
-
-    if tops:
-        return wpts, wpts_names, None, None
+    columns = OrderedDict()
+    columns["X_UTME"] = np.asarray(xcv)[isample]
+    columns["Y_UTMN"] = np.asarray(ycv)[isample]
+    columns["Z_TVDSS"] = np.asarray(zcv)[isample]
+    columns[mdname] = np.asarray(mdv)[isample]
+    columns["Q_INCL"] = np.asarray(incl)[isample]
+    columns["Q_AZI"] = np.full(len(zone), -999.0)  # tmp so far
+    columns["Zone"] = zone
+    columns["TopName"] = np.array([znames[kzv] for kzv in zone], dtype=object)
+    columns["WellName"] = np.full(len(zone), self.xwellname, dtype=object)
+
+    return columns
+
+
+def _zisos_columns(tcolumns, incl_limit, prefix):
+    """Get MIDPOINT zone thickness (DZ) points between successive tops, as columns."""
+
+    names = list(tcolumns.keys())
+    mdname = names[3]
+
+    def _pairs(name):
+        values = tcolumns[name]
+        return values[:-1], values[1:]
+
+    xx1, xx2 = _pairs("X_UTME")
+    yy1, yy2 = _pairs("Y_UTMN")
+    zz1, zz2 = _pairs("Z_TVDSS")
+    md1, md2 = _pairs(mdname)
+    incl1, incl2 = _pairs("Q_INCL")
+    zk1, zk2 = _pairs("Zone")
+    zn1, zn2 = _pairs("TopName")
+
+    incl_avg = (incl1 + incl2) / 2
+    use = (incl_avg < incl_limit) & (zk2 != zk1)
+
+    usezn = np.where(zk1 > zk2, zn2, zn1)[use]
+
+    columns = OrderedDict()
+    columns["X_UTME"] = ((xx1 + xx2) / 2)[use]
+    columns["Y_UTMN"] = ((yy1 + yy2) / 2)[use]
+    columns["Z_TVDSS"] = np.round(np.abs(zz2 - zz1), 4)[use]
+    columns[mdname + "_AVG"] = ((md1 + md2) / 2)[use]
+    columns["Q_MD1"] = md1[use]
+    columns["Q_MD2"] = md2[use]
+    columns["Q_INCL"] = incl_avg[use]
+    columns["Q_AZI"] = np.full(len(usezn), -999.0)  # to be fixed later
+    columns["Zone"] = np.where(zk1 > zk2, zk2, zk1)[use]
+    columns["ZoneName"] = np.array(
+        [zname[len(prefix) :] for zname in usezn], dtype=object
+    )
+    columns["WellName"] = tcolumns["WellName"][:-1][use]
 
-    # next get a MIDPOINT zthickness (DZ)
-    llen = len(wpts) - 1
-
-    zwpts_names = [
-        "X_UTME",
-        "Y_UTMN",
-        "Z_TVDSS",
-        mdname + "_AVG",
-        "Q_MD1",
-        "Q_MD2",
-        "Q_INCL",
-        "Q_AZI",
-        "Zone",
-        "ZoneName",
-        "WellName",
-    ]
-
-    zwpts = []
-    for ino in range(llen):
-        i1v = ino
-        i2v = ino + 1
-        xx1, yy1, zz1, md1, incl1, _azi1, zk1, zn1, wn1 = wpts[i1v]
-        xx2, yy2, zz2, md2, incl2, _azi2, zk2, zn2, _wn2 = wpts[i2v]
-
-        # mid point
-        xx_avg = (xx1 + xx2) / 2
-        yy_avg = (yy1 + yy2) / 2
-        md_avg = (md1 + md2) / 2
-        incl_avg = (incl1 + incl2) / 2
-
-        azi_avg = -999.0  # to be fixed later
-
-        zzp = round(abs(zz2 - zz1), 4)
-
-        useok = False
-
-        if incl_avg < incl_limit:
-            useok = True
-
-        if useok and zk2 != zk1:
-            usezk = zk1
-            usezn = zn1
-            if zk1 > zk2:
-                usezk = zk2
-                usezn = zn2
-            usezn = usezn[len(prefix) :]
-
-            zzone = (
-                xx_avg,
-                yy_avg,
-                zzp,
-                md_avg,
-                md1,
-                md2,
-                incl_avg,
-                azi_avg,
-                usezk,
-                usezn,
-                wn1,
-            )
-            zwpts.append(zzone)
-
-    return wpts, wpts_names, zwpts, zwpts_names
+    return columns
 
 
 def get_fraction_per_zone(
@@ -4,12 +4,18 @@
 from __future__ import print_function, absolute_import, division
 
 import logging
+import multiprocessing
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 import shapely.geometry as sg
 
+import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGShowProgress
+from xtgeo.common.constants import UNDEF, UNDEF_LIMIT
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -17,135 +23,546 @@ logger.addHandler(logging.NullHandler())
 xtg = XTGeoDialog()
 
 
-def wellintersections(
-    self, wfilter=None, showprogress=False
-):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
-    """Get intersections between wells, return as dataframe table.
-
-    This routine is using "shapely" functions!
-
-    Some actions are done in order to filter away the part of the trajectories
-    that are paralell.
-
+# cap on number of buckets along each axis in the segment index
+_MAXBUCKETS = 2048
+
+# work data for pool processes, set by _pool_init()
+_POOLDATA = {}
+
+
+class _WellGeom(object):
+    """Trajectory arrays for one well, with shapely lines made once on demand."""
+
+    def __init__(self, well, usemd):
+        self.name = well.name
+        dfr = well.dataframe
+        self.xv = np.ascontiguousarray(dfr["X_UTME"].values, dtype=np.float64)
+        self.yv = np.ascontiguousarray(dfr["Y_UTMN"].values, dtype=np.float64)
+        self.zv = np.ascontiguousarray(dfr["Z_TVDSS"].values, dtype=np.float64)
+        self.mv = None
+        if usemd:
+            self.mv = np.ascontiguousarray(dfr[well.mdlogname].values, dtype=np.float64)
+
+        self.bbox = None
+        if well.dataframe.size >= 2 and self.xv.size > 0:
+            self.bbox = (
+                np.nanmin(self.xv),
+                np.nanmax(self.xv),
+                np.nanmin(self.yv),
+                np.nanmax(self.yv),
+            )
+
+        self._lines = {}
+
+    def line(self, ltype):
+        """Return a shapely LineString; ltype is 'xy', 'xym' or 'xyz'"""
+        if ltype not in self._lines:
+            vec = [self.xv, self.yv]
+            if ltype == "xym":
+                vec.append(self.mv)
+            elif ltype == "xyz":
+                vec.append(self.zv)
+            self._lines[ltype] = sg.LineString(np.stack(vec, axis=1))
+        return self._lines[ltype]
+
+    def __getstate__(self):
+        # lines are rebuilt on demand, e.g. in a pool process
+        state = self.__dict__.copy()
+        state["_lines"] = {}
+        return state
+
+    def may_overlap(self, other):
+        """Same as Well.may_overlap(), on precomputed bounding boxes"""
+        if self.bbox is None or other.bbox is None:
+            return False
+        xmin1, xmax1, ymin1, ymax1 = self.bbox
+        xmin2, xmax2, ymin2, ymax2 = other.bbox
+        if xmin1 > xmax2 or ymin1 > ymax2:
+            return False
+        if xmin2 > xmax1 or ymin2 > ymax1:
+            return False
+        return True
+
+
+def _segment_candidates(geoms, xpad=0.0, ypad=0.0):
+    """Find pairs of wells that have trajectory segments close in map view.
+
+    The bounding box of every segment (padded with xpad, ypad) is put into a
+    regular grid of buckets. Only wells sharing a bucket may intersect, so
+    this is a conservative filter; the exact test is done afterwards.
+
+    Returns:
+        A set of (iwell, jwell) tuples, iwell < jwell.
     """
+    x0s, x1s, y0s, y1s, ids = [], [], [], [], []
+    for inum, geo in enumerate(geoms):
+        if geo.xv.size < 2:
+            continue
+        xv, yv = geo.xv, geo.yv
+        x0s.append(np.minimum(xv[:-1], xv[1:]))
+        x1s.append(np.maximum(xv[:-1], xv[1:]))
+        y0s.append(np.minimum(yv[:-1], yv[1:]))
+        y1s.append(np.maximum(yv[:-1], yv[1:]))
+        ids.append(np.full(xv.size - 1, inum, dtype=np.int64))
+
+    if not ids:
+        return set()
+
+    xmin = np.concatenate(x0s) - xpad
+    xmax = np.concatenate(x1s) + xpad
+    ymin = np.concatenate(y0s) - ypad
+    ymax = np.concatenate(y1s) + ypad
+    ids = np.concatenate(ids)
+
+    valid = np.isfinite(xmin) & np.isfinite(xmax)
+    valid &= np.isfinite(ymin) & np.isfinite(ymax)
+    xmin, xmax, ymin, ymax, ids = (arr[valid] for arr in (xmin, xmax, ymin, ymax, ids))
+    if ids.size == 0:
+        return set()
+
+    # bucket size: a few typical segment lengths, but limit number of buckets
+    xorig = xmin.min()
+    yorig = ymin.min()
+    extent = max(xmax.max() - xorig, ymax.max() - yorig)
+    segsize = np.median(np.maximum(xmax - xmin, ymax - ymin))
+    bsize = max(2.0 * segsize, extent / _MAXBUCKETS, 1.0e-6)
+
+    ib0 = np.floor((xmin - xorig) / bsize).astype(np.int64)
+    ib1 = np.floor((xmax - xorig) / bsize).astype(np.int64)
+    jb0 = np.floor((ymin - yorig) / bsize).astype(np.int64)
+    jb1 = np.floor((ymax - yorig) / bsize).astype(np.int64)
+    nbj = int(jb1.max()) + 1
+
+    # expand each segment into all the buckets its box covers
+    nib = ib1 - ib0 + 1
+    njb = jb1 - jb0 + 1
+    ncover = nib * njb
+    seg = np.repeat(np.arange(ids.size), ncover)
+    local = np.arange(seg.size) - np.repeat(np.cumsum(ncover) - ncover, ncover)
+    ibk = ib0[seg] + local // njb[seg]
+    jbk = jb0[seg] + local % njb[seg]
+    bucket = ibk * nbj + jbk
+
+    # unique (bucket, well) entries; then pairs of wells within each bucket
+    table = np.unique(np.stack([bucket, ids[seg]], axis=1), axis=0)
+    bounds = np.flatnonzero(np.diff(table[:, 0])) + 1
+    candidates = set()
+    for wells in np.split(table[:, 1], bounds):
+        if wells.size < 2:
+            continue
+        wells = wells.tolist()
+        for ino, iwell in enumerate(wells):
+            for jwell in wells[ino + 1 :]:
+                candidates.add((iwell, jwell))
 
-    xpoints = []
-
-    # make a dict if nocrossings
-    nox = {}
-
-    wlen = len(self.wells)
-
-    progress = XTGShowProgress(wlen, show=showprogress, leadtext="progress: ", skip=5)
+    return candidates
 
-    for iwell, well in enumerate(self.wells):
 
-        progress.flush(iwell)
+def _subgeoms(geom):
+    """Return parts of a (multi) geometry as a list"""
+    if hasattr(geom, "geoms"):
+        return list(geom.geoms)
+    return [geom]
 
-        gstatus = well.geometrics()
 
-        logger.info("Work with %s", well.name)
-        if not gstatus:
-            logger.info("Skip %s (cannot compute geometrics)", well.name)
-            continue
+def _pair_crossings(wgeo, ogeo, wfilter):
+    """Find where the other well crosses the well (in map view).
 
-        welldfr = well.dataframe.copy()
+    Returns:
+        (nocross, rows) where nocross is True if the pair is found not to cross,
+        and rows is a list of rows for the result table.
+    """
+    xpoints = []
 
-        xcor = welldfr["X_UTME"].values
-        ycor = welldfr["Y_UTMN"].values
-        zcor = welldfr["Z_TVDSS"].values
-        mcor = welldfr[well.mdlogname].values
-        logger.info("The mdlogname property is: %s", well.mdlogname)
+    if wfilter is not None and "parallel" in wfilter:
+        # truncate away the parallel part of other; as Well.truncate_parallel_path
+        xcorc = ogeo.xv.copy()
+        ycorc = ogeo.yv.copy()
+        zcorc = ogeo.zv.copy()
+        if xcorc.size > 0 and wgeo.xv.size > 0:
+            par = wfilter["parallel"]
+            ier = _cxtgeo.well_trunc_parallel(
+                xcorc,
+                ycorc,
+                zcorc,
+                wgeo.xv,
+                wgeo.yv,
+                wgeo.zv,
+                par.get("xtol") or 0.0,
+                par.get("ytol") or 0.0,
+                par.get("ztol") or 0.0,
+                par.get("itol") or 0.0,
+                par.get("atol") or 0.0,
+                0,
+            )
+            if ier != 0:
+                raise RuntimeError("Unexpected error")
+            keep = xcorc < UNDEF_LIMIT
+            xcorc, ycorc, zcorc = xcorc[keep], ycorc[keep], zcorc[keep]
+
+        if xcorc.size < 2:
+            return False, xpoints
+
+        otherline = sg.LineString(np.stack([xcorc, ycorc, zcorc], axis=1))
+        other2 = sg.LineString(np.stack([xcorc, ycorc], axis=1))
+    else:
+        if ogeo.xv.size < 2:
+            return False, xpoints
+        otherline = ogeo.line("xyz")
+        other2 = ogeo.line("xy")
+
+    thisline1 = wgeo.line("xy")
+
+    if not thisline1.crosses(otherline):
+        return True, xpoints
+
+    ixx = thisline1.intersection(otherline)
+
+    if ixx.is_empty:
+        return True, xpoints
+
+    # need this trick to get mdepth
+    ixx2 = wgeo.line("xym").intersection(other2)
+
+    logger.debug("==> %s intersects with %s", wgeo.name, ogeo.name)
+
+    if isinstance(ixx, sg.Point):
+        xcor, ycor, zcor = ixx.coords[0]
+        _x, _y, mcor = ixx2.coords[0]
+        xpoints.append([wgeo.name, mcor, ogeo.name, xcor, ycor, zcor])
+
+    elif isinstance(ixx, (sg.MultiPoint, sg.GeometryCollection)):
+        pxx2 = _subgeoms(ixx2)
+        for ino, pxx in enumerate(_subgeoms(ixx)):
+            if isinstance(pxx, sg.Point):
+                xcor, ycor, zcor = pxx.coords[0]
+                _x, _y, mcor = pxx2[ino].coords[0]
+                xpoints.append([wgeo.name, mcor, ogeo.name, xcor, ycor, zcor])
+
+    return False, xpoints
+
+
+def _pool_init(geoms, wfilter):
+    _POOLDATA["geoms"] = geoms
+    _POOLDATA["wfilter"] = wfilter
+
+
+def _pool_task(pairs):
+    geoms = _POOLDATA["geoms"]
+    wfilter = _POOLDATA["wfilter"]
+    return [
+        _pair_crossings(geoms[iwell], geoms[jwell], wfilter) for iwell, jwell in pairs
+    ]
+
+
+def _run_pairs(pairs, geoms, wfilter, workers, progress):
+    """Test pairs, serially or split on well subsets in a process pool.
+
+    Returns:
+        A dict with (nocross, rows) per pair
+    """
+    if workers > 1 and len(pairs) > 1:
+        # split on the first well in pair, to keep each well in one process
+        subsets = [[] for _ in range(workers)]
+        for pair in pairs:
+            subsets[pair[0] % workers].append(pair)
+        subsets = [subset for subset in subsets if subset]
+
+        pool = multiprocessing.Pool(
+            len(subsets), initializer=_pool_init, initargs=(geoms, wfilter)
+        )
+        try:
+            results = pool.map(_pool_task, subsets)
+        finally:
+            pool.close()
+            pool.join()
+
+        result = {}
+        for subset, subresult in zip(subsets, results):
+            result.update(zip(subset, subresult))
+        return result
+
+    result = {}
+    for inum, (iwell, jwell) in enumerate(pairs):
+        progress.flush(inum)
+        result[(iwell, jwell)] = _pair_crossings(geoms[iwell], geoms[jwell], wfilter)
+    return result
 
-        if xcor.size < 2:
-            continue
 
-        thisline1 = sg.LineString(np.stack([xcor, ycor], axis=1))
-        thisline2 = sg.LineString(np.stack([xcor, ycor, mcor], axis=1))
+def wellintersections(
+    self, wfilter=None, showprogress=False, workers=1
+):  # pylint: disable=too-many-locals, too-many-branches
+    """Get intersections between wells, return as dataframe table.
 
-        nox[well.name] = list()
-        # loop over other wells
-        for other in self.wells:
+    This routine is using "shapely" functions!
 
-            if other.name == well.name:
-                continue  # same well
+    Some actions are done in order to filter away the part of the trajectories
+    that are paralell.
 
-            if not well.may_overlap(other):
-                nox[well.name].append(other.name)
-                continue  # a quick check; no chance for overlap
+    Candidate pairs of wells are found from a bucket index on the bounding boxes
+    of trajectory segments, and only those are tested in detail. Pairs where the
+    first well is lower in the list are tested first; the reverse pairs are then
+    tested only if the first test did not rule out a crossing (as if wells were
+    looped in sequence). Hence the result order is the order of the wells.
 
-            logger.info("Consider crossing with %s ...", other.name)
+    """
 
-            # try to be smart to skip entries that earlier have beenn tested
-            # for crossing. If other does not cross well, then well does not
-            # cross other...
-            if other.name in nox.keys() and well.name in nox[other.name]:
-                continue
+    wlen = len(self.wells)
 
-            # truncate away the paralell part on a copy
-            owell = other.copy()
+    geoms = []
+    valid = []
+    for well in self.wells:
+        gstatus = well.geometrics()
+        if not gstatus:
+            logger.info("Skip %s (cannot compute geometrics)", well.name)
+        geoms.append(_WellGeom(well, usemd=gstatus))
+        valid.append(gstatus and well.dataframe["X_UTME"].values.size >= 2)
+
+    xpad = ypad = 0.0
+    if wfilter is not None and "parallel" in wfilter:
+        # points closer than tolerances may be truncated
+        xpad = wfilter["parallel"].get("xtol") or 0.0
+        ypad = wfilter["parallel"].get("ytol") or 0.0
+
+    candidates = _segment_candidates(geoms, xpad=xpad, ypad=ypad)
+    logger.info("Number of candidate well pairs: %s", len(candidates))
+
+    def _testable(iwell, jwell):
+        if not valid[iwell] or geoms[iwell].name == geoms[jwell].name:
+            return False
+        pair = (min(iwell, jwell), max(iwell, jwell))
+        return pair in candidates and geoms[iwell].may_overlap(geoms[jwell])
+
+    pairs1 = [
+        (iwell, jwell)
+        for iwell in range(wlen)
+        for jwell in range(iwell + 1, wlen)
+        if _testable(iwell, jwell)
+    ]
+
+    progress = XTGShowProgress(
+        max(len(pairs1), 1), show=showprogress, leadtext="progress: ", skip=5
+    )
+    result = _run_pairs(pairs1, geoms, wfilter, workers, progress)
+
+    # if other does not cross well, then well does not cross other...
+    def _nocross(iwell, jwell):
+        if not valid[iwell] or geoms[iwell].name == geoms[jwell].name:
+            return False
+        if (iwell, jwell) in result:
+            return result[(iwell, jwell)][0]
+        return True
+
+    pairs2 = [
+        (iwell, jwell)
+        for iwell in range(wlen)
+        for jwell in range(iwell)
+        if _testable(iwell, jwell) and not _nocross(jwell, iwell)
+    ]
+    result.update(_run_pairs(pairs2, geoms, wfilter, workers, progress))
 
-            # wfilter = None
-            if wfilter is not None and "parallel" in wfilter:
-                xtol = wfilter["parallel"].get("xtol")
-                ytol = wfilter["parallel"].get("ytol")
-                ztol = wfilter["parallel"].get("ztol")
-                itol = wfilter["parallel"].get("itol")
-                atol = wfilter["parallel"].get("atol")
-                owell.truncate_parallel_path(
-                    well, xtol=xtol, ytol=ytol, ztol=ztol, itol=itol, atol=atol
-                )
+    xpoints = []
+    for pair in sorted(result):
+        xpoints.extend(result[pair][1])
 
-            xcorc = owell.dataframe["X_UTME"].values
-            ycorc = owell.dataframe["Y_UTMN"].values
-            zcorc = owell.dataframe["Z_TVDSS"].values
+    dfr = pd.DataFrame(
+        xpoints, columns=["WELL", "MDEPTH", "CWELL", "X_UTME", "Y_UTMN", "Z_TVDSS"]
+    )
 
-            if xcorc.size < 2:
-                continue
+    progress.finished()
 
-            otherline = sg.LineString(np.stack([xcorc, ycorc, zcorc], axis=1))
+    logger.info("All intersections found!")
+    return dfr
 
-            if not thisline1.crosses(otherline):
-                nox[well.name].append(other.name)
-                continue
 
-            ixx = thisline1.intersection(otherline)
+# number of values per surface and per pick, cf. well_surfs_picks.c
+_SURFINFO = 14
+_PICKDBL = 4
+_PICKINT = 3
+_CERROR = np.iinfo(np.int64).min
+
+
+def _surface_info(surf):
+    """Metadata for a surface, with its bounding box (X Y extent and Z range)"""
+
+    values = surf.npvalues1d
+    zmin = zmax = np.nan
+    if np.isfinite(values).any():
+        zmin = np.nanmin(values)
+        zmax = np.nanmax(values)
+        # bilinear interpolation may differ from the node values by round-off
+        ztol = 1.0e-6 * (1.0 + max(abs(zmin), abs(zmax)))
+        zmin -= ztol
+        zmax += ztol
+
+    # corners of the rotated surface, padded with one increment
+    rot = np.radians(surf.rotation)
+    ivec = np.array([0, surf.ncol - 1, 0, surf.ncol - 1]) * surf.xinc
+    jvec = np.array([0, 0, surf.nrow - 1, surf.nrow - 1]) * surf.yinc * surf.yflip
+    xcorners = surf.xori + ivec * np.cos(rot) - jvec * np.sin(rot)
+    ycorners = surf.yori + ivec * np.sin(rot) + jvec * np.cos(rot)
+    pad = surf.xinc + surf.yinc
+
+    info = [
+        surf.ncol,
+        surf.nrow,
+        surf.xori,
+        surf.yori,
+        surf.xinc,
+        surf.yinc,
+        surf.yflip,
+        surf.rotation,
+        zmin,
+        zmax,
+        xcorners.min() - pad,
+        xcorners.max() + pad,
+        ycorners.min() - pad,
+        ycorners.max() + pad,
+    ]
+    return np.array(info, dtype=np.float64), values
+
+
+def surface_picks(self, surfaces):
+    """Picks where the wells cross the surfaces, as Points (None if no picks)"""
+
+    if isinstance(surfaces, xtgeo.Surfaces):
+        surfaces = surfaces.surfaces
+
+    wells = self.wells
+    if not wells or not surfaces:
+        return None
+
+    surfinfo, surfvalues = zip(*[_surface_info(surf) for surf in surfaces])
+    surfinfo = np.concatenate(surfinfo)
+    surfvalues = np.concatenate(surfvalues)
+
+    xvs, yvs, zvs, mvs = [], [], [], []
+    mdlognames = set()
+    for well in wells:
+        dfr = well.dataframe
+        xvs.append(dfr["X_UTME"].values)
+        yvs.append(dfr["Y_UTMN"].values)
+        zvs.append(dfr["Z_TVDSS"].values)
+        if well.mdlogname:
+            mdlognames.add(well.mdlogname)
+            mvs.append(dfr[well.mdlogname].values)
+        else:
+            mvs.append(np.full(len(dfr), UNDEF))
+
+    wellstart = np.zeros(len(wells) + 1, dtype=np.int32)
+    wellstart[1:] = np.cumsum([xv.size for xv in xvs])
+
+    xvs, yvs, zvs, mvs = (
+        np.ascontiguousarray(np.concatenate(vec), dtype=np.float64)
+        for vec in (xvs, yvs, zvs, mvs)
+    )
 
-            if ixx.is_empty:
-                nox[well.name].append(other.name)
-                continue
+    # most often a well crosses each surface once; rerun if more room is needed
+    npicks = 2 * len(wells) * len(surfaces)
+    while True:
+        pickv = np.zeros(_PICKDBL * npicks, dtype=np.float64)
+        pickiv = np.zeros(_PICKINT * npicks, dtype=np.int32)
+        nres = _cxtgeo.well_surfs_picks(
+            xvs, yvs, zvs, mvs, surfvalues, surfinfo, wellstart, pickv, pickiv
+        )
+        if nres >= 0:
+            break
+        if nres == _CERROR:
+            raise RuntimeError("Error from C routine well_surfs_picks")
+        npicks = -nres
+
+    if nres == 0:
+        return None
+
+    pickv = pickv[: _PICKDBL * nres].reshape(nres, _PICKDBL)
+    pickiv = pickiv[: _PICKINT * nres].reshape(nres, _PICKINT)
+
+    poi = xtgeo.Points()
+
+    res = OrderedDict()
+    res[poi.xname] = pickv[:, 0]
+    res[poi.yname] = pickv[:, 1]
+    res[poi.zname] = pickv[:, 2]
+    if mdlognames:
+        mdname = mdlognames.pop() if len(mdlognames) == 1 else "M_MDEPTH"
+        mres = pickv[:, 3]
+        mres[mres > UNDEF_LIMIT] = np.nan
+        res[mdname] = mres
+    res["DIRECTION"] = pickiv[:, 2]
+    res["WELLNAME"] = np.array([well.name for well in wells], dtype=object)[
+        pickiv[:, 0]
+    ]
+    res["SURFACE"] = np.array([surf.name for surf in surfaces], dtype=object)[
+        pickiv[:, 1]
+    ]
+
+    poi.dataframe = pd.DataFrame.from_dict(res)
+
+    return poi
+
+
+def gridproperty_values(self, gridprops, grid, names=None):
+    """Values from many grid properties (e.g. realisations) sampled in all wells"""
+
+    from ._well_oper import cell_index, gather_values, _gridprops_list
+
+    if isinstance(gridprops, (xtgeo.GridProperty, xtgeo.GridProperties)):
+        gridprops = _gridprops_list(gridprops)
+
+    gridprops = list(gridprops)
+    for prop in gridprops:
+        shape = prop.dimensions if isinstance(prop, xtgeo.GridProperty) else prop.shape
+        if tuple(shape) != grid.dimensions:
+            raise ValueError(
+                "Property dimensions {} differ from grid dimensions {}".format(
+                    tuple(shape), grid.dimensions
+                )
+            )
+
+    if names is None:
+        names = [
+            prop.name if isinstance(prop, xtgeo.GridProperty) else "VALUES"
+            for prop in gridprops
+        ]
+        # make names unique, e.g. for realisations of the same property
+        if len(set(names)) < len(names):
+            names = ["{}_{}".format(name, inum) for inum, name in enumerate(names)]
+    elif len(names) != len(gridprops):
+        raise ValueError("The number of names and properties differ")
+
+    wells = self.wells
+    cellindex = np.concatenate(
+        [cell_index(well, grid) for well in wells] or [np.zeros(0, dtype=np.int64)]
+    )
 
-            # need this trick to get mdepth
-            other2 = sg.LineString(np.stack([xcorc, ycorc], axis=1))
-            ixx2 = thisline2.intersection(other2)
+    res = OrderedDict()
+    res["WELLNAME"] = np.repeat(
+        np.array([well.name for well in wells], dtype=object),
+        [len(well.dataframe) for well in wells],
+    )
+    for col in ("X_UTME", "Y_UTMN", "Z_TVDSS"):
+        res[col] = np.concatenate(
+            [well.dataframe[col].values for well in wells] or [np.zeros(0)]
+        )
 
-            logger.debug("==> Intersects with %s", other.name)
+    # one vectorized gather per property, for all wells
+    for name, prop in zip(names, gridprops):
+        res[name] = gather_values(prop, cellindex)
 
-            if isinstance(ixx, sg.Point):
-                xcor, ycor, zcor = ixx.coords[0]
-                _x, _y, mcor = ixx2.coords[0]
-                xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+    return pd.DataFrame.from_dict(res)
 
-            elif isinstance(ixx, sg.MultiPoint):
-                pxx2 = list(ixx2)
-                for ino, pxx in enumerate(list(ixx)):
-                    xcor, ycor, zcor = pxx.coords[0]
-                    _x, _y, mcor = pxx2[ino].coords[0]
-                    xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
 
-            elif isinstance(ixx, sg.GeometryCollection):
-                gxx2 = list(ixx2)
-                for ino, gxx in enumerate(list(ixx)):
-                    if isinstance(gxx, sg.Point):
-                        xcor, ycor, zcor = gxx.coords[0]
-                        _x, _y, mcor = gxx2[ino].coords[0]
-                        xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+def make_ijk_from_grid(self, grid, grid_id="", algorithm=2):
+    """Make I J K logs from grid for all wells; algorithm 1 in one batch"""
 
-    dfr = pd.DataFrame(
-        xpoints, columns=["WELL", "MDEPTH", "CWELL", "X_UTME", "Y_UTMN", "Z_TVDSS"]
-    )
+    from ._well_oper import wells_ijk_from_grid_v1, set_ijk_logs
 
-    progress.finished()
+    wells = self.wells
+    if algorithm != 1:
+        grid.build_search_index()
+        for well in wells:
+            well.make_ijk_from_grid(grid, grid_id=grid_id, algorithm=algorithm)
+        return
 
-    logger.info("All intersections found!")
-    return dfr
+    for well, ijk in zip(wells, wells_ijk_from_grid_v1(wells, grid)):
+        set_ijk_logs(well, grid, ijk, grid_id=grid_id)
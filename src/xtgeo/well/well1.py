@@ -40,6 +40,8 @@ def well_from_file(
     lognames="all",
     lognames_strict=False,
     strict=False,
+    lazy=False,
+    discrete_dtype=None,
 ):
     """Make an instance of a Well directly from file import.
 
@@ -50,6 +52,8 @@ def well_from_file(
         zonelogname (str): See :meth:`Well.from_file`
         lognames (str or list): Name or list of lognames to import, default is "all"
         strict (bool): See :meth:`Well.from_file`
+        lazy (bool): See :meth:`Well.from_file`
+        discrete_dtype (str): See :meth:`Well.from_file`
 
     Example::
 
@@ -58,6 +62,7 @@ def well_from_file(
 
     .. versionchanged:: 2.1.0 Added ``lognames`` and ``lognames_strict``
     .. versionchanged:: 2.1.0 ``strict`` now defaults to False
+    .. versionchanged:: 2.8.0 Added ``lazy`` and ``discrete_dtype``
 
     """
 
@@ -71,6 +76,8 @@ def well_from_file(
         strict=strict,
         lognames=lognames,
         lognames_strict=lognames_strict,
+        lazy=lazy,
+        discrete_dtype=discrete_dtype,
     )
 
     return obj
@@ -176,6 +183,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
         self._zonelogname = None
 
         self._df = None  # pandas dataframe with all log values
+        self._lazy = None  # file settings if logs are not read yet (lazy import)
 
         if args:
             # make instance from file import
@@ -185,6 +193,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             zonelogname = kwargs.get("zonelogname", None)
             strict = kwargs.get("strict", False)
             lognames = kwargs.get("lognames", "all")
+            lazy = kwargs.get("lazy", False)
+            discrete_dtype = kwargs.get("discrete_dtype", None)
             self.from_file(
                 wfile,
                 fformat=fformat,
@@ -192,6 +202,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
                 zonelogname=zonelogname,
                 lognames=lognames,
                 strict=strict,
+                lazy=lazy,
+                discrete_dtype=discrete_dtype,
             )
 
         else:
@@ -225,7 +237,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
     def _ensure_consistency(self):
         """Ensure consistency within an object (private function)"""
 
-        if self._df is None:
+        if self._wdf is None:
             return
 
         self._wlognames = list(self._df.columns)
@@ -243,7 +255,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
                 if self._wlogtype[logname] == "DISC":
                     # it is a discrete log with missing record; try to find
                     # a default one based on current values...
-                    lvalues = self._df[logname].values.round(decimals=0)
+                    lvalues = self._get_log_values(logname).round(decimals=0)
                     lmin = int(lvalues.min())
                     lmax = int(lvalues.max())
 
@@ -259,6 +271,19 @@ class Well(object):  # pylint: disable=useless-object-inheritance
     # Properties
     # ==================================================================================
 
+    @property
+    def _df(self):
+        # the logs of a lazy imported well are read on first access
+        if self._wdf is None and self._lazy is not None:
+            _well_io.import_rms_ascii_data(self)
+            self._ensure_consistency()
+        return self._wdf
+
+    @_df.setter
+    def _df(self, dfr):
+        self._wdf = dfr
+        self._lazy = None
+
     @property
     def rkb(self):
         """ Returns RKB height for the well (read only)."""
@@ -396,7 +421,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
     def lognames(self):
         """Returns the Pandas dataframe column as list (excluding
         mandatory X_UTME Y_UTMN Z_TVDSS)"""
-        return list(self._df)[3:]
+        return self.lognames_all[3:]
 
     # ==================================================================================
     # Methods
@@ -411,6 +436,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
         strict=False,
         lognames="all",
         lognames_strict=False,
+        lazy=False,
+        discrete_dtype=None,
     ):
         """Import well from file.
 
@@ -427,6 +454,15 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             lognames (str or list): Name or list of lognames to import, default is "all"
             lognames_strict (bool): Flag to require all logs in lognames (unless "all")
                 or to just accept that subset that is present. Default is `False`.
+            lazy (bool): If True, only the file header (well name, position, RKB
+                and log names) is read, and the log values are read on first
+                access. Default is False.
+            discrete_dtype (str): Storage of discrete (DISC) logs, such as zone and
+                facies logs, in the dataframe. Default is None, i.e. float64 as
+                other logs. Use "int32" for pandas nullable Int32 columns
+                (requires pandas >= 0.24), or "category" for categorical columns,
+                which both need less memory. Methods in Well work on such logs as
+                float64 with NaN values.
 
 
         Returns:
@@ -440,6 +476,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
 
         .. versionchanged:: 2.1.0 ``lognames`` and ``lognames_strict`` added
         .. versionchanged:: 2.1.0 ``strict`` now defaults to False
+        .. versionchanged:: 2.8.0 ``lazy`` and ``discrete_dtype`` added
         """
 
         if not os.path.isfile(wfile):
@@ -456,6 +493,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
                 strict=strict,
                 lognames=lognames,
                 lognames_strict=lognames_strict,
+                lazy=lazy,
+                discrete_dtype=discrete_dtype,
             )
         else:
             logger.error("Invalid file format")
@@ -743,7 +782,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
         Returns None of log does not exist.
         """
         if lname in self._df:
-            np_array = self._df[lname].values
+            np_array = self._get_log_values(lname)
         else:
             return None
 
@@ -754,6 +793,14 @@ class Well(object):  # pylint: disable=useless-object-inheritance
 
         return carr
 
+    def _get_log_values(self, lname):
+        """Returns a log as float64 numpy array (copy) with NaN as undefined.
+
+        DISC logs may be stored as nullable int32 or categorical, cf. the
+        ``discrete_dtype`` key in :meth:`from_file`.
+        """
+        return np.asarray(self._df[lname].astype("float64"))
+
     def get_filled_dataframe(
         self, fill_value=const.UNDEF, fill_value_int=const.UNDEF_INT
     ):
@@ -782,6 +829,7 @@ class Well(object):  # pylint: disable=useless-object-inheritance
 
         for lname in lnames:
             if self.get_logtype(lname) == "DISC":
+                newdf[lname] = self._get_log_values(lname)
                 dtype[lname] = np.int32
                 dfill[lname] = fill_value_int
             else:
@@ -1109,66 +1157,15 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             if a zonelog is missing
         """
 
-        zlist = []
-        # get the relevant logs:
-
-        self.geometrics()
-
-        # as zlog is float64; need to convert to int array with high
-        # number as undef
-        if self.zonelogname is not None:
-            zlog = self._df[self.zonelogname].values
-            zlog[np.isnan(zlog)] = const.UNDEF_INT
-            zlog = np.rint(zlog).astype(int)
-        else:
-            return None
-
-        xvv = self._df["X_UTME"].values
-        yvv = self._df["Y_UTMN"].values
-        zvv = self._df["Z_TVDSS"].values
-        incl = self._df["Q_INCL"].values
-        mdv = self._df["Q_MDEPTH"].values
-
-        if self.mdlogname is not None:
-            mdv = self._df[self.mdlogname].values
-
-        if zonelist is None:
-            # need to declare as list; otherwise Py3 will get dict.keys
-            zonelist = list(self.get_logrecord(self.zonelogname).keys())
-
-        logger.info("Find values for %s", zonelist)
-
-        ztops, ztopnames, zisos, zisonames = _wellmarkers.extract_ztops(
+        return _wellmarkers.get_zonation_points(
             self,
-            zonelist,
-            xvv,
-            yvv,
-            zvv,
-            zlog,
-            mdv,
-            incl,
             tops=tops,
             incl_limit=incl_limit,
-            prefix=top_prefix,
+            top_prefix=top_prefix,
+            zonelist=zonelist,
             use_undef=use_undef,
         )
 
-        if tops:
-            zlist = ztops
-        else:
-            zlist = zisos
-
-        logger.debug(zlist)
-
-        if tops:
-            dfr = pd.DataFrame(zlist, columns=ztopnames)
-        else:
-            dfr = pd.DataFrame(zlist, columns=zisonames)
-
-        logger.debug(dfr)
-
-        return dfr
-
     def get_zone_interval(self, zonevalue, resample=1, extralogs=None):
 
         """Extract the X Y Z ID line (polyline) segment for a given
@@ -1318,6 +1315,10 @@ class Well(object):  # pylint: disable=useless-object-inheritance
         By default, log (i.e. column names in the dataframe) will be
         ICELL, JCELL, KCELL, but you can add a tag (ID) to that name.
 
+        The lookup uses the grid's search index, which is built on first use and
+        then shared by all wells blocked against the same grid, see
+        :meth:`Grid.build_search_index() <xtgeo.grid3d.Grid.build_search_index>`.
+
         Args:
             grid (Grid): A XTGeo Grid instance
             grid_id (str): Add a tag (optional) to the current log name
@@ -1370,7 +1371,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
 
         Args:
             gridprops (Grid): A XTGeo GridProperties instance (a collection
-                of properties) or a single GridProperty instance
+                of properties), a single GridProperty instance or a list of
+                GridProperty instances
             grid (Grid or tuple): A XTGeo Grid instance or a reference
                 via tuple. If this is tuple with log names,
                 it states that these logs already contains
@@ -1378,10 +1380,18 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             prop_id (str): Add a tag (optional) to the current log name, e.g
                 as PORO_model, where _model is the tag.
 
+        If a Grid is given, the cells along the well are found once per well
+        trajectory and grid geometry, and cached on the grid (together with its
+        search index, see :meth:`Grid.build_search_index()
+        <xtgeo.grid3d.Grid.build_search_index>`). Hence sampling properties from
+        many realisations that share the grid geometry is fast.
+
         Raises:
             None
 
         ..versionadded:: 2.1.0
+        .. versionchanged:: 2.8.0 Cache the well cells when a Grid is given,
+            and allow a list of GridProperty instances.
 
         """
 
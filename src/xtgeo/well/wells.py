@@ -4,7 +4,9 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import functools
 from distutils.version import StrictVersion
+from multiprocessing.pool import ThreadPool
 
 import pandas as pd
 
@@ -16,6 +18,15 @@ xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+def _read_well(wfile, **kwargs):
+    """Read one well file, return (well, None), or (None, error) if skipped"""
+    # file checks are done within the Well() class
+    try:
+        return xtgeo.well.Well(wfile, **kwargs), None
+    except ValueError as err:
+        return None, err
+
+
 class Wells(object):
     """Class for a collection of Well objects, for operations that involves
     a number of wells.
@@ -36,6 +47,9 @@ class Wells(object):
             mdlogname = kwargs.get("mdlogname", None)
             zonelogname = kwargs.get("zonelogname", None)
             strict = kwargs.get("strict", True)
+            lazy = kwargs.get("lazy", False)
+            workers = kwargs.get("workers", 1)
+            discrete_dtype = kwargs.get("discrete_dtype", None)
             self.from_files(
                 wfiles,
                 fformat=fformat,
@@ -43,6 +57,9 @@ class Wells(object):
                 zonelogname=zonelogname,
                 strict=strict,
                 append=False,
+                lazy=lazy,
+                workers=workers,
+                discrete_dtype=discrete_dtype,
             )
 
     @property
@@ -123,6 +140,9 @@ class Wells(object):
         zonelogname=None,
         strict=True,
         append=True,
+        lazy=False,
+        workers=1,
+        discrete_dtype=None,
     ):
 
         """Import wells from a list of files (filelist).
@@ -138,31 +158,51 @@ class Wells(object):
                 in wells.
             append (bool): If True, new wells will be added to existing
                 wells.
+            lazy (bool): If True, only the file headers are read, and the log
+                values for each well are read on first access.
+            workers (int): Number of threads for reading files concurrently.
+                Default is 1.
+            discrete_dtype (str): Storage of discrete logs, see
+                :meth:`Well.from_file`.
 
         Example:
             Here the from_file method is used to initiate the object
             directly::
 
             >>> mywells = Wells(['31_2-6.w', '31_2-7.w', '31_2-8.w'])
+
+        .. versionchanged:: 2.8.0 Added ``lazy``, ``workers`` and ``discrete_dtype``
         """
 
         if not append:
             self._wells = []
 
-        # file checks are done within the Well() class
-        for wfile in filelist:
+        reader = functools.partial(
+            _read_well,
+            fformat=fformat,
+            mdlogname=mdlogname,
+            zonelogname=zonelogname,
+            strict=strict,
+            lazy=lazy,
+            discrete_dtype=discrete_dtype,
+        )
+
+        if workers > 1 and len(filelist) > 1:
+            pool = ThreadPool(min(workers, len(filelist)))
             try:
-                wll = xtgeo.well.Well(
-                    wfile,
-                    fformat=fformat,
-                    mdlogname=mdlogname,
-                    zonelogname=zonelogname,
-                    strict=strict,
-                )
-                self._wells.append(wll)
-            except ValueError as err:
+                results = pool.map(reader, filelist)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = (reader(wfile) for wfile in filelist)
+
+        for wll, err in results:
+            if err is not None:
                 xtg.warn("SKIP this well: {}".format(err))
                 continue
+            self._wells.append(wll)
+
         if not self._wells:
             xtg.warn("No wells imported!")
 
@@ -264,7 +304,123 @@ class Wells(object):
         for well in self.wells:
             well.downsample(interval=interval, keeplast=keeplast)
 
-    def wellintersections(self, wfilter=None, showprogress=False):
+    def get_surface_picks(self, surfaces):
+        """Get a :class:`.Points` instance where the wells cross the surfaces
+        (horizon picks), for all wells and surfaces in one go.
+
+        This gives the same picks as :meth:`Well.get_surface_picks()
+        <xtgeo.well.Well.get_surface_picks>` for each well and surface, but each
+        trajectory is traversed once, and surfaces that a trajectory segment
+        cannot cross (judged from bounding boxes) are skipped. The wells are
+        processed in parallel if more threads are set, see
+        :func:`xtgeo.set_nthreads`.
+
+        The dataframe has a ``DIRECTION`` column (1 if the surface is penetrated
+        from above, -1 if from below), and ``WELLNAME`` and ``SURFACE`` (name)
+        columns. The picks are ordered by well, then along the trajectory.
+        If any well has a MD log, it is added as a column (named ``M_MDEPTH`` if
+        the wells have different MD log names).
+
+        Args:
+            surfaces (Surfaces or list): A Surfaces instance or a list of
+                RegularSurface instances
+
+        Returns:
+            A :class:`.Points` instance, or None if no crossing points
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _wells_utils.surface_picks(self, surfaces)
+
+    def make_ijk_from_grid(self, grid, grid_id="", algorithm=2):
+        """Look through a Grid and add grid I J K as discrete logs, for all wells.
+
+        This is :meth:`Well.make_ijk_from_grid()
+        <xtgeo.well.Well.make_ijk_from_grid>` for each well, with the same
+        result. The grid's search index (see :meth:`Grid.build_search_index()
+        <xtgeo.grid3d.Grid.build_search_index>`) is built once and shared by all
+        wells. With ``algorithm=1``, all wells are blocked in one call, where
+        the wells are processed in parallel if more threads are set, see
+        :func:`xtgeo.set_nthreads`.
+
+        Args:
+            grid (Grid): A XTGeo Grid instance
+            grid_id (str): Add a tag (optional) to the current log name
+            algorithm (int): Search algorithm, 1 or 2 (default), see
+                :meth:`Well.make_ijk_from_grid()
+                <xtgeo.well.Well.make_ijk_from_grid>`
+
+        Raises:
+            RuntimeError: 'Error from C routine, code is ...'
+
+        .. versionadded:: 2.8.0
+        """
+
+        _wells_utils.make_ijk_from_grid(
+            self, grid, grid_id=grid_id, algorithm=algorithm
+        )
+
+    def get_gridproperties(self, gridprops, grid, prop_id="_model"):
+        """Look through a Grid and add grid properties as logs, for all wells.
+
+        This is :meth:`Well.get_gridproperties()
+        <xtgeo.well.Well.get_gridproperties>` for each well. The cells of each
+        well trajectory are found once per grid geometry and cached on the grid
+        (for the 1000 most recently used trajectories), so repeated calls for
+        properties sharing the grid geometry, e.g. realisations, only gather the
+        values.
+
+        Args:
+            gridprops: A GridProperties instance, a GridProperty instance or a
+                list of GridProperty instances
+            grid (Grid): A XTGeo Grid instance
+            prop_id (str): Add a tag (optional) to the current log name, e.g
+                as PORO_model, where _model is the tag.
+
+        .. versionadded:: 2.8.0
+        """
+
+        for well in self.wells:
+            well.get_gridproperties(gridprops, grid=grid, prop_id=prop_id)
+
+    def get_gridproperty_values(self, gridprops, grid, names=None):
+        """Get values from a number of grid properties sampled in all wells.
+
+        The properties share the grid geometry, e.g. a property from many
+        realisations. The cells of each well trajectory are found once (and
+        cached on the grid, as in :meth:`get_gridproperties`), and then the
+        values are gathered from each property in one vectorized operation for
+        all wells. The wells are not changed.
+
+        Args:
+            gridprops: A list of GridProperty instances or numpy arrays with
+                shape as the grid dimensions; or a GridProperties instance.
+            grid (Grid): A XTGeo Grid instance
+            names (list of str): Column names for the properties. Default is the
+                property names (``VALUES`` for arrays), where a number is added
+                if names are not unique.
+
+        Returns:
+            A Pandas dataframe with columns WELLNAME, X_UTME, Y_UTMN, Z_TVDSS
+            and one column per property, with one row per well sample. Samples
+            outside the grid, in inactive cells or in cells with masked property
+            values have NaN values, as in the logs from
+            :meth:`get_gridproperties`.
+
+        Example::
+
+            grd = xtgeo.Grid("mygrid.roff")
+            poros = [xtgeo.gridproperty_from_file(pfile, name="PORO", grid=grd)
+                     for pfile in realisation_files]
+            dfr = mywells.get_gridproperty_values(poros, grd)
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _wells_utils.gridproperty_values(self, gridprops, grid, names=names)
+
+    def wellintersections(self, wfilter=None, showprogress=False, workers=1):
         """Get intersections between wells, return as dataframe table.
 
         Notes on wfilter: A wfilter is settings to improve result. In
@@ -282,15 +438,22 @@ class Wells(object):
             wfilter (dict): A dictionrary for filter options, in order to
                 improve result. See example above.
             showprogress (bool): Will show progress to screen if enabled.
+            workers (int): Number of processes to split the search on. Default
+                is 1, i.e. no process pool.
 
         Returns:
             A Pandas dataframe object, with columns WELL, CWELL and UTMX UTMY
                 TVD coordinates for CWELL where CWELL crosses WELL,
                 and also MDEPTH for the WELL.
+
+        Only pairs of wells with trajectory segments close in map view are
+        tested in detail, hence this scales well with the number of wells.
+
+        .. versionchanged:: 2.8.0 Use a spatial index and added ``workers`` key
         """
 
         dfr = _wells_utils.wellintersections(
-            self, wfilter=wfilter, showprogress=showprogress
+            self, wfilter=wfilter, showprogress=showprogress, workers=workers
         )
 
         return dfr
@@ -229,17 +229,196 @@ def get_fence(
     In such cases, nextend will be modified automatically also to fulfill the original
     intention of nextend*distance (approx).
 
+    The fence is made by fences_from_arrays(), except when several POLY_ID's are
+    given, where the polylines are joined as before (_get_fence_joined).
     """
 
-    new = self.copy()
-    new.hlen()
-
-    if len(new.dataframe) < 2:
+    if len(self.dataframe) < 2:
         xtg.warn(
             "Too few points in polygons for fence, return False (name: {})".format(name)
         )
         return False
 
+    if isinstance(polyid, list) and len(polyid) > 1:
+        return _get_fence_joined(
+            self, distance, atleast, nextend, name=name, asnumpy=asnumpy, polyid=polyid
+        )
+
+    if isinstance(polyid, list):
+        polyid = polyid[0]
+    if polyid is None:
+        polyid = int(self.dataframe[self.pname].iloc[0])
+
+    dfr = self.dataframe
+    use = (dfr[self.pname] == polyid).values
+    fences = fences_from_arrays(
+        dfr[self.xname].values[use],
+        dfr[self.yname].values[use],
+        dfr[self.zname].values[use],
+        distance=distance,
+        atleast=atleast,
+        nextend=nextend,
+    )
+    if not fences or fences[0] is None:
+        xtg.warn(
+            "Cannot make fence from polygons, return False (name: {}, POLY_ID: {})"
+            .format(name, polyid)
+        )
+        return False
+
+    fence = fences[0]
+    if asnumpy is True:
+        return fence
+
+    new = self.copy()
+    new.dataframe = pd.DataFrame(
+        {
+            new.xname: fence[:, 0],
+            new.yname: fence[:, 1],
+            new.zname: fence[:, 2],
+            new.pname: np.full(len(fence), float(polyid)),
+            "H_CUMLEN": fence[:, 3],
+            "H_DELTALEN": fence[:, 4],
+        },
+        columns=[new.xname, new.yname, new.zname, new.pname, "H_CUMLEN", "H_DELTALEN"],
+    )
+    new.hname = "H_CUMLEN"
+    new.dhname = "H_DELTALEN"
+    if name:
+        new.name = name
+
+    return new
+
+
+def fences_from_arrays(xv, yv, zv, pidv=None, distance=20, atleast=5, nextend=2):
+    """Make fences from raw coordinate arrays, one fence per polyline.
+
+    The polylines are grouped by the values in pidv (POLY_ID, sorted as in
+    groupby), or all points are one polyline if pidv is None. Each fence is
+    as from Polygons.get_fence() for that polyline: resampled (linear) with
+    constant horizontal distance, and extended nextend samples at each end.
+
+    Returns:
+        A list with a [:, 5] numpy array per polyline, with columns X, Y, Z,
+        HLEN, dH; or None for a polyline where a fence cannot be made.
+    """
+
+    xv, yv, zv = (np.asarray(arr, dtype=np.float64) for arr in (xv, yv, zv))
+
+    if pidv is None:
+        groups = [np.arange(xv.size)]
+    else:
+        pidv = np.asarray(pidv)
+        order = np.argsort(pidv, kind="stable")
+        bounds = np.flatnonzero(np.diff(pidv[order])) + 1
+        groups = np.split(order, bounds) if order.size > 0 else []
+
+    # horizontal segment lengths for all polylines in one go (as pol_geometrics)
+    dhall = np.sqrt(np.diff(xv) ** 2 + np.diff(yv) ** 2)
+
+    fences = []
+    for ind in groups:
+        if ind.size < 2:
+            fences.append(None)
+            continue
+        if pidv is None:
+            dhv = dhall
+        else:
+            # indices are contiguous in most cases, and then the segments are shared
+            contiguous = ind[-1] - ind[0] == ind.size - 1
+            dhv = dhall[ind[0] : ind[-1]] if contiguous else None
+            if dhv is None:
+                dhv = np.sqrt(np.diff(xv[ind]) ** 2 + np.diff(yv[ind]) ** 2)
+        fences.append(
+            _fence_from_xyz(
+                xv[ind], yv[ind], zv[ind], dhv, distance, atleast, nextend
+            )
+        )
+
+    return fences
+
+
+def _fence_from_xyz(xv, yv, zv, dhv, distance, atleast, nextend):
+    """One fence from a polyline, cf. get_fence; None if it cannot be made."""
+
+    hlenv = np.concatenate(([0.0], np.cumsum(dhv)))
+
+    hxlen = hlenv[-1]
+
+    # perhaps a way to treat very vertical polys from wells:
+    if hxlen < 0.1 * distance:
+        hxlen = 0.1 * distance
+
+    if hxlen / float(atleast) < distance:
+        orig_extend = nextend * distance
+        distance = hxlen / float(atleast)
+        nextend = int(round(orig_extend / distance))
+
+    # resample linearly along horizontal length; cf. _rescale_v2
+    leng = hlenv[-1]
+    leng = leng - 0.001 * leng
+    nstep = int(leng / distance)
+    if nstep < 2:
+        # an empty fence is accepted if it shall not be extended
+        return np.zeros((0, 5)) if nstep == 0 and nextend == 0 else None
+
+    alpha = np.linspace(0, leng, num=nstep, endpoint=True)
+    xnew = np.interp(alpha, hlenv, xv)
+    ynew = np.interp(alpha, hlenv, yv)
+    znew = np.interp(alpha, hlenv, zv)
+
+    dhnew = np.sqrt(np.diff(xnew) ** 2 + np.diff(ynew) ** 2)
+    updated_distance = np.median(np.concatenate((dhnew[:1], dhnew)))
+
+    # extend at each end with the horizontal direction of the end segments
+    xbeg, ybeg, xend, yend = [], [], [], []
+    x0, y0, x1, y1 = xnew[1], ynew[1], xnew[0], ynew[0]
+    x2, y2, x3, y3 = xnew[-2], ynew[-2], xnew[-1], ynew[-1]
+    for _nsam in range(nextend):
+        xnext, ynext = _extrapolate(x0, y0, x1, y1, updated_distance, -1.0)
+        xbeg.append(xnext)
+        ybeg.append(ynext)
+        x0, y0, x1, y1 = x1, y1, xnext, ynext
+
+        xnext, ynext = _extrapolate(x2, y2, x3, y3, updated_distance, 1.0)
+        xend.append(xnext)
+        yend.append(ynext)
+        x2, y2, x3, y3 = x3, y3, xnext, ynext
+
+    xnew = np.concatenate((xbeg[::-1], xnew, xend))
+    ynew = np.concatenate((ybeg[::-1], ynew, yend))
+    znew = np.concatenate(
+        (np.full(nextend, znew[0]), znew, np.full(nextend, znew[-1]))
+    )
+
+    dhnew = np.sqrt(np.diff(xnew) ** 2 + np.diff(ynew) ** 2)
+    dhnew = np.concatenate((dhnew[:1], dhnew))
+    hnew = np.concatenate(([0.0], np.cumsum(dhnew[1:])))
+    if nextend > 0:
+        hnew -= hnew[nextend]
+
+    return np.stack((xnew, ynew, znew, hnew, dhnew), axis=1)
+
+
+def _extrapolate(x0, y0, x1, y1, distance, shift):
+    """Point distance beyond (x1, y1) seen from (x0, y0); as x_vector_linint2."""
+
+    if abs(x1 - x0) < 1e-20 and abs(y1 - y0) < 1e-20:
+        x1 = x1 + shift
+
+    length = np.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2 + 0.0)
+    return x1 + (x1 - x0) / length * distance, y1 + (y1 - y0) / length * distance
+
+
+def _get_fence_joined(
+    self, distance=20, atleast=5, nextend=2, name=None, asnumpy=True, polyid=None
+):
+    """Fence from several POLY_ID's, where the polylines are resampled and then
+    extended as one polyline."""
+
+    new = self.copy()
+    new.hlen()
+
     new.filter_byid(polyid)
 
     hxlen = new.get_shapely_objects()[0].length
@@ -498,24 +498,21 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods
         if not wells:
             return None
 
-        dflist = []
-        for well in wells:
-            wp = well.get_zonation_points(
-                tops=tops,
-                incl_limit=incl_limit,
-                top_prefix=top_prefix,
-                zonelist=zonelist,
-                use_undef=use_undef,
-            )
-
-            if wp is not None:
-                dflist.append(wp)
+        # all wells are collected as columns, and the dataframe is made once
+        dfr, nwells = xtgeo.well._wellmarkers.get_zonation_points_wells(
+            wells,
+            tops=tops,
+            incl_limit=incl_limit,
+            top_prefix=top_prefix,
+            zonelist=zonelist,
+            use_undef=use_undef,
+        )
 
-        if dflist:
-            self._df = pd.concat(dflist, ignore_index=True)
-        else:
+        if dfr is None:
             return None
 
+        self._df = dfr
+
         for col in self._df.columns:
             if col == "Zone":
                 self._attrs[col] = "int"
@@ -526,7 +523,7 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods
             else:
                 self._attrs[col] = "float"
 
-        return len(dflist)
+        return nwells
 
     def dfrac_from_wells(
         self,
@@ -6,6 +6,9 @@
 # which identifies each polygon piece.
 
 from __future__ import print_function, absolute_import
+
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 import shapely.geometry as sg
@@ -762,9 +765,12 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
                 first found.
 
         Returns:
-            A numpy array (if asnumpy=True) or a new Polygons() object
+            A numpy array (if asnumpy=True) or a new Polygons() object. False is
+            returned if a fence cannot be made, e.g. if the polyline is too short.
 
         .. versionadded:: 2.1.0
+        .. versionchanged:: 2.8.0 Made with numpy directly from the coordinates,
+            see also :meth:`get_fences`.
         """
         logger.info("Getting fence within a Polygons instance...")
         return _xyz_oper.get_fence(
@@ -777,6 +783,39 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
             polyid=polyid,
         )
 
+    def get_fences(self, distance=20, atleast=5, nextend=2):
+        """Extracts fences for all polylines (POLY_ID) in one go.
+
+        Each fence is as from :meth:`get_fence` for that POLY_ID (with
+        ``asnumpy=True``), but all fences are made directly from the coordinate
+        arrays, without intermediate Polygons instances. This is much faster
+        when there are many polylines, e.g. for many well fences.
+
+        Args:
+            distance (float): New horizontal distance between points
+            atleast (int): Minimum number of point, see :meth:`get_fence`
+            nextend (int): Number of samples to extend at each end
+
+        Returns:
+            An ordered dictionary with POLY_ID as key and a [:, 5] numpy array with
+            columns X.., Y.., Z.., HLEN, dH as value. The value is None if the
+            polyline is too short for a fence.
+
+        .. versionadded:: 2.8.0
+        """
+        dfr = self.dataframe
+        pids = dfr[self.pname].values
+        fences = _xyz_oper.fences_from_arrays(
+            dfr[self.xname].values,
+            dfr[self.yname].values,
+            dfr[self.zname].values,
+            pidv=pids,
+            distance=distance,
+            atleast=atleast,
+            nextend=nextend,
+        )
+        return OrderedDict(zip(np.unique(pids).tolist(), fences))
+
     # ==================================================================================
     # Plotting
     # ==================================================================================
@@ -115,3 +115,17 @@ def test_xtgeocfile():
 
 #         with pytest.raises(ValueError):
 #             xsys.check_folder(folder, raiseerror=ValueError)
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("4", 4), (" 2 ", 2), ("abc", 1), ("", 1), (None, 1)]
+)
+def test_nthreads_from_env(monkeypatch, value, expected):
+    """XTG_NTHREADS shall be parsed without failing on bad values"""
+    from xtgeo.common import sys as xsys
+
+    if value is None:
+        monkeypatch.delenv("XTG_NTHREADS", raising=False)
+    else:
+        monkeypatch.setenv("XTG_NTHREADS", value)
+    assert xsys._nthreads_from_env() == expected
@@ -343,3 +343,62 @@ def test_cube_randomline():
     # plt.axis('tight')
     # plt.colorbar()
     # plt.show()
+
+
+def test_cube_lazy_segy(tmp_path):
+    """Read a SEGY cube lazy, and compare with a cube read in memory"""
+
+    vals = np.random.RandomState(1).rand(30, 20, 40).astype(np.float32)
+    cube = Cube(
+        ncol=30,
+        nrow=20,
+        nlay=40,
+        xinc=10,
+        yinc=12,
+        zinc=4,
+        xori=1000,
+        yori=2000,
+        zori=100,
+        rotation=30,
+        values=vals,
+    )
+    cube.ilines = np.arange(1, 31, dtype=np.int32)
+    cube.xlines = np.arange(1, 21, dtype=np.int32)
+    cube.traceidcodes = np.ones((30, 20), dtype=np.int32)
+    cfile = join(str(tmp_path), "cube_lazy.segy")
+    cube.to_file(cfile)
+
+    incube = Cube(cfile)
+    lazycube = Cube(cfile, lazy=True, cachesize=0.01)
+    assert lazycube.lazy
+
+    assert np.array_equal(lazycube.get_iline(5), incube.values[4, :, :])
+    assert np.array_equal(lazycube.get_xline(7), incube.values[:, 6, :])
+    assert np.array_equal(lazycube.get_zslice(120), incube.values[:, :, 5])
+    with pytest.raises(ValueError):
+        lazycube.get_iline(99)
+
+    surf = xtgeo.RegularSurface(
+        ncol=30, nrow=25, xinc=9, yinc=9, xori=950, yori=1950, values=180.0
+    )
+    surf1 = surf.copy()
+    surf1.slice_cube(incube, sampling="trilinear")
+    surf2 = surf.copy()
+    surf2.slice_cube(lazycube, sampling="trilinear")
+    assert np.ma.allclose(surf1.values, surf2.values)
+
+    attrs1 = surf.slice_cube_window(incube, attribute=["max", "rms"], zrange=10)
+    attrs2 = surf.slice_cube_window(lazycube, attribute=["max", "rms"], zrange=10)
+    for attr in ("max", "rms"):
+        assert np.ma.allclose(attrs1[attr].values, attrs2[attr].values)
+
+    fence = [[1000.0, 2010.0, 0.0, 0.0], [1200.0, 2100.0, 0.0, 0.0]]
+    fence = xtgeo.Polygons(fence).get_fence(distance=4, asnumpy=True)
+    line1 = incube.get_randomline(fence, sampling="trilinear")
+    line2 = lazycube.get_randomline(fence, sampling="trilinear")
+    assert line1[:4] == line2[:4]
+    assert np.allclose(line1[4], line2[4], equal_nan=True)
+
+    assert lazycube.lazy
+    assert np.array_equal(lazycube.values, incube.values)
+    assert not lazycube.lazy
@@ -151,3 +151,96 @@ def test_avg03():
 
     logger.info(avgmap.values.mean())
     assert avgmap.values.mean() == pytest.approx(0.1653, abs=0.01)
+
+
+def test_avg_box_vs_griddata():
+    """Average map from a shoebox grid, compared with per layer griddata."""
+    import scipy.interpolate
+
+    grd = Grid()
+    grd.create_box(dimension=(20, 15, 8), increment=(50, 50, 2), rotation=0.0)
+
+    dz = grd.get_dz(mask=False).get_npvalues3d(fill_value=0.0)
+    xc, yc, _zc = grd.get_xyz(mask=False)
+    xcuse = xc.get_npvalues3d()
+    ycuse = yc.get_npvalues3d()
+
+    pouse = np.random.RandomState(22).uniform(0.1, 0.3, size=xcuse.shape)
+    zuse = np.ones((xcuse.shape))
+
+    avgmap = RegularSurface(
+        nx=60, ny=40, xinc=15, yinc=15, xori=10, yori=20, values=np.zeros((60, 40)),
+    )
+
+    avgmap.avg_from_3dprop(
+        xprop=xcuse,
+        yprop=ycuse,
+        zoneprop=zuse,
+        zone_minmax=(1, 1),
+        mprop=pouse,
+        dzprop=dz,
+    )
+
+    # reference, as the gridding was done before triangulations were reused
+    xiv, yiv = avgmap.get_xy_values()
+    msum = np.zeros((60, 40))
+    dzsum = np.zeros((60, 40))
+    for klay0 in range(grd.nlay):
+        pts = (xcuse[:, :, klay0].ravel(), ycuse[:, :, klay0].ravel())
+        mvdz = (pouse[:, :, klay0] * dz[:, :, klay0]).ravel()
+        msum += scipy.interpolate.griddata(pts, mvdz, (xiv, yiv), fill_value=0.0)
+        dzsum += scipy.interpolate.griddata(
+            pts, dz[:, :, klay0].ravel(), (xiv, yiv), fill_value=0.0
+        )
+
+    refmap = np.ma.masked_where(dzsum < 1.1e-20, msum / np.where(dzsum, dzsum, 1e-20))
+
+    assert np.array_equal(avgmap.values.mask, refmap.mask)
+    assert np.allclose(avgmap.values.compressed(), refmap.compressed())
+
+
+def test_avg_box_workers():
+    """Gridding layers in threads shall give identical result as serial."""
+    grd = Grid()
+    grd.create_box(dimension=(20, 15, 12), increment=(50, 50, 2), rotation=10.0)
+
+    dz = grd.get_dz(mask=False).get_npvalues3d(fill_value=0.0)
+    xc, yc, _zc = grd.get_xyz(mask=False)
+    xcuse = xc.get_npvalues3d()
+    ycuse = yc.get_npvalues3d()
+
+    pouse = np.random.RandomState(33).uniform(0.1, 0.3, size=xcuse.shape)
+    zuse = np.ones((xcuse.shape))
+    zuse[:, :, 6:] = 2
+
+    maps = []
+    for workers in (1, 4):
+        for summing in (False, True):
+            amap = RegularSurface(
+                nx=60, ny=40, xinc=15, yinc=15, values=np.zeros((60, 40)),
+            )
+            if summing:
+                amap.hc_thickness_from_3dprops(
+                    xprop=xcuse,
+                    yprop=ycuse,
+                    zoneprop=zuse,
+                    zone_minmax=(1, 2),
+                    hcpfzprop=pouse * dz,
+                    dzprop=dz,
+                    workers=workers,
+                )
+            else:
+                amap.avg_from_3dprop(
+                    xprop=xcuse,
+                    yprop=ycuse,
+                    zoneprop=zuse,
+                    zone_minmax=(1, 2),
+                    mprop=pouse,
+                    dzprop=dz,
+                    workers=workers,
+                )
+            maps.append(amap.values)
+
+    assert np.ma.allequal(maps[0], maps[2])
+    assert np.array_equal(maps[0].mask, maps[2].mask)
+    assert np.array_equal(maps[1], maps[3])
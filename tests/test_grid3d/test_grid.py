@@ -5,6 +5,7 @@ from __future__ import print_function
 import os
 from os.path import join
 from collections import OrderedDict
+import itertools
 import math
 
 import pytest
@@ -349,6 +350,138 @@ def test_import_grdecl_and_bgrdecl():
     tsetup.assert_almostequal(dzv1.values.mean(), dzv2.values.mean(), 0.001)
 
 
+def test_import_grdecl_syntax(tmp_path):
+    """GRDECL with comments, repeat counts and INCLUDE, read in small chunks"""
+    from xtgeo.grid3d import _grdecl_stream
+
+    grd = Grid()
+    grd.create_box(dimension=(4, 3, 2), increment=(20, 20, 5), rotation=30)
+    grd._zcornsv += np.linspace(0, 1, grd._zcornsv.size)
+    grd._actnumsv[0:5] = 0
+    grd.to_file(join(str(tmp_path), "syntax0.grdecl"), fformat="grdecl")
+
+    # move ZCORN to an INCLUDE file, and use repeat counts in ACTNUM
+    with open(join(str(tmp_path), "syntax0.grdecl")) as stream:
+        text = stream.read()
+    zstart = text.index("ZCORN")
+    zend = text.index("/", zstart) + 1
+    with open(join(str(tmp_path), "syntax_zcorn.grdecl"), "w") as stream:
+        stream.write("-- ZCORN / in separate file\n" + text[zstart:zend] + "\n")
+    astart = text.index("ACTNUM")
+    text = (
+        "-- header\nECHO\n"
+        + text[:zstart]
+        + "INCLUDE -- comment\n 'syntax_zcorn.grdecl' /\n"
+        + "ACTNUM\n 5*0 19*1 /\nNOECHO\n"
+        + text[text.index("/", astart) + 1 :]
+    )
+    with open(join(str(tmp_path), "syntax.grdecl"), "w") as stream:
+        stream.write(text)
+
+    chunksize = _grdecl_stream.CHUNKSIZE
+    for size in (7, 64, chunksize):
+        _grdecl_stream.CHUNKSIZE = size
+        try:
+            grd2 = Grid(join(str(tmp_path), "syntax.grdecl"), fformat="grdecl")
+        finally:
+            _grdecl_stream.CHUNKSIZE = chunksize
+
+        assert grd2.dimensions == (4, 3, 2)
+        assert grd2.nactive == 19
+        np.testing.assert_allclose(grd2._coordsv, grd._coordsv, atol=0.001)
+        np.testing.assert_allclose(grd2._zcornsv, grd._zcornsv, atol=0.001)
+
+
+def test_import_grdecl_dataless_keywords(tmp_path):
+    """GRDECL with keywords without data, and other records, shall be skipped"""
+
+    grd = Grid()
+    grd.create_box(dimension=(3, 2, 2), increment=(20, 20, 5))
+    grd._actnumsv[0] = 0
+    grd.to_file(join(str(tmp_path), "dataless0.grdecl"), fformat="grdecl")
+
+    with open(join(str(tmp_path), "dataless0.grdecl")) as stream:
+        text = stream.read()
+    cstart = text.index("COORD")
+    text = (
+        "NEWTRAN\nGRIDUNIT\nMETRES /\n"
+        + text[:cstart]
+        + "NOGGF\nINIT\n"
+        + text[cstart:]
+    )
+    with open(join(str(tmp_path), "dataless.grdecl"), "w") as stream:
+        stream.write(text)
+
+    grd2 = Grid(join(str(tmp_path), "dataless.grdecl"), fformat="grdecl")
+    assert grd2.dimensions == (3, 2, 2)
+    assert grd2.nactive == 11
+    np.testing.assert_allclose(grd2._coordsv, grd._coordsv, atol=0.001)
+    np.testing.assert_allclose(grd2._zcornsv, grd._zcornsv, atol=0.001)
+
+    # a file without ZCORN shall fail
+    zstart = text.index("ZCORN")
+    with open(join(str(tmp_path), "nozcorn.grdecl"), "w") as stream:
+        stream.write(text[:zstart] + text[text.index("/", zstart) + 1 :])
+
+    with pytest.raises(xtgeo.KeywordNotFoundError, match="ZCORN"):
+        Grid(join(str(tmp_path), "nozcorn.grdecl"), fformat="grdecl")
+
+
+def test_compact_zcorn(tmp_path):
+    """Compact (float32) ZCORN shall give same results as full precision"""
+
+    grd = Grid()
+    grd.create_box(dimension=(6, 5, 4), increment=(20, 20, 5), rotation=30)
+    assert not grd.compact
+
+    for fformat in ("grdecl", "roff"):
+        fname = join(str(tmp_path), "compact." + fformat)
+        grd.to_file(fname, fformat=fformat)
+        grd1 = Grid(fname)
+        grd2 = Grid(fname, compact=True)
+        assert grd2.compact
+        assert grd2._zcornsv.dtype == np.float32
+
+        for mygrd in (grd1, grd2):
+            mygrd.translate_coordinates(translate=(10, 10, 10.3))
+            mygrd.reverse_row_axis()
+            mygrd.make_zconsistent()
+            mygrd.crop((2, 5), (1, 4), (1, 4))
+
+        assert grd2.compact
+        np.testing.assert_allclose(grd2._zcornsv, grd1._zcornsv, atol=0.001)
+        np.testing.assert_allclose(
+            grd2.get_dz().values, grd1.get_dz().values, atol=0.001
+        )
+
+        grd2.compact = False
+        assert grd2._zcornsv.dtype == np.float64
+
+
+def test_compact_zcorn_layer_blocks(monkeypatch):
+    """Geometry and volumes of a compact grid, expanded per layer, as in one go"""
+
+    grd = Grid()
+    grd.create_box(dimension=(6, 5, 4), increment=(20, 20, 5), rotation=30)
+    grd.compact = True
+    zone = grd.get_ijk()[2]
+    zone.name = "Zone"
+
+    geom1 = grd.get_cell_geometry(activeonly=False, layer_range=(2, 4))
+    bulk1 = grd.get_bulk_volume()
+    dfr1 = grd.get_volumes(groupby=zone)
+
+    monkeypatch.setattr(xtgeo.grid3d._grid_etc1, "ZCORN_BLOCK", 1)
+    grd._tmp = {}
+
+    geom2 = grd.get_cell_geometry(activeonly=False, layer_range=(2, 4))
+    for name, values in geom1.items():
+        np.testing.assert_array_equal(geom2[name], values)
+    np.testing.assert_array_equal(grd.get_bulk_volume().values, bulk1.values)
+    assert grd.get_volumes(groupby=zone).equals(dfr1)
+    assert grd.compact
+
+
 def test_eclgrid_import2():
     """Eclipse EGRID import, also change ACTNUM."""
     grd = Grid()
@@ -589,6 +722,112 @@ def test_xyz_cell_corners():
     assert allcorners[23].get_npvalues1d()[-1] == 1001.0
 
 
+def test_cell_geometry():
+    """Cell geometry in one pass shall match the separate methods, and be cached"""
+
+    grd = Grid()
+    grd.create_box(dimension=(6, 5, 4), increment=(20, 30, 5), rotation=30)
+    actnum = grd.get_actnum()
+    actnum.values[0, 0, :] = 0
+    grd.set_actnum(actnum)
+
+    geom = grd.get_cell_geometry(corners=True)
+    xcoord, ycoord, zcoord = grd.get_xyz()
+    dxv, dyv = grd.get_dxdy(asmasked=True)
+
+    for name, prop in (
+        ("X_UTME", xcoord),
+        ("Y_UTMN", ycoord),
+        ("Z_TVDSS", zcoord),
+        ("dZ", grd.get_dz()),
+        ("dX", dxv),
+        ("dY", dyv),
+    ):
+        np.testing.assert_array_equal(geom[name].mask, prop.values.mask)
+        np.testing.assert_allclose(geom[name], prop.values, rtol=1e-6)
+
+    np.testing.assert_allclose(geom["BULKVOL"], 20 * 30 * 5)
+    assert geom["CORNERS"].shape == (6, 5, 4, 24)
+    assert geom["CORNERS"][1, 2, 3].tolist() == pytest.approx(
+        grd.get_xyz_cell_corners(ijk=(2, 3, 4))
+    )
+
+    # cached until geometry is changed, but not the corners
+    geom0 = grd.get_cell_geometry()
+    assert grd.get_cell_geometry()["dZ"] is geom0["dZ"]
+    assert all("CORNERS" not in cached for cached in grd._tmp["cellgeometry"].values())
+    np.testing.assert_array_equal(geom0["dZ"], geom["dZ"])
+    sub = grd.get_cell_geometry(activeonly=False, layer_range=(2, 3))
+    assert sub["Z_TVDSS"].shape == (6, 5, 2)
+    assert not np.ma.is_masked(sub["Z_TVDSS"])
+
+    grd.translate_coordinates(translate=(0, 0, 100))
+    np.testing.assert_allclose(
+        grd.get_cell_geometry()["Z_TVDSS"], geom["Z_TVDSS"] + 100
+    )
+
+    with pytest.raises(ValueError):
+        grd.get_cell_geometry(layer_range=(3, 5))
+
+
+def test_cell_geometry_skewed_faulted():
+    """Cell geometry for skewed pillars and faults (corners differ per cell)"""
+
+    grd = Grid()
+    grd.create_box(dimension=(4, 3, 3), increment=(20, 30, 5), rotation=30)
+
+    # move the base of pillars, and the Z of each cell corner
+    rng = np.random.RandomState(12)
+    coordsv = grd._coordsv.reshape(-1, 6)
+    coordsv[:, 3:5] += rng.uniform(-5, 5, size=(coordsv.shape[0], 2))
+    grd._zcornsv += rng.uniform(-2, 2, size=grd._zcornsv.size)
+    grd._tmp = {}
+
+    geom = grd.get_cell_geometry(corners=True)
+
+    for icol, jrow, klay in itertools.product(range(4), range(3), range(3)):
+        assert geom["CORNERS"][icol, jrow, klay].tolist() == pytest.approx(
+            grd.get_xyz_cell_corners(ijk=(icol + 1, jrow + 1, klay + 1))
+        )
+
+    xcoord, ycoord, zcoord = grd.get_xyz()
+    for name, prop in (("X_UTME", xcoord), ("Y_UTMN", ycoord), ("Z_TVDSS", zcoord)):
+        np.testing.assert_allclose(geom[name], prop.values, rtol=1e-9)
+    np.testing.assert_allclose(geom["dZ"], grd.get_dz().values, rtol=1e-6)
+
+
+def test_bulk_and_pore_volumes():
+    """Bulk volume per cell, and volumes summed per zone"""
+
+    grd = Grid()
+    grd.create_box(dimension=(6, 5, 4), increment=(20, 30, 5), rotation=30)
+    actnum = grd.get_actnum()
+    actnum.values[0, 0, :] = 0
+    grd.set_actnum(actnum)
+
+    bulk = grd.get_bulk_volume()
+    assert bulk.values.count() == grd.nactive
+    np.testing.assert_allclose(bulk.values, 3000.0)
+
+    zone = grd.get_ijk()[2]
+    zone.name = "Zone"
+    poro = bulk.copy()
+    poro.values = np.linspace(0.1, 0.3, grd.ntotal).reshape(grd.dimensions)
+    swat = poro.copy()
+    swat.values = np.ones(grd.dimensions) * 0.25
+
+    dfr = grd.get_volumes(groupby=zone, poro=poro, sw=swat)
+    assert dfr["Zone"].tolist() == [1, 2, 3, 4]
+    np.testing.assert_allclose(dfr["BULK"], 29 * 3000.0)
+    for kzone in range(4):
+        porv = (bulk.values * poro.values)[:, :, kzone].sum()
+        assert dfr["PORV"][kzone] == pytest.approx(porv)
+        assert dfr["HCPV"][kzone] == pytest.approx(0.75 * porv)
+
+    dfr = grd.get_volumes(activeonly=False)
+    assert dfr["BULK"][0] == pytest.approx(grd.ntotal * 3000.0)
+
+
 def test_grid_layer_slice():
     """Test grid slice coordinates"""
 
@@ -3,12 +3,16 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
+import struct
 import sys
 import warnings
 
 import pytest
+import numpy as np
 
 from xtgeo.grid3d import Grid
+from xtgeo.grid3d import GridProperty
 from xtgeo.grid3d import GridProperties
 from xtgeo.common import XTGeoDialog
 
@@ -202,6 +206,182 @@ def test_scan_keywords():
     assert df.loc[12, 'KEYWORD'] == 'SWAT'  # pylint: disable=no-member
 
 
+def test_keyword_index():
+    """Keyword index of a RESTART file shall match scan_keywords with dates"""
+    from xtgeo.common import _XTGeoCFile
+    from xtgeo.grid3d import _grid3d_utils as utils
+
+    dlist = GridProperties.scan_keywords(RFILE1, dates=True)
+
+    rfile = _XTGeoCFile(RFILE1)
+    kwindex = utils.EclKeywordIndex.from_file(rfile.fhandle)
+
+    assert kwindex.records == dlist
+    assert kwindex.dates == [dat for _seq, dat in GridProperties.scan_dates(RFILE1)]
+    assert kwindex.has("SWAT", 20000201)
+    assert not kwindex.has("SWAT", 20000202)
+
+    kwname, kwtype, kwlen, kwbyte, _ = kwindex.get("SWAT", 20000201)
+    kwindex.prefetch(rfile.fhandle, [kwindex.get("SWAT", 20000201)])
+    swat1 = kwindex.eclbin_record(rfile.fhandle, kwname, kwlen, kwtype, kwbyte)
+    kwindex.clear()
+    swat2 = kwindex.eclbin_record(rfile.fhandle, kwname, kwlen, kwtype, kwbyte)
+    assert swat1.tolist() == swat2.tolist()
+    rfile.close()
+
+
+def test_scan_keywords_cached(tmp_path, monkeypatch):
+    """Scan keywords and dates with a cached keyword index"""
+    import xtgeo
+    from xtgeo.grid3d import _grid3d_utils as utils
+
+    cachedir = os.path.join(str(tmp_path), "eclindex")
+    xtgeo.set_eclindex_cache(cachedir)
+    try:
+        dlist1 = GridProperties.scan_keywords(RFILE1, dates=True)
+        assert os.path.isfile(utils._eclindex_cachefile(RFILE1, cachedir))
+
+        # the file shall not be scanned again when the index is in the cache
+        def _noscan(*args, **kwargs):
+            raise AssertionError("File is scanned, cached index is not used")
+
+        monkeypatch.setattr(utils.EclKeywordIndex, "from_file", _noscan)
+        dlist2 = GridProperties.scan_keywords(RFILE1, dates=True)
+        dates = GridProperties.scan_dates(RFILE1)
+        monkeypatch.undo()
+    finally:
+        xtgeo.set_eclindex_cache(None)
+
+    assert dlist1 == dlist2 == GridProperties.scan_keywords(RFILE1, dates=True)
+    assert dates == GridProperties.scan_dates(RFILE1)
+
+
+def test_scan_keywords_cache_outdated(tmp_path, monkeypatch):
+    """A changed file shall be scanned again; a bad cache location is ignored"""
+    import xtgeo
+    from xtgeo.grid3d import _grid3d_utils as utils
+
+    grd = Grid()
+    grd.create_box((3, 4, 5))
+    poro = GridProperty(grd, name="PORO", values=np.arange(60.0).reshape(3, 4, 5))
+    pfile = os.path.join(str(tmp_path), "poro.bgrdecl")
+    poro.to_file(pfile, fformat="bgrdecl")
+
+    nscans = []
+    from_file = utils.EclKeywordIndex.from_file
+
+    def _countscan(*args, **kwargs):
+        nscans.append(1)
+        return from_file(*args, **kwargs)
+
+    monkeypatch.setattr(utils.EclKeywordIndex, "from_file", _countscan)
+
+    cachedir = os.path.join(str(tmp_path), "eclindex")
+    xtgeo.set_eclindex_cache(cachedir)
+    try:
+        kwlist = GridProperties.scan_keywords(pfile)
+        assert GridProperties.scan_keywords(pfile) == kwlist
+        assert len(nscans) == 1
+
+        stat = os.stat(pfile)
+        os.utime(pfile, (stat.st_atime, stat.st_mtime + 10))
+        assert GridProperties.scan_keywords(pfile) == kwlist
+        assert len(nscans) == 2
+
+        # the cache folder cannot be made below a file; the file is just scanned
+        xtgeo.set_eclindex_cache(os.path.join(pfile, "eclindex"))
+        assert GridProperties.scan_keywords(pfile) == kwlist
+        assert len(nscans) == 3
+    finally:
+        xtgeo.set_eclindex_cache(None)
+
+
+def _write_eclrecord(stream, name, values, kwtype):
+    """Write a record in Eclipse binary format, with blocks of 1000 items"""
+    values = np.asarray(values).astype({"INTE": ">i4", "REAL": ">f4"}[kwtype])
+    header = name.ljust(8).encode() + struct.pack(">i", values.size) + kwtype.encode()
+    stream.write(struct.pack(">i", 16) + header + struct.pack(">i", 16))
+    for start in range(0, values.size, 1000):
+        block = values[start : start + 1000].tobytes()
+        nbyte = struct.pack(">i", len(block))
+        stream.write(nbyte + block + nbyte)
+
+
+def test_import_init_without_logihead(tmp_path):
+    """An INIT file without LOGIHEAD shall be imported"""
+
+    grd = Grid()
+    grd.create_box((3, 4, 5))
+
+    intehead = np.zeros(411, dtype=np.int32)
+    intehead[8:11] = grd.dimensions
+    intehead[14] = 3  # oil/water
+    intehead[94] = 100  # E100
+    poro = np.arange(60.0).reshape(3, 4, 5)
+
+    pfile = os.path.join(str(tmp_path), "NOLOGIHEAD.INIT")
+    with open(pfile, "wb") as stream:
+        _write_eclrecord(stream, "INTEHEAD", intehead, "INTE")
+        _write_eclrecord(stream, "PORO", poro.ravel(order="F"), "REAL")
+
+    props = GridProperties()
+    props.from_file(pfile, fformat="init", names=["PORO"], grid=grd)
+    assert props.names == ["PORO"]
+    np.testing.assert_array_equal(props.props[0].values, poro)
+
+
+def test_import_restart_lazy():
+    """Import restart lazy; values are read when used, and may be unloaded"""
+
+    g = Grid(GFILE1, fformat="egrid")
+
+    names = ["SOIL", "SWAT", "PRESSURE"]
+    dates = [19991201, 20010101]
+
+    x = GridProperties()
+    x.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+
+    y = GridProperties()
+    y.from_file(
+        RFILE1,
+        fformat="unrst",
+        names=names,
+        dates=dates,
+        grid=g,
+        lazy=True,
+        cachesize=1,
+    )
+
+    assert y.names == x.names
+    assert all(prop.lazy and prop._values is None for prop in y.props)
+
+    for _ in range(2):
+        for xprop, yprop in zip(x.props, y.props):
+            assert yprop.name == xprop.name
+            np.testing.assert_array_equal(yprop.values, xprop.values)
+
+    # only about 1 MB of values are kept in memory
+    assert sum(prop._values is not None for prop in y.props) < len(y.props)
+
+    # setting values detach the property from file
+    pres = y.get_prop_by_name("PRESSURE_19991201")
+    pres.values = pres.values + 1.0
+    assert not pres.lazy
+
+    # a scalar keeps the mask (inactive cells) of a property not yet loaded
+    z = GridProperties()
+    z.from_file(
+        RFILE1, fformat="unrst", names=["SWAT"], dates=[19991201], grid=g, lazy=True
+    )
+    swat = z.props[0]
+    assert swat._values is None
+    swat.values = 0.5
+    np.testing.assert_array_equal(
+        np.ma.getmaskarray(swat.values),
+        np.ma.getmaskarray(x.get_prop_by_name("SWAT_19991201").values),
+    )
+
+
 def test_scan_keywords_roff():
     """A static method to scan quickly keywords in a ROFF file"""
     t1 = xtg.timer()
@@ -231,3 +411,31 @@ def test_get_dataframe():
     assert df['PRESSURE_19991201'].mean() == pytest.approx(334.523, abs=0.005)
 
 #    df = x.dataframe(activeonly=True, ijk=True, xyz=True)
+
+
+def test_get_dataframe_chunks():
+    """Dataframe in chunks shall be equal to the complete dataframe"""
+    import pandas as pd
+
+    g = Grid(GFILE1, fformat="egrid")
+
+    x = GridProperties()
+
+    names = ['SOIL', 'SWAT', 'PRESSURE']
+    dates = [19991201]
+    x.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+
+    for activeonly in (True, False):
+        df = x.get_dataframe(activeonly=activeonly, ijk=True, xyz=True, grid=g)
+
+        chunks = list(x.get_dataframe_chunks(chunksize=10000, activeonly=activeonly,
+                                             ijk=True, xyz=True, grid=g))
+        assert all(len(chunk) == 10000 for chunk in chunks[:-1])
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+    csvfile = os.path.join(TDIR, "reek_props.csv")
+    x.dataframe_to_file(csvfile, fformat="csv", chunksize=10000, activeonly=True,
+                        ijk=True, grid=g)
+    dfcsv = pd.read_csv(csvfile)
+    assert len(dfcsv) == len(x.get_dataframe(activeonly=True, ijk=True, grid=g))
+    assert dfcsv['PRESSURE_19991201'].mean() == pytest.approx(334.523, abs=0.005)
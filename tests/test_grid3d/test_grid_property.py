@@ -272,6 +272,45 @@ def test_eclinit_simple_importexport():
     assert p2.name == "PORO2"
 
 
+def test_eclbinary_mmap_records():
+    """Records read via a memory map shall be as records read in C"""
+    from xtgeo.grid3d import _grid_eclbin_record as eclbin
+
+    for efile in (testfile6, testfile7):
+        kwlist = xtgeo.GridProperties.scan_keywords(efile)
+
+        pfile = xtgeo._XTGeoCFile(efile)
+        ecl = eclbin.EclBinaryMmap(efile)
+        for kwname, kwtype, kwlen, kwbyte in kwlist:
+            if kwtype not in eclbin.ECLTYPES:
+                continue
+            values1 = eclbin.eclbin_record(pfile.fhandle, kwname, kwlen, kwtype, kwbyte)
+            values2 = ecl.record(kwname, kwlen, kwtype, kwbyte)
+            assert values2.dtype == values1.dtype
+            np.testing.assert_array_equal(values2, values1)
+
+        ecl.close()
+        pfile.close()
+
+
+def test_bgrdecl_import_without_mmap(tmp_path, monkeypatch):
+    """Binary GRDECL shall be read with file reads if the file cannot be mapped"""
+    from xtgeo.grid3d import _grid_eclbin_record as eclbin
+
+    grd = Grid()
+    grd.create_box((3, 4, 5))
+    poro = GridProperty(grd, name="PORO", values=np.arange(60.0).reshape(3, 4, 5))
+    pfile = os.path.join(str(tmp_path), "poro.bgrdecl")
+    poro.to_file(pfile, fformat="bgrdecl")
+
+    def _nommap(filename):
+        raise OSError("cannot map {}".format(filename))
+
+    monkeypatch.setattr(eclbin, "EclBinaryMmap", _nommap)
+    poro2 = GridProperty(pfile, fformat="bgrdecl", name="PORO", grid=grd)
+    np.testing.assert_array_equal(poro2.values, poro.values)
+
+
 def test_eclunrst_import_reek():
     """Property UNRST import from Eclipse. Reek"""
 
@@ -2,7 +2,13 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import numpy as np
+import pandas as pd
+
 import xtgeo
+from xtgeo.grid3d import _grid_etc1
+
+import test_common.test_xtg as tsetup
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.basiclogger(__name__)
@@ -134,3 +140,118 @@ def test_get_ijk_from_points_small():
     g1 = xtgeo.grid3d.Grid(SMALL2)
     ijk = g1.get_ijk_from_points(po, activeonly=False)
     assert ijk["JY"][1] == 3
+
+
+def test_get_ijk_from_points_search_index():
+    """The search index shall be reused, and rebuilt when geometry changes"""
+
+    g1 = xtgeo.Grid()
+    g1.create_box(
+        dimension=(10, 12, 6), origin=(0, 0, 1000), increment=(100, 100, 5), rotation=0
+    )
+
+    po = xtgeo.Points([(150.0, 250.0, 1001.0), (950.0, 50.0, 1029.0)])
+
+    g1.build_search_index()
+    onegrid = g1._tmp["onegrid"]
+
+    ijk = g1.get_ijk_from_points(po)
+    assert g1._tmp["onegrid"] is onegrid
+    assert ijk["IX"].values.tolist() == [2, 10]
+    assert ijk["JY"].values.tolist() == [3, 1]
+    assert ijk["KZ"].values.tolist() == [1, 6]
+
+    g1.translate_coordinates(translate=(100, 0, 0))
+    assert "onegrid" not in g1._tmp
+
+    ijk = g1.get_ijk_from_points(po)
+    assert g1._tmp["onegrid"] is not onegrid
+    assert ijk["IX"].values.tolist() == [1, 9]
+
+    # a change in depth only shall also invalidate the index
+    onegrid = g1._tmp["onegrid"]
+    g1.translate_coordinates(translate=(0, 0, 10))
+    ijk = g1.get_ijk_from_points(po)
+    assert g1._tmp["onegrid"] is not onegrid
+    assert ijk["KZ"].values.tolist() == [-1, 4]
+
+
+def _deep_dipping_box(nlay):
+    """A deep box grid with dipping layers and some collapsed layers"""
+    grd = xtgeo.Grid()
+    grd.create_box(
+        dimension=(20, 20, nlay),
+        origin=(0, 0, 1000),
+        increment=(100, 100, 0.5),
+        rotation=0,
+    )
+    zcorn = grd._zcornsv.reshape(nlay + 1, 20, 20, 4).copy()
+    icol = np.arange(20)[None, None, :, None] + np.array([0, 1, 0, 1])
+    zcorn += 3.0 * icol
+    zcorn[nlay // 5 : nlay // 5 + 10] = zcorn[nlay // 5]
+    grd._zcornsv = zcorn.ravel()
+    return grd
+
+
+def _random_points(npoints, zrange):
+    rng = np.random.RandomState(42)
+    pnts = xtgeo.Points()
+    pnts.dataframe = pd.DataFrame(
+        {
+            "X_UTME": rng.uniform(0, 2000, npoints),
+            "Y_UTMN": rng.uniform(0, 2000, npoints),
+            "Z_TVDSS": rng.uniform(zrange[0], zrange[1], npoints),
+        }
+    )
+    return pnts
+
+
+def test_get_ijk_from_points_ksearch():
+    """K search by bisection shall give same result as a linear K scan"""
+
+    grd = _deep_dipping_box(100)
+    pnts = _random_points(2000, (990, 1120))
+
+    ijk1 = _grid_etc1.get_ijk_from_points(grd, pnts, _ver=1)
+    ijk2 = _grid_etc1.get_ijk_from_points(grd, pnts, _ver=2)
+
+    assert (ijk2["KZ"] > 0).sum() > 500
+    assert ijk1.equals(ijk2)
+
+
+def test_get_ijk_from_points_nthreads():
+    """Threaded point lookup shall give same result as serial"""
+
+    grd = _deep_dipping_box(20)
+    pnts = _random_points(5000, (990, 1120))
+
+    try:
+        xtgeo.set_nthreads(1)
+        ijk1 = grd.get_ijk_from_points(pnts)
+        xtgeo.set_nthreads(4)
+        ijk2 = grd.get_ijk_from_points(pnts)
+    finally:
+        xtgeo.set_nthreads(1)
+
+    assert xtgeo.get_nthreads() == 1
+    assert ijk1.equals(ijk2)
+
+
+@tsetup.bigtest
+def test_get_ijk_from_points_ksearch_benchmark():
+    """Benchmark points per second, linear K scan vs bisection for deep grid"""
+
+    grd = _deep_dipping_box(500)
+    grd.build_search_index()
+    npoints = 50000
+    pnts = _random_points(npoints, (990, 1320))
+
+    result = []
+    for ver in (1, 2):
+        t0 = xtg.timer()
+        result.append(_grid_etc1.get_ijk_from_points(grd, pnts, _ver=ver))
+        logger.info(
+            "K search version %s: %.0f points/sec", ver, npoints / xtg.timer(t0)
+        )
+
+    assert result[0].equals(result[1])
@@ -6,6 +6,7 @@ import sys
 import pytest
 from os.path import join as ojn
 
+import numpy as np
 import numpy.ma as ma
 
 import xtgeo
@@ -255,6 +256,35 @@ def test_slice_attr_window_max_algorithm2(load_cube_rsgy1):
     #               infotext='Method: trilinear, window')
 
 
+@pytest.mark.parametrize('sampling', ['nearest', 'trilinear'])
+def test_slice_attr_window_algorithms_synthetic(sampling):
+    """Window attributes from the one pass algorithm 2 vs algorithm 1."""
+
+    rng = np.random.RandomState(1)
+    kube = Cube(ncol=30, nrow=40, nlay=50, xinc=12.5, yinc=12.5, zinc=4.0,
+                zori=1000.0, rotation=20.0,
+                values=rng.normal(0, 1, (30, 40, 50)).astype(np.float32))
+
+    xs1 = RegularSurface(ncol=40, nrow=45, xinc=10.0, yinc=10.0, xori=-100.0,
+                         yori=-50.0, rotation=10.0,
+                         values=1100.0 + rng.normal(0, 20, (40, 45)))
+    xs1.values[3:6, 4:9] = ma.masked
+    xs2 = xs1.copy()
+    xs2.values += rng.uniform(-5, 60, xs1.values.shape)
+
+    for kwargs in ({'zrange': 12}, {'other': xs2},
+                   {'other': xs2, 'other_position': 'above'}):
+        res1 = xs1.slice_cube_window(kube, attribute='all', sampling=sampling,
+                                     deadtraces=False, algorithm=1, **kwargs)
+        res2 = xs1.slice_cube_window(kube, attribute='all', sampling=sampling,
+                                     deadtraces=False, algorithm=2, **kwargs)
+        for attr in res1:
+            val1 = res1[attr].values
+            val2 = res2[attr].values
+            assert (ma.getmaskarray(val1) == ma.getmaskarray(val2)).all()
+            assert np.allclose(val1, val2, rtol=1e-12, atol=1e-12)
+
+
 @tsetup.skipifroxar
 def test_cube_attr_mean_two_surfaces(load_cube_rsgy1):
     """Get cube attribute (mean) between two surfaces."""
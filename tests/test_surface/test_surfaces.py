@@ -117,6 +117,41 @@ def test_more_statistics():
     tsetup.assert_almostequal(res["std"].values.mean(), stdev, 0.0001)
 
 
+def test_statistics_lazy_percentiles(tmp_path):
+    """Statistics of surfaces read one by one from files, with percentiles"""
+
+    base = xtgeo.RegularSurface(
+        ncol=20, nrow=30, xinc=25, yinc=25, values=np.zeros((20, 30))
+    )
+    flist = []
+    for inum in range(0, 101):
+        tmp = base.copy()
+        tmp.values += float(inum)
+        if inum == 100:
+            tmp.values[0:2, 0:3] = np.ma.masked
+        fname = join(str(tmp_path), "surf_stat_{}.gri".format(inum))
+        tmp.to_file(fname)
+        flist.append(fname)
+
+    so = xtgeo.Surfaces(flist, lazy=True)
+    so.describe()
+    res = so.statistics(percentiles=[10, 50, 90])
+
+    assert res["count"].values.max() == 101
+    assert res["count"].values.min() == 100
+    assert res["min"].values.min() == 0.0
+    assert res["max"].values.max() == 100.0
+    tsetup.assert_almostequal(res["mean"].values[10, 10], 50.0, 0.0001)
+    tsetup.assert_almostequal(res["mean"].values[0, 0], 49.5, 0.0001)
+    for pcent in (10, 50, 90):
+        # estimated from a histogram, so within (max - min) / nbins
+        tsetup.assert_almostequal(res["p{}".format(pcent)].values[10, 10], pcent, 1.0)
+
+    # the files are read when surfaces are used, but not kept by the instance
+    assert isinstance(so.surfaces[0], xtgeo.RegularSurface)
+    assert not isinstance(so._surfaces[0], xtgeo.RegularSurface)
+
+
 def test_surfaces_apply():
     base = xtgeo.RegularSurface(TESTSET1A)
     base.describe()
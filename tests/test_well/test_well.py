@@ -4,6 +4,7 @@ from __future__ import print_function
 
 import glob
 from os.path import join
+from distutils.version import StrictVersion
 
 import pytest
 import numpy as np
@@ -36,6 +37,9 @@ WELL1 = join(TESTPATH, 'wells/battle/1/WELL09.rmswell')
 WELL2 = join(TESTPATH, 'wells/battle/1/WELL36.rmswell')
 WELL3 = join(TESTPATH, 'wells/battle/1/WELL10.rmswell')
 
+# nullable Int32 columns for discrete_dtype="int32"
+PANDAS_INT32 = StrictVersion(pd.__version__) >= StrictVersion("0.24.0")
+
 
 @pytest.fixture()
 def loadwell1():
@@ -51,6 +55,55 @@ def loadwell3():
     return Well(WELL3)
 
 
+SIMPLE_WELL = """1.0
+Unknown
+OP 1 A 461809.59 5932990.36 20.5
+2
+ZONE DISC 1 zone1 2 zone2
+PERM CONT lin
+461809.59 5932990.36 1500.0 -999 1.5e3
+ 461809.59  5932990.36  1501.0 2 0.25
+
+461809.59\t5932990.36 1502.0 1 -999.0
+"""
+
+
+def test_import_simple_table(tmp_path):
+    """Import a small well file, also with malformed table and DISC dtypes."""
+
+    wfile = join(str(tmp_path), 'simple_well.w')
+    with open(wfile, 'w') as fwell:
+        fwell.write(SIMPLE_WELL)
+
+    mywell = Well(wfile)
+    assert mywell.name == 'OP 1 A'
+    assert mywell.rkb == 20.5
+    assert mywell.get_logrecord('ZONE') == {1: 'zone1', 2: 'zone2'}
+    dfr = mywell.dataframe
+    assert dfr.shape == (3, 5)
+    assert dfr['Z_TVDSS'].tolist() == [1500.0, 1501.0, 1502.0]
+    assert np.isnan(dfr['ZONE'][0])
+    assert dfr['PERM'][0] == 1500.0
+    assert np.isnan(dfr['PERM'][2])
+
+    # a short line makes the fast parser give up; shall give same as pandas
+    with open(wfile, 'a') as fwell:
+        fwell.write('461809.59 5932990.36 1503.0 2\n')
+
+    mywell = Well(wfile)
+    assert mywell.dataframe.shape == (4, 5)
+    assert mywell.dataframe.iloc[:3].equals(dfr)
+    assert np.isnan(mywell.dataframe['PERM'][3])
+
+    if PANDAS_INT32:
+        mywell = Well(wfile, discrete_dtype='int32')
+        assert str(mywell.dataframe['ZONE'].dtype) == 'Int32'
+        assert mywell.dataframe['ZONE'].tolist()[1:] == [2, 1, 2]
+
+    mywell = Well(wfile, discrete_dtype='category', lazy=True)
+    assert mywell.dataframe['ZONE'].dtype.name == 'category'
+
+
 def test_import(loadwell1):
     """Import well from file."""
 
@@ -349,6 +402,113 @@ def test_get_zonation_points():
     mywell.get_zonation_points()
 
 
+ZONE_WELL = """1.0
+Unknown
+ZW 1 100.0 200.0 0.0
+1
+ZONE DISC 1 A 2 B 3 C 4 D
+100.0 200.0 1000.0 -999
+100.0 200.0 1001.0 1
+100.0 200.0 1002.0 3
+100.0 200.0 1003.0 4
+100.0 200.0 1004.0 2
+100.0 200.0 1005.0 -999
+"""
+
+
+def test_get_zonation_points_simple(tmp_path):
+    """Zone tops, also for decreasing zonation and transitions from undef."""
+
+    wfile = join(str(tmp_path), "zone_well.w")
+    with open(wfile, "w") as fwell:
+        fwell.write(ZONE_WELL)
+
+    mywell = Well(wfile, zonelogname="ZONE")
+    dfr = mywell.get_zonation_points()
+    assert dfr["Zone"].tolist() == [2, 3, 4, 4, 3]
+    assert dfr["TopName"].tolist() == ["TopB", "TopC", "TopD", "TopD", "TopC"]
+    assert dfr["Z_TVDSS"].tolist() == [1002.0, 1002.0, 1003.0, 1003.0, 1003.0]
+    assert (dfr["WellName"] == "ZW_1").all()
+
+    dfr = mywell.get_zonation_points(use_undef=True)
+    assert dfr["Zone"].tolist() == [1, 2, 3, 4, 4, 3, 2, 1]
+    assert dfr["Z_TVDSS"].tolist()[-2:] == [1004.0, 1004.0]
+
+    dfr = mywell.get_zonation_points(zonelist=(3, 4), tops=False)
+    assert dfr["Zone"].tolist() == [3, 3]
+    assert dfr["ZoneName"].tolist() == ["C", "C"]
+    assert dfr["Z_TVDSS"].tolist() == [1.0, 0.0]
+
+
+ZONE_FACIES_WELL = """1.0
+Unknown
+ZF 1 100.0 200.0 0.0
+2
+ZONE DISC 1 A 2 B 3 C
+FACIES DISC 0 shale 1 sand
+100.0 200.0 1000.0 -999 0
+100.0 200.0 1001.0 1 0
+100.0 200.0 1002.0 1 1
+100.0 200.0 1003.0 1 -999
+100.0 200.0 1004.0 2 1
+100.0 200.0 1005.0 2 1
+100.0 200.0 1006.0 2 0
+100.0 200.0 1007.0 2 1
+100.0 200.0 1008.0 3 0
+100.0 200.0 1009.0 -999 0
+100.0 200.0 1010.0 3 1
+100.0 200.0 1011.0 -999 1
+"""
+
+
+@pytest.mark.parametrize(
+    "discrete_dtype",
+    [
+        pytest.param(
+            "int32", marks=pytest.mark.skipif(not PANDAS_INT32, reason="pandas < 0.24")
+        ),
+        "category",
+    ],
+)
+def test_zone_methods_discrete_dtype(tmp_path, discrete_dtype):
+    """Zone methods give the same as for float64 when DISC logs are int32/category."""
+
+    wfile = join(str(tmp_path), "zone_facies_well.w")
+    with open(wfile, "w") as fwell:
+        fwell.write(ZONE_FACIES_WELL)
+
+    fwell = Well(wfile, zonelogname="ZONE")
+    dwell = Well(wfile, zonelogname="ZONE", discrete_dtype=discrete_dtype)
+    assert dwell.dataframe["ZONE"].dtype != np.float64
+
+    pd.testing.assert_frame_equal(
+        dwell.get_zonation_points(), fwell.get_zonation_points()
+    )
+    pd.testing.assert_frame_equal(
+        dwell.get_zonation_points(tops=False), fwell.get_zonation_points(tops=False)
+    )
+
+    dwell.make_zone_qual_log("ZQ")
+    fwell.make_zone_qual_log("ZQ")
+    assert dwell.dataframe["ZQ"].tolist() == fwell.dataframe["ZQ"].tolist()
+
+    dfrac = dwell.get_fraction_per_zone("FACIES", [1])
+    ffrac = fwell.get_fraction_per_zone("FACIES", [1])
+    assert ffrac is not None
+    pd.testing.assert_frame_equal(dfrac, ffrac)
+
+    pd.testing.assert_frame_equal(
+        dwell.report_zonation_holes(), fwell.report_zonation_holes()
+    )
+    pd.testing.assert_frame_equal(
+        dwell.get_filled_dataframe(), fwell.get_filled_dataframe()
+    )
+
+    dwell.to_file(join(str(tmp_path), "zone_facies_well_out.w"))
+    again = Well(join(str(tmp_path), "zone_facies_well_out.w"))
+    assert again.dataframe["ZONE"].tolist()[1:9] == [1, 1, 1, 2, 2, 2, 2, 3]
+
+
 def test_get_zone_interval():
     """Get zonations points (zone tops)"""
 
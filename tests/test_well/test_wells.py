@@ -3,10 +3,15 @@ from __future__ import division, absolute_import
 from __future__ import print_function
 
 import glob
+import threading
 from os.path import join as ojoin
 
+import numpy as np
+import pandas as pd
 import pytest
 
+import xtgeo
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.well import Well
 from xtgeo.well import Wells
 from xtgeo.common import XTGeoDialog
@@ -38,6 +43,45 @@ def loadwells1():
     return wlist
 
 
+def _straight_well(name, xy0, xy1, npoints=11):
+    """Make a synthetic well trajectory from xy0 to xy1, Z from 1000 to 1100."""
+    well = Well()
+    well.dataframe = pd.DataFrame(
+        {
+            "X_UTME": np.linspace(xy0[0], xy1[0], npoints),
+            "Y_UTMN": np.linspace(xy0[1], xy1[1], npoints),
+            "Z_TVDSS": np.linspace(1000.0, 1100.0, npoints),
+        }
+    )
+    well.name = name
+    well._xpos, well._ypos, well._rkb = xy0[0], xy0[1], 0.0
+    return well
+
+
+@pytest.fixture()
+def synthetic_wells():
+    """Straight wells A and B crossing in the area (0, 0) - (100, 100), C outside"""
+    mywells = Wells()
+    mywells.wells = [
+        _straight_well("A", (0.0, 0.0), (100.0, 100.0)),
+        _straight_well("B", (0.0, 100.0), (100.0, 0.0)),
+        _straight_well("C", (500.0, 500.0), (600.0, 600.0)),
+    ]
+    return mywells
+
+
+def _box_grid(rotation=30.0):
+    """A 10 x 10 x 5 box grid covering the area (0, 0) - (100, 100) if not rotated"""
+    grd = xtgeo.Grid()
+    grd.create_box(
+        dimension=(10, 10, 5),
+        origin=(0.0, 0.0, 990.0),
+        increment=(10.0, 10.0, 20.0),
+        rotation=rotation,
+    )
+    return grd
+
+
 def test_import_wells(loadwells1):
     """Import wells from file to Wells."""
 
@@ -75,6 +119,62 @@ def test_quickplot_wells(loadwells1):
     mywells.quickplot(filename=ojoin(td, 'quickwells.png'))
 
 
+def test_import_wells_lazy_workers(tmp_path):
+    """Import wells with worker threads and lazy, vs plain import"""
+
+    wfiles = []
+    for num in range(5):
+        well = _straight_well("W{}".format(num), (num, 0.0), (num, 100.0))
+        well.create_log("ZONE", logtype="DISC", logrecord={1: "A"}, value=1)
+        if num == 2:
+            well.delete_log("ZONE")
+        wfile = ojoin(str(tmp_path), "lazywell{}.w".format(num))
+        well.to_file(wfile)
+        wfiles.append(wfile)
+
+    mywells = Wells(wfiles, zonelogname="ZONE")
+    assert mywells.names == ["W0", "W1", "W3", "W4"]
+
+    mywells2 = Wells(wfiles, zonelogname="ZONE", workers=3)
+    assert mywells2.names == mywells.names
+    assert mywells2.get_dataframe().equals(mywells.get_dataframe())
+
+    mywells3 = Wells(wfiles, zonelogname="ZONE", lazy=True, workers=3)
+    assert mywells3.names == mywells.names
+    well = mywells3.get_well("W3")
+    assert well._wdf is None
+    assert well.lognames == ["ZONE"]
+    assert well.get_logrecord("ZONE") == {1: "A"}
+
+    assert mywells3.get_dataframe().equals(mywells.get_dataframe())
+    assert well._wdf is not None
+
+
+def test_import_rms_ascii_releases_gil():
+    """The C table parser lets other Python threads run, so workers overlap."""
+
+    buf = b"461809.59 5932990.36 1500.0 2 0.25\n" * 400000
+    values = np.empty((buf.count(b"\n") + 1, 5), dtype=np.float64)
+
+    started = threading.Event()
+    parsed = []
+
+    def _parse():
+        started.set()
+        parsed.append(_cxtgeo.well_import_rms_ascii(buf, 5, values))
+
+    thread = threading.Thread(target=_parse)
+    thread.start()
+    assert started.wait(timeout=60)
+
+    # if the parser held the GIL, this thread could only get here after the parse
+    during_parse = not parsed
+
+    thread.join(timeout=60)
+    assert parsed == [400000]
+    assert during_parse
+
+
 def test_wellintersections(loadwells1):
     """Find well crossing"""
 
@@ -87,6 +187,242 @@ def test_wellintersections(loadwells1):
     dfr.to_csv(ojoin(td, 'wells_crossings.csv'))
 
 
+def test_wellintersections_synthetic(synthetic_wells):
+    """Find well crossings in synthetic wells, also with a process pool"""
+
+    mywells = synthetic_wells
+    mywells.wells.append(_straight_well("D", (20.0, 0.0), (20.0, 100.0)))
+
+    dfr = mywells.wellintersections()
+    logger.info(dfr)
+
+    assert list(dfr["WELL"]) == ["A", "A", "B", "B", "D", "D"]
+    assert list(dfr["CWELL"]) == ["B", "D", "A", "D", "A", "B"]
+
+    first = dfr.iloc[0]
+    assert first["X_UTME"] == pytest.approx(50.0)
+    assert first["Y_UTMN"] == pytest.approx(50.0)
+    assert first["Z_TVDSS"] == pytest.approx(1050.0)
+    assert first["MDEPTH"] == pytest.approx(50.0 * np.sqrt(3.0))
+
+    dfr2 = mywells.wellintersections(workers=2)
+    assert dfr.equals(dfr2)
+
+
+def test_surface_picks_synthetic(synthetic_wells):
+    """Picks for many wells and surfaces, same as picks per well and surface"""
+
+    mywells = synthetic_wells
+
+    surfs = []
+    for zlevel in (1025.0, 1075.0, 2000.0):
+        surf = xtgeo.RegularSurface(
+            ncol=12, nrow=12, xinc=10.0, yinc=10.0, xori=-5.0, yori=-5.0, values=zlevel
+        )
+        surf.name = "Z{:.0f}".format(zlevel)
+        surfs.append(surf)
+
+    dfr = mywells.get_surface_picks(xtgeo.Surfaces(surfs)).dataframe
+    logger.info(dfr)
+
+    assert list(dfr["WELLNAME"]) == ["A", "A", "B", "B"]
+    assert list(dfr["SURFACE"]) == ["Z1025", "Z1075", "Z1025", "Z1075"]
+    assert list(dfr["DIRECTION"]) == [1, 1, 1, 1]
+    assert dfr["Z_TVDSS"].tolist() == pytest.approx([1025.0, 1075.0] * 2)
+
+    for well in mywells.wells[:2]:
+        for surf in surfs[:2]:
+            single = well.get_surface_picks(surf).dataframe
+            batch = dfr[(dfr["WELLNAME"] == well.name) & (dfr["SURFACE"] == surf.name)]
+            assert np.array_equal(single["X_UTME"], batch["X_UTME"])
+            assert np.array_equal(single["Y_UTMN"], batch["Y_UTMN"])
+
+    assert mywells.get_surface_picks(surfs[2:]) is None
+
+
+def test_gridproperty_values_synthetic(synthetic_wells):
+    """Sample many realisations in wells, with a cached well cell index"""
+
+    mywells = synthetic_wells
+    grd = _box_grid()
+    rng = np.random.RandomState(9)
+    poros = [
+        xtgeo.GridProperty(grd, name="PORO", values=rng.uniform(size=grd.dimensions))
+        for _ in range(5)
+    ]
+
+    # a masked (undefined) value in a cell passed by well A
+    poros[0].values[0, 0, 0] = np.ma.masked
+
+    dfr = mywells.get_gridproperty_values(poros, grd)
+    assert list(dfr.columns[4:]) == ["PORO_{}".format(inum) for inum in range(5)]
+    assert len(dfr) == 33
+    assert "wellcells" in grd._tmp
+
+    # outside grid
+    assert dfr[dfr["WELLNAME"] == "C"]["PORO_0"].isnull().all()
+
+    # masked values are NaN, as in the logs from get_gridproperties()
+    mywells.get_gridproperties(poros[0], grd, prop_id="_masked")
+    well = mywells.wells[0]
+    assert np.isnan(well.dataframe["PORO_masked"].values[0])
+    assert np.array_equal(
+        dfr[dfr["WELLNAME"] == "A"]["PORO_0"].values,
+        well.dataframe["PORO_masked"].values,
+        equal_nan=True,
+    )
+
+    mywells.get_gridproperties(poros[3], grd)
+    well = mywells.wells[1]
+    assert np.array_equal(
+        dfr[dfr["WELLNAME"] == "B"]["PORO_3"].values,
+        well.dataframe["PORO_model"].values,
+        equal_nan=True,
+    )
+    well.make_ijk_from_grid(grd, algorithm=2)
+    inside = well.dataframe.dropna()
+    assert len(inside) > 5
+    assert np.array_equal(
+        inside["PORO_model"].values,
+        [
+            poros[3].values[int(i) - 1, int(j) - 1, int(k) - 1]
+            for i, j, k in inside[["ICELL", "JCELL", "KCELL"]].values
+        ],
+    )
+
+
+def test_gridproperty_values_cachesize(monkeypatch, synthetic_wells):
+    """The cache of well cells on the grid is bounded, most recently used kept"""
+    from xtgeo.well import _well_oper
+
+    monkeypatch.setattr(_well_oper, "WELLCELLS_CACHESIZE", 2)
+
+    mywells = synthetic_wells
+    grd = _box_grid()
+    poro = xtgeo.GridProperty(grd, name="PORO", values=0.2)
+
+    dfr1 = mywells.get_gridproperty_values([poro], grd)
+    assert list(grd._tmp["wellcells"].keys()) == [
+        _well_oper._trajectory_key(well) for well in mywells.wells[1:]
+    ]
+
+    dfr2 = mywells.get_gridproperty_values([poro], grd)
+    assert len(grd._tmp["wellcells"]) == 2
+    assert dfr1.equals(dfr2)
+
+
+def _grd3d_well_ijk(well, grid):
+    """I J K (float, NaN if not in grid) from the single well C routine."""
+
+    # grd3d_well_ijk may make ZCORN consistent in Z, hence use a copy of the grid
+    grid = grid.copy()
+    grid.build_search_index()
+    onelayergrid = grid._tmp["onegrid"]
+
+    nlen = well.nrow
+    wxarr, wyarr, wzarr = (
+        well.get_carray(name) for name in ("X_UTME", "Y_UTMN", "Z_TVDSS")
+    )
+    wivec, wjvec, wkvec = (_cxtgeo.new_intarray(nlen) for _ in range(3))
+
+    cstatus = _cxtgeo.grd3d_well_ijk(
+        grid.ncol,
+        grid.nrow,
+        grid.nlay,
+        grid._coordsv,
+        grid._zcornsv,
+        grid._actnumsv,
+        onelayergrid._zcornsv,
+        onelayergrid._actnumsv,
+        nlen,
+        wxarr,
+        wyarr,
+        wzarr,
+        wivec,
+        wjvec,
+        wkvec,
+        0,
+    )
+    assert cstatus == 0
+
+    ijk = []
+    for wvec in (wivec, wjvec, wkvec):
+        warr = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wvec).astype("float")
+        warr[warr == 0] = np.nan
+        ijk.append(warr)
+        _cxtgeo.delete_intarray(wvec)
+    for warr in (wxarr, wyarr, wzarr):
+        _cxtgeo.delete_doublearray(warr)
+    return ijk
+
+
+def test_make_ijk_from_grid_synthetic(synthetic_wells):
+    """Block wells in one go, or one well, same as well by well in grd3d_well_ijk"""
+
+    grd = _box_grid(rotation=0.0)
+
+    # many points are on cell faces (coincident for neighbour cells)
+    mywells = synthetic_wells
+    mywells.wells.append(_straight_well("D", (50.0, 0.0), (50.0, 100.0), npoints=41))
+    try:
+        xtgeo.set_nthreads(4)
+        mywells.make_ijk_from_grid(grd, grid_id="_threads", algorithm=1)
+    finally:
+        xtgeo.set_nthreads(1)
+    mywells.make_ijk_from_grid(grd, algorithm=1)
+
+    for well in mywells.wells:
+        single = well.copy()
+        single.make_ijk_from_grid(grd, grid_id="_single", algorithm=1)
+        legacy = _grd3d_well_ijk(well, grd)
+        for num, cell in enumerate(("ICELL", "JCELL", "KCELL")):
+            for values in (
+                well.dataframe[cell].values,
+                well.dataframe[cell + "_threads"].values,
+                single.dataframe[cell + "_single"].values,
+            ):
+                assert np.array_equal(legacy[num], values, equal_nan=True)
+
+    dfr = mywells.wells[0].dataframe
+    assert dfr["ICELL"].tolist()[:10] == [1, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert dfr["KCELL"].tolist()[:10] == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    assert mywells.wells[2].dataframe["ICELL"].isnull().all()
+    assert set(mywells.wells[3].dataframe["ICELL"].dropna()) == {5, 6}
+
+
+def test_make_ijk_from_grid_keeps_zcorn(synthetic_wells):
+    """Blocking many wells shall not change the grid, also if not consistent in Z"""
+
+    mywells = synthetic_wells
+    grd = _box_grid(rotation=0.0)
+    # let layer 3 have zero thickness; it will be made consistent in Z
+    nzlayer = 10 * 10 * 4
+    grd._zcornsv[3 * nzlayer : 4 * nzlayer] = grd._zcornsv[2 * nzlayer : 3 * nzlayer]
+    zcorn = grd._zcornsv.copy()
+
+    grd.build_search_index()
+    onegrid_zcorn = grd._tmp["onegrid"]._zcornsv.copy()
+
+    mywells.make_ijk_from_grid(grd, algorithm=1)
+    np.testing.assert_array_equal(grd._zcornsv, zcorn)
+
+    # also for a single well, and the cached search index is not changed
+    mywells.wells[0].make_ijk_from_grid(grd, grid_id="_single", algorithm=1)
+    np.testing.assert_array_equal(grd._zcornsv, zcorn)
+    np.testing.assert_array_equal(grd._tmp["onegrid"]._zcornsv, onegrid_zcorn)
+
+    # same result for a grid with compact (float32) ZCORN
+    grd.compact = True
+    mywells.make_ijk_from_grid(grd, grid_id="_compact", algorithm=1)
+    for well in mywells.wells:
+        for cell in ("ICELL", "JCELL", "KCELL"):
+            assert np.array_equal(
+                well.dataframe[cell].values,
+                well.dataframe[cell + "_compact"].values,
+                equal_nan=True,
+            )
+
+
 def test_wellintersections_tvdrange_nowfilter(loadwells1):
     """Find well crossing using coarser sampling to Fence"""
 
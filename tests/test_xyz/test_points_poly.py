@@ -2,6 +2,8 @@
 import os
 from os.path import join
 import numpy as np
+import pandas as pd
+import pytest
 from xtgeo.xyz import XYZ
 from xtgeo.xyz import Points
 from xtgeo.xyz import Polygons
@@ -309,3 +311,34 @@ def test_fence_from_polygon():
     logger.info(fence.dataframe)
 
     tsetup.assert_almostequal(fence.dataframe.at[13, "X_UTME"], -202.3, 0.01)
+
+
+def test_fences_from_polygons():
+    """Test polygons get_fences, for many polylines in one go"""
+
+    pol = Polygons()
+    pol.dataframe = pd.DataFrame(
+        {
+            "X_UTME": [0.0, 100.0, 100.0, 50.0, 50.0, 60.0, 500.0],
+            "Y_UTMN": [20.0, 20.0, 100.0, 0.0, 300.0, 300.0, 0.0],
+            "Z_TVDSS": [0.0, 1000.0, 2000.0, 10.0, 20.0, 30.0, 40.0],
+            "POLY_ID": [1, 1, 1, 2, 2, 2, 3],
+        }
+    )
+
+    fence = pol.get_fence(
+        distance=100, nextend=4, name="SOMENAME", asnumpy=False, atleast=10
+    )
+    assert fence.name == "SOMENAME"
+    tsetup.assert_almostequal(fence.dataframe.at[13, "X_UTME"], -202.3, 0.01)
+    assert fence.dataframe["H_CUMLEN"].is_monotonic_increasing
+
+    fences = pol.get_fences(distance=20, nextend=3)
+    assert list(fences.keys()) == [1, 2, 3]
+    assert fences[3] is None
+    for polyid in (1, 2):
+        single = pol.get_fence(distance=20, nextend=3, polyid=polyid)
+        assert np.array_equal(fences[polyid], single)
+        assert np.median(single[:, 4]) == pytest.approx(single[0, 4])
+
+    assert pol.get_fence(polyid=3) is False